@@ -10,6 +10,7 @@ Modules:
 - personality: AI personality system with mood states and memory
 - effects: Special weather effects (aurora, rainbows, etc.)
 - creatures: Easter egg creature system
+- rng: Seeded per-subsystem random streams
 
 Usage:
 ------
@@ -37,6 +38,7 @@ from engine.personality.core import (
 from engine.rendering.core import (
     RenderEngine, RenderStats, FrameBudget, RenderQueue, RenderCommand, RenderLayer
 )
+from engine.rng import RandomStream, RandomStreams, STREAMS, stream, reseed
 
 __all__ = [
     # Physics - Noise
@@ -77,4 +79,11 @@ __all__ = [
     'RenderQueue',
     'RenderCommand',
     'RenderLayer',
+    
+    # Random streams
+    'RandomStream',
+    'RandomStreams',
+    'STREAMS',
+    'stream',
+    'reseed',
 ]
@@ -8,6 +8,7 @@ Exports:
 - Creature: Dataclass for creature definition
 - CreatureCategory: Enum for weather/time categories
 - CREATURES: Dict of all creature definitions
+- SpriteAtlas: Precomputed creature frames, masks and spawn tables
 - EasterEggManager: Backwards-compatible alias for CreatureManager
 - EASTER_EGG_CREATURES: Backwards-compatible alias for CREATURES
 """
@@ -17,16 +18,22 @@ from .core import (
     Creature,
     CreatureCategory,
     CREATURES,
+    Sprite,
+    ATLAS,
     # Backwards compatibility
     EasterEggManager,
     EASTER_EGG_CREATURES,
 )
+from .atlas import SpriteAtlas
 
 __all__ = [
     "CreatureManager",
     "Creature", 
     "CreatureCategory",
     "CREATURES",
+    "Sprite",
+    "SpriteAtlas",
+    "ATLAS",
     "EasterEggManager",
     "EASTER_EGG_CREATURES",
 ]
@@ -0,0 +1,79 @@
+"""
+Creature Sprite Atlas
+=====================
+Every creature frame precomputed into arrays, built once at import.
+
+For each creature the atlas holds its frames as a (frames, height,
+width) glyph array padded to the widest line, a matching mask of
+opaque cells (spaces are transparent, so rain shows through a ghost),
+and its width and height. Drawing a sprite is then one array slice to
+clip it to the pane and one batched write of the opaque cells.
+
+Spawning uses a cumulative rarity table per category: one random draw
+and a binary search instead of one random() per creature.
+"""
+from __future__ import annotations
+from typing import Any, Dict, List, Mapping, Optional
+
+import numpy as np
+
+
+class SpriteAtlas:
+    """Precomputed frames, masks and spawn tables for a creature catalogue."""
+
+    def __init__(self, catalogue: Mapping[str, List[Dict[str, Any]]]):
+        self.creatures: List[Dict[str, Any]] = []
+        self.glyphs: List[np.ndarray] = []  # per creature: (frames, height, width) codepoints
+        self.masks: List[np.ndarray] = []   # per creature: (frames, height, width) opaque cells
+        self._tables: Dict[str, tuple] = {}
+
+        for key, creatures in catalogue.items():
+            indices = []
+            for creature in creatures:
+                indices.append(len(self.creatures))
+                self.creatures.append(creature)
+                glyphs = self._rasterize(creature["frames"])
+                self.glyphs.append(glyphs)
+                self.masks.append(glyphs != ord(" "))
+            self._tables[key] = self._spawn_table(indices)
+
+        self.heights = np.array([g.shape[1] for g in self.glyphs], dtype=np.int32)
+        self.widths = np.array([g.shape[2] for g in self.glyphs], dtype=np.int32)
+        self.speeds = np.array([c["speed"] for c in self.creatures], dtype=np.float64)
+        # Opaque cells of the first frame: what the idle scheduler counts as moving
+        self.areas = np.array([int(m[0].sum()) for m in self.masks], dtype=np.int32)
+
+    @staticmethod
+    def _rasterize(frames: List[List[str]]) -> np.ndarray:
+        height = max(len(frame) for frame in frames)
+        width = max(len(line) for frame in frames for line in frame)
+        glyphs = np.full((len(frames), height, width), ord(" "), dtype=np.int32)
+        for f, frame in enumerate(frames):
+            for y, line in enumerate(frame):
+                glyphs[f, y, :len(line)] = [ord(c) for c in line]
+        return glyphs
+
+    def _spawn_table(self, indices: List[int]) -> tuple:
+        """
+        Cumulative spawn probabilities for one category.
+
+        Creatures used to get an independent rarity roll each, in order,
+        first success winning; creature i therefore spawned with
+        probability rarity_i * prod(1 - rarity_j for j < i). The table
+        keeps exactly those odds.
+        """
+        rarity = np.array([self.creatures[i]["rarity"] for i in indices], dtype=np.float64)
+        survive = np.concatenate(([1.0], np.cumprod(1.0 - rarity)[:-1]))
+        return np.array(indices, dtype=np.intp), np.cumsum(rarity * survive)
+
+    def pick(self, key: str, u: float) -> Optional[int]:
+        """Creature index for a uniform draw u in [0, 1), or None for no spawn."""
+        table = self._tables.get(key)
+        if table is None:
+            return None
+        indices, cumulative = table
+        slot = int(np.searchsorted(cumulative, u, side="right"))
+        return int(indices[slot]) if slot < indices.size else None
+
+    def frame_count(self, index: int) -> int:
+        return self.glyphs[index].shape[0]
@@ -14,14 +14,22 @@ Each creature has:
 - Color theme
 - Spawn rarity
 
-Design: Factory pattern for creature spawning, state machine for animation
+Design: Factory pattern for creature spawning, state machine for animation,
+frames precomputed into a SpriteAtlas (see atlas.py)
 """
 from __future__ import annotations
-import random
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum, auto
 
+import numpy as np
+
+from engine.creatures.atlas import SpriteAtlas
+from engine.rendering.framebuffer import blit_cells
+from engine.rng import stream
+
+_rng = stream('creatures')
+
 
 class CreatureCategory(Enum):
     """Weather/time categories for creature spawning."""
@@ -374,10 +382,29 @@ CREATURES: Dict[str, List[Dict[str, Any]]] = {
 }
 
 
+# Built once: every creature frame as arrays, plus the spawn tables
+ATLAS = SpriteAtlas(CREATURES)
+
+
+@dataclass
+class Sprite:
+    """One creature on screen."""
+    index: int           # Into the atlas
+    x: float
+    y: int
+    frame: int = 0
+    timer: int = 0
+
+
 class CreatureManager:
     """
     Manages creature spawning, animation, and rendering.
     
+    Several creatures can be about at once (up to max_active). Frames
+    come from the shared SpriteAtlas, so drawing clips each sprite to
+    the animation area with an array slice and writes only its opaque
+    cells in one batch.
+    
     Usage:
         manager = CreatureManager(x=10, width=80, height=40)
         manager.try_spawn(condition="clear", hour=22)
@@ -385,7 +412,8 @@ class CreatureManager:
         manager.draw(screen, colour_map={'MAGIC': 5, 'SNOW': 7, ...})
     """
     
-    def __init__(self, animation_x: int, animation_width: int, height: int):
+    def __init__(self, animation_x: int, animation_width: int, height: int,
+                 max_active: int = 3):
         """
         Initialize the creature manager.
         
@@ -393,16 +421,14 @@ class CreatureManager:
             animation_x: Left edge of animation area
             animation_width: Width of animation area
             height: Height of animation area
+            max_active: Most creatures on screen at once
         """
         self.ax = animation_x
         self.aw = animation_width
         self.height = height
-        self.active_creature: Optional[Dict] = None
-        self.creature_x: float = 0
-        self.creature_y: int = 0
-        self.creature_frame: int = 0
-        self.frame_timer: int = 0
-        self._y_set: bool = False
+        self.max_active = max_active
+        self.atlas = ATLAS
+        self.sprites: List[Sprite] = []
     
     def get_creature_key(self, condition: str, hour: int) -> Optional[str]:
         """
@@ -435,105 +461,165 @@ class CreatureManager:
             return "cloudy_any"
         return None
     
-    def try_spawn(self, condition: str, hour: int) -> bool:
+    def try_spawn(self, condition: str, hour: int, rolls: int = 1) -> bool:
         """
         Attempt to spawn a creature based on weather and time.
         
+        One uniform draw against the category's cumulative rarity table.
+        
         Args:
             condition: Weather condition
             hour: Current hour
+            rolls: Per-frame spawn chances folded into this one draw (for
+                callers that roll every few frames); the odds scale by
+                rolls, the mix of creatures stays the same
             
         Returns:
             True if a creature was spawned
         """
-        if self.active_creature:
-            return False  # Already have one
+        if len(self.sprites) >= self.max_active:
+            return False
         
         key = self.get_creature_key(condition, hour)
-        if not key or key not in CREATURES:
+        if not key:
+            return False
+        index = self.atlas.pick(key, _rng.random() / max(1, rolls))
+        if index is None:
             return False
         
-        creatures = CREATURES[key]
-        for creature in creatures:
-            if random.random() < creature["rarity"]:
-                self.active_creature = creature
-                self.creature_x = self.ax + 2
-                self.creature_frame = 0
-                self.frame_timer = 0
-                self._y_set = False
-                return True
-        return False
+        # Random height within bounds, fixed for the creature's crossing,
+        # on rows clear of any sprite still in the way at the left edge
+        x = self.ax + 2
+        h = int(self.atlas.heights[index])
+        rows = self._free_rows(x + int(self.atlas.widths[index]), 6, max(6, self.height - h - 4), h)
+        if not rows:
+            return False
+        self.sprites.append(Sprite(index, x=x, y=_rng.choice(rows)))
+        return True
+    
+    def _free_rows(self, right: int, min_y: int, max_y: int, height: int) -> List[int]:
+        """
+        Top rows in [min_y, max_y] where a sprite of the given height
+        entering left of column right overlaps no sprite still there
+        (two creatures entering together would cross as one).
+        """
+        rows = list(range(min_y, max_y + 1))
+        for sprite in self.sprites:
+            if sprite.x >= right:
+                continue
+            top, bottom = sprite.y, sprite.y + int(self.atlas.heights[sprite.index])
+            rows = [y for y in rows if y + height <= top or y >= bottom]
+        return rows
     
     def update(self) -> None:
-        """Update creature position and animation."""
-        if not self.active_creature:
+        """Update creature positions and animation."""
+        if not self.sprites:
             return
         
-        # Move creature
-        self.creature_x += self.active_creature["speed"]
-        
-        # Animate frames
-        self.frame_timer += 1
-        if self.frame_timer > 8:
-            self.frame_timer = 0
-            self.creature_frame = (self.creature_frame + 1) % len(self.active_creature["frames"])
+        for sprite in self.sprites:
+            # Move creature
+            sprite.x += float(self.atlas.speeds[sprite.index])
+            
+            # Animate frames
+            sprite.timer += 1
+            if sprite.timer > 8:
+                sprite.timer = 0
+                sprite.frame = (sprite.frame + 1) % self.atlas.frame_count(sprite.index)
         
         # Remove if off screen
-        if self.creature_x > self.ax + self.aw - 5:
-            self.active_creature = None
-            self._y_set = False
+        edge = self.ax + self.aw - 5
+        self.sprites = [s for s in self.sprites if s.x <= edge]
+    
+    def resize(self, animation_x: int, animation_width: int, height: int) -> None:
+        """Adopt a new animation area, keeping creatures at the same relative spot."""
+        scale = animation_width / max(1, self.aw)
+        for sprite in self.sprites:
+            sprite.x = animation_x + (sprite.x - self.ax) * scale
+            max_y = height - int(self.atlas.heights[sprite.index]) - 4
+            sprite.y = max(6, min(sprite.y, max_y))
+        self.ax, self.aw, self.height = animation_x, animation_width, height
     
     def draw(self, screen, colour_map: Dict[str, int], lightning_active: bool = False) -> None:
         """
-        Draw the creature if active.
+        Draw the active creatures.
         
         Args:
-            screen: asciimatics Screen object
+            screen: asciimatics Screen object (or CellBuffer)
             colour_map: Dict mapping colour names to colour values
             lightning_active: If True, use lightning colour override
         """
-        if not self.active_creature:
-            return
-        
-        frames = self.active_creature["frames"]
-        frame = frames[self.creature_frame % len(frames)]
-        
-        # Get colour
-        colour_name = self.active_creature["colour"]
-        colour = colour_map.get(colour_name, colour_map.get("SNOW", 7))
-        if lightning_active:
-            colour = colour_map.get("SUN", 3)
-        
-        # Set Y position once (random within bounds)
-        x = int(self.creature_x)
-        if not self._y_set:
-            max_y = self.height - len(frame) - 4
-            min_y = 6
-            if max_y > min_y:
-                self.creature_y = random.randint(min_y, max_y)
-            else:
-                self.creature_y = min_y
-            self._y_set = True
+        for sprite in self.sprites:
+            clip = self._clip(sprite)
+            if clip is None:
+                continue
+            x, y, rows, cols, frame = clip
+            creature = self.atlas.creatures[sprite.index]
+            colour = colour_map.get(creature["colour"], colour_map.get("SNOW", 7))
+            if lightning_active:
+                colour = colour_map.get("SUN", 3)
+            
+            glyphs = self.atlas.glyphs[sprite.index][frame, rows, cols]
+            ys, xs = np.nonzero(self.atlas.masks[sprite.index][frame, rows, cols])
+            blit_cells(screen, xs + x, ys + y, glyphs[ys, xs], colour)
+    
+    def stamp(self, occupancy) -> None:
+        """Mark the visible opaque cells of every sprite in an OccupancyMask."""
+        for sprite in self.sprites:
+            clip = self._clip(sprite)
+            if clip is not None:
+                x, y, rows, cols, frame = clip
+                occupancy.add_sprite(x, y, self.atlas.masks[sprite.index][frame, rows, cols])
+    
+    def _clip(self, sprite: Sprite):
+        """
+        Clip a sprite to the drawable area (inside the pane border, clear
+        of the header and ground) with one slice per axis.
         
-        # Draw creature
-        for i, line in enumerate(frame):
-            try:
-                px = x
-                py = self.creature_y + i
-                if self.ax + 1 <= px < self.ax + self.aw - len(line) and 3 <= py < self.height - 3:
-                    screen.print_at(line, px, py, colour=colour)
-            except Exception:
-                pass
+        Returns (x, y, row_slice, col_slice, frame) for the visible part,
+        or None if none of it is visible.
+        """
+        left, right = self.ax + 1, self.ax + self.aw - 1
+        top, bottom = 3, self.height - 3
+        x0, y0 = int(sprite.x), sprite.y
+        h = int(self.atlas.heights[sprite.index])
+        w = int(self.atlas.widths[sprite.index])
+        c0, c1 = max(0, left - x0), min(w, right - x0)
+        r0, r1 = max(0, top - y0), min(h, bottom - y0)
+        if c0 >= c1 or r0 >= r1:
+            return None
+        frame = sprite.frame % self.atlas.frame_count(sprite.index)
+        return x0 + c0, y0 + r0, slice(r0, r1), slice(c0, c1), frame
+    
+    def moving_cells(self) -> float:
+        """Opaque sprite cells weighted by speed (cells changed per frame, roughly)."""
+        return float(sum(self.atlas.areas[s.index] * min(1.0, abs(self.atlas.speeds[s.index]))
+                         for s in self.sprites))
     
     @property
     def is_active(self) -> bool:
-        """Check if a creature is currently active."""
-        return self.active_creature is not None
+        """Check if any creature is currently active."""
+        return bool(self.sprites)
+    
+    @property
+    def active_creature(self) -> Optional[Dict]:
+        """Definition of the most recently spawned active creature."""
+        return self.atlas.creatures[self.sprites[-1].index] if self.sprites else None
     
     @property
     def current_creature_name(self) -> Optional[str]:
-        """Get the name of the currently active creature."""
-        return self.active_creature["name"] if self.active_creature else None
+        """Get the name of the most recently spawned active creature."""
+        creature = self.active_creature
+        return creature["name"] if creature else None
+    
+    @property
+    def creature_x(self) -> float:
+        """x of the most recently spawned active creature."""
+        return self.sprites[-1].x if self.sprites else 0.0
+    
+    @creature_x.setter
+    def creature_x(self, x: float):
+        if self.sprites:
+            self.sprites[-1].x = x
 
 
 # Backwards compatibility alias
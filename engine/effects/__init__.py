@@ -10,6 +10,10 @@ from .special_effects import (
     HeatLightning,
     SpecialEffectsManager,
 )
+from .lightning import BoltPool, dbm_bolt, fractal_bolt, rasterize_segments
+from .pool import ParticlePool, TrailBuffer
+from .raster import Raster, RasterCache, RASTER_CACHE
+from .sheet import RainSheet
 
 __all__ = [
     'AuroraBorealis',
@@ -21,4 +25,14 @@ __all__ = [
     'SunRays',
     'HeatLightning',
     'SpecialEffectsManager',
+    'BoltPool',
+    'dbm_bolt',
+    'fractal_bolt',
+    'rasterize_segments',
+    'ParticlePool',
+    'TrailBuffer',
+    'Raster',
+    'RasterCache',
+    'RASTER_CACHE',
+    'RainSheet',
 ]
@@ -0,0 +1,271 @@
+"""
+Lightning Bolt Generation
+=========================
+Bolt shapes as rasters, generated ahead of time.
+
+A strike is the heaviest frame the dashboard draws (the screen flash
+recolours nearly everything), so the bolt itself should cost nothing
+on that frame. Shapes are generated once as a Raster of cells relative
+to the strike origin, and a BoltPool keeps a few ready, refilling in a
+background thread between strikes. Spawning a strike takes one from
+the pool.
+
+Two generators: fractal_bolt, a cheap branching random walk, and
+dbm_bolt, a dielectric breakdown model that grows the channel through
+a Laplace potential field. The DBM is far more expensive, which is
+what the pool is for; run this module to benchmark both.
+
+"Lightning doesn't improvise. It's been planning that route for
+the last quarter second." - Stormy
+"""
+from __future__ import annotations
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from engine.effects.raster import Raster
+from engine.rng import RandomStream, stream
+
+_rng = stream('lightning')
+
+
+def rasterize_segments(segments: Iterable[Tuple[int, int, int, int]]) -> Raster:
+    """Bresenham every (x1, y1, x2, y2) segment into one Raster of unique cells."""
+    xs: List[int] = []
+    ys: List[int] = []
+    for x1, y1, x2, y2 in segments:
+        dx, dy = abs(x2 - x1), abs(y2 - y1)
+        sx, sy = (1 if x1 < x2 else -1), (1 if y1 < y2 else -1)
+        err = dx - dy
+        while True:
+            xs.append(x1)
+            ys.append(y1)
+            if x1 == x2 and y1 == y2:
+                break
+            e2 = 2 * err
+            if e2 > -dy:
+                err -= dy
+                x1 += sx
+            if e2 < dx:
+                err += dx
+                y1 += sy
+    if not xs:
+        return Raster(np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.int32))
+    cells = np.unique(np.array([ys, xs], dtype=np.int32).T, axis=0)
+    return Raster(cells[:, 1].copy(), cells[:, 0].copy())
+
+
+def fractal_bolt(depth: int, rng: RandomStream = _rng) -> Raster:
+    """
+    Branching random-walk bolt from (0, 0) down to about depth rows.
+
+    x is relative to the strike column and may go negative; the caller
+    places it and clips to the pane.
+    """
+    segments: List[Tuple[int, int, int, int]] = []
+
+    def branch(x: int, y: int, length: int):
+        direction = rng.choice([-1, 1])
+        for _ in range(length):
+            nx = x + rng.randint(1, 3) * direction
+            ny = y + rng.randint(1, 3)
+            segments.append((x, y, nx, ny))
+            x, y = nx, ny
+            if rng.random() < 0.15:
+                break
+
+    def trunk(x: int, y: int, level: int):
+        while y < depth:
+            nx = x + rng.randint(-3, 3)
+            ny = y + rng.randint(2, 5)
+            segments.append((x, y, nx, ny))
+            # Branching with decreasing probability at depth
+            if level < 2 and rng.random() < (0.3 - level * 0.1):
+                branch(nx, ny, rng.randint(3, 6))
+            x, y = nx, ny
+
+    trunk(0, 0, 0)
+    return rasterize_segments(segments)
+
+
+def _dilate(mask: np.ndarray) -> np.ndarray:
+    """8-neighbourhood dilation of a bool grid."""
+    out = mask.copy()
+    out[1:] |= mask[:-1]
+    out[:-1] |= mask[1:]
+    grown = out.copy()
+    out[:, 1:] |= grown[:, :-1]
+    out[:, :-1] |= grown[:, 1:]
+    return out
+
+
+def dbm_bolt(width: int, depth: int, eta: float = 2.5, cell: Tuple[int, int] = (3, 2),
+             sweeps: int = 12, rng: Optional[np.random.Generator] = None) -> Raster:
+    """
+    Dielectric breakdown model bolt from (0, 0) down to about depth rows.
+
+    The channel grows on a coarse grid of cell = (columns, rows) terminal
+    cells spanning width columns centred on the strike. Each step relaxes
+    the Laplace potential (channel held at 0, ground row at 1, insulated
+    sides) with a few warm-started Jacobi sweeps, then adds one frontier
+    cell with probability proportional to potential ** eta. Higher eta
+    gives straighter, less branchy bolts. Growth stops at the ground.
+    """
+    rng = _rng.generator if rng is None else rng
+    cx, cy = cell
+    gw = max(3, width // cx) | 1
+    gh = max(2, depth // cy + 1)
+    mid = gw // 2
+
+    # Warm start from the field with no channel: linear from cloud to ground
+    phi = np.repeat(np.linspace(0.0, 1.0, gh)[:, None], gw, axis=1)
+    pad = np.empty((gh + 2, gw + 2))
+    channel = np.zeros((gh, gw), dtype=bool)
+    channel[0, mid] = True
+    parent = np.full(gh * gw, -1, dtype=np.intp)
+    grown = [mid]
+
+    while True:
+        for _ in range(sweeps):
+            pad[1:-1, 1:-1] = phi
+            pad[0], pad[-1] = pad[1], pad[-2]
+            pad[:, 0], pad[:, -1] = pad[:, 1], pad[:, -2]
+            phi = 0.25 * (pad[:-2, 1:-1] + pad[2:, 1:-1] + pad[1:-1, :-2] + pad[1:-1, 2:])
+            phi[channel] = 0.0
+            phi[-1] = 1.0
+
+        frontier = np.flatnonzero(_dilate(channel) & ~channel)
+        weights = np.maximum(phi.ravel()[frontier], 0.0) ** eta
+        total = weights.sum()
+        pick = frontier[rng.choice(frontier.size, p=weights / total)] if total > 0 \
+            else frontier[rng.integers(frontier.size)]
+        y, x = divmod(int(pick), gw)
+
+        # Attach to one of the channel cells it touches
+        ys, xs = np.nonzero(channel[max(0, y - 1):y + 2, max(0, x - 1):x + 2])
+        k = rng.integers(ys.size)
+        parent[pick] = (ys[k] + max(0, y - 1)) * gw + xs[k] + max(0, x - 1)
+        channel[y, x] = True
+        grown.append(int(pick))
+        if y == gh - 1:
+            break
+
+    # Coarse cells -> terminal cells, jittered within the coarse cell
+    nodes = np.array(grown)
+    node_y, node_x = np.divmod(nodes, gw)
+    jitter = rng.integers(-(cx // 2), cx // 2 + 1, nodes.size)
+    jitter[0] = 0
+    term_x = dict(zip(nodes.tolist(), ((node_x - mid) * cx + jitter).tolist()))
+    term_y = dict(zip(nodes.tolist(), (node_y * cy).tolist()))
+    segments = [
+        (term_x[int(parent[n])], term_y[int(parent[n])], term_x[n], term_y[n])
+        for n in nodes[1:].tolist()
+    ]
+    return rasterize_segments(segments)
+
+
+class BoltPool:
+    """
+    A few bolt shapes generated ahead of need.
+
+    take() pops a ready shape and wakes the refill thread, which waits
+    refill_delay seconds - past the strike's flash frames - before
+    topping the pool back up. If the pool ran dry, take() never waits
+    for the worker: it makes a shape inline with the cheap fallback
+    generator (or the main one if there is no fallback). configure()
+    swaps the generators (e.g. for a new pane size) and drops shapes
+    made by the old ones.
+    """
+
+    def __init__(self, size: int = 4, refill_delay: float = 0.25):
+        self.size = size
+        self.refill_delay = refill_delay
+        self._generate: Optional[Callable[[], Raster]] = None
+        self._fallback: Optional[Callable[[], Raster]] = None
+        self._ready: deque = deque()
+        self._epoch = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._priming = False
+        self.hits = 0
+        self.misses = 0
+        self.generated = 0
+
+    def configure(self, generate: Callable[[], Raster],
+                  fallback: Optional[Callable[[], Raster]] = None):
+        """Use a new shape generator; shapes from the old one are discarded."""
+        with self._lock:
+            self._generate = generate
+            self._fallback = fallback
+            self._epoch += 1
+            self._ready.clear()
+            self._priming = True
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="bolt-pool", daemon=True)
+            self._thread.start()
+        self._wake.set()
+
+    def take(self) -> Raster:
+        """A ready bolt shape; made inline only if the pool is empty."""
+        with self._lock:
+            shape = self._ready.popleft() if self._ready else None
+            generate = self._fallback or self._generate
+        if shape is None:
+            if generate is None:
+                raise RuntimeError("BoltPool.take() before configure()")
+            self.misses += 1
+            shape = generate()
+        else:
+            self.hits += 1
+        self._wake.set()
+        return shape
+
+    def ready(self) -> int:
+        with self._lock:
+            return len(self._ready)
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            # A fresh pool fills at once; refills after a strike wait out the flash
+            with self._lock:
+                priming, self._priming = self._priming, False
+            if not priming:
+                time.sleep(self.refill_delay)
+            while True:
+                with self._lock:
+                    if len(self._ready) >= self.size:
+                        break
+                    generate, epoch = self._generate, self._epoch
+                shape = generate()
+                with self._lock:
+                    if epoch == self._epoch:
+                        self._ready.append(shape)
+                        self.generated += 1
+
+    def get_report(self) -> Dict[str, Any]:
+        return {'ready': self.ready(), 'hits': self.hits, 'misses': self.misses,
+                'generated': self.generated}
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 🧪 BENCHMARK
+# ═══════════════════════════════════════════════════════════════════════════════
+
+if __name__ == "__main__":
+    print("⚡ Bolt generation benchmark (bolts/sec, single thread)")
+    for pane_w, pane_h in ((60, 24), (100, 34), (160, 50)):
+        depth = (pane_h // 2 + pane_h - 5) // 2 - 3
+        for name, generate in (("fractal", lambda: fractal_bolt(depth)),
+                               ("dbm", lambda: dbm_bolt(pane_w, depth))):
+            count, start = 0, time.perf_counter()
+            while time.perf_counter() - start < 1.0:
+                generate()
+                count += 1
+            rate = count / (time.perf_counter() - start)
+            print(f"  {pane_w:3d}x{pane_h:<3d} pane  {name:8s} {rate:8.1f} bolts/s")
@@ -0,0 +1,169 @@
+"""
+Particle Pools
+==============
+Fixed-capacity, array-backed particle storage for effect systems.
+
+A ParticlePool keeps one NumPy array per field (x, y, vx, ...) with the
+live particles packed at the front. Spawning writes a batch into the
+free tail, culling compacts the survivors with one boolean index, and
+motion is plain array arithmetic on the live views, so a frame costs
+the same handful of array ops whether ten particles are alive or ten
+thousand. Spawns beyond capacity are dropped (and counted), which keeps
+heavy weather from growing without bound.
+
+"A storm is just a very large number of very small decisions.
+Make them all at once." - Stormy
+"""
+from __future__ import annotations
+from typing import Any, Dict
+
+import numpy as np
+
+
+class ParticlePool:
+    """
+    Structure-of-arrays particle pool.
+
+    Fields are read as live views: pool.x is the x array of the
+    particles currently alive, and writing into it updates the pool.
+    """
+
+    def __init__(self, capacity: int, fields: Dict[str, Any]):
+        self.capacity = capacity
+        self.count = 0
+        self.dropped = 0
+        self._data = {name: np.zeros(capacity, dtype=dtype) for name, dtype in fields.items()}
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        data = self.__dict__.get('_data')
+        if data is None or name not in data:
+            raise AttributeError(name)
+        return data[name][:self.count]
+
+    def __setattr__(self, name: str, value):
+        # pool.x += dx rebinds pool.x after the in-place add; write it through
+        data = self.__dict__.get('_data')
+        if data is not None and name in data:
+            data[name][:self.count] = value
+        else:
+            object.__setattr__(self, name, value)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def spawn(self, n: int, **values) -> int:
+        """
+        Append up to n particles; values are scalars or length-n arrays.
+
+        Fields not given start at zero. Returns how many were spawned.
+        """
+        room = min(n, self.capacity - self.count)
+        self.dropped += n - room
+        if room <= 0:
+            return 0
+        new = slice(self.count, self.count + room)
+        for name, arr in self._data.items():
+            value = values.get(name, 0)
+            arr[new] = value[:room] if np.ndim(value) else value
+        self.count += room
+        return room
+
+    def cull(self, keep: np.ndarray):
+        """Keep only live particles where keep is True, packed in order."""
+        survivors = int(np.count_nonzero(keep))
+        if survivors == self.count:
+            return
+        for arr in self._data.values():
+            arr[:survivors] = arr[:self.count][keep]
+        self.count = survivors
+
+    def clear(self):
+        self.count = 0
+
+    def get_report(self) -> Dict[str, Any]:
+        return {'count': self.count, 'capacity': self.capacity, 'dropped': self.dropped}
+
+
+class TrailBuffer:
+    """
+    Ring buffer of recent positions for a list of particles.
+
+    history is (capacity, length, 2): row i holds the last length
+    positions of the i-th live particle, NaN where it has fewer. All
+    rows share one rotating head index, so recording a frame is one
+    write of a column of positions, not an append per particle. Rows
+    follow the owner's particle list: spawn() as particles are appended,
+    cull() with the same mask when they are removed.
+    """
+
+    def __init__(self, length: int, capacity: int = 256):
+        self.length = length
+        self.count = 0
+        self.head = 0
+        self._history = np.full((capacity, max(1, length), 2), np.nan)
+
+    @property
+    def capacity(self) -> int:
+        return self._history.shape[0]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def spawn(self, n: int):
+        """Add n empty rows at the end, growing the buffer if needed."""
+        if self.count + n > self.capacity:
+            grown = np.full((max(2 * self.capacity, self.count + n),) + self._history.shape[1:], np.nan)
+            grown[:self.count] = self._history[:self.count]
+            self._history = grown
+        self._history[self.count:self.count + n] = np.nan
+        self.count += n
+
+    def cull(self, keep: np.ndarray):
+        """Keep only rows where keep is True, packed in order."""
+        survivors = int(np.count_nonzero(keep))
+        if survivors != self.count:
+            self._history[:survivors] = self._history[:self.count][keep]
+            self.count = survivors
+
+    def extend(self, other: 'TrailBuffer'):
+        """Append other's rows (same length), realigned to this buffer's head."""
+        start = self.count
+        self.spawn(other.count)
+        rows = other._history[:other.count]
+        self._history[start:self.count] = np.roll(rows, self.head - other.head, axis=1)
+
+    def record(self, xs: np.ndarray, ys: np.ndarray):
+        """Store this frame's positions (one per row) in the head slot."""
+        if self.length <= 0:
+            return
+        slot = self._history[:self.count, self.head]
+        slot[:, 0] = xs
+        slot[:, 1] = ys
+        self.head = (self.head + 1) % self.length
+
+    def points(self):
+        """
+        Every recorded position, flattened: (xs, ys, rank), rank 0 being
+        the oldest point of its trail and length - 1 the newest.
+        """
+        if self.length <= 0 or self.count == 0:
+            empty = np.zeros(0)
+            return empty, empty, empty.astype(np.intp)
+        history = self._history[:self.count]
+        valid = ~np.isnan(history[..., 0])
+        # Slot k was written (head - 1 - k) % length frames ago
+        rank = self.length - 1 - (self.head - 1 - np.arange(self.length)) % self.length
+        return (history[..., 0][valid], history[..., 1][valid],
+                np.broadcast_to(rank, valid.shape)[valid])
+
+    def remap_x(self, fn):
+        """Apply fn to every stored x (e.g. when the pane is relaid out)."""
+        xs = self._history[:self.count, :, 0]
+        xs[:] = fn(xs)
+
+    def clear(self):
+        self.count = 0
+        self.head = 0
+
+    def get_report(self) -> Dict[str, Any]:
+        return {'count': self.count, 'capacity': self.capacity, 'length': self.length}
@@ -0,0 +1,92 @@
+"""
+Geometry Raster Cache
+=====================
+Rasterize effect geometry (arcs, rays, ...) once, reuse it every frame.
+
+Geometric effects trace the same shapes frame after frame; only their
+fade or flicker changes. A Raster holds the shape as parallel cell
+arrays plus per-cell attributes (band colour, falloff, ...), and the
+shared RASTER_CACHE keys rasters by (effect, width, height, parameters),
+so a resize or new parameters simply rasterize a new entry.
+
+"Why draw the same rainbow twice? Light doesn't. It just keeps
+arriving." - Stormy
+"""
+from __future__ import annotations
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+import numpy as np
+
+
+@dataclass
+class Raster:
+    """Cells of a shape in effect-local coordinates, in draw order."""
+    xs: np.ndarray
+    ys: np.ndarray
+    attrs: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return int(self.xs.size)
+
+    def place(self, x_offset: int, y_offset: int, width: int,
+              height: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Clip cells to the width x height effect area, then offset them to
+        the screen; returns (xs, ys, keep).
+        """
+        keep = (self.xs >= 0) & (self.xs < width) & (self.ys >= 0) & (self.ys < height)
+        return self.xs + x_offset, self.ys + y_offset, keep
+
+
+def last_writer(xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """
+    Indices of the last occurrence of each (x, y), in draw order.
+
+    Overlapping shapes drawn with print_at let the last write win; this
+    keeps that behaviour for a single batched write. Coordinates must be
+    non-negative (i.e. already clipped).
+    """
+    if xs.size == 0:
+        return np.zeros(0, dtype=np.intp)
+    key = ys.astype(np.int64) * (int(xs.max()) + 1) + xs
+    _, first_in_reversed = np.unique(key[::-1], return_index=True)
+    return np.sort(xs.size - 1 - first_in_reversed)
+
+
+class RasterCache:
+    """Small LRU cache of Rasters keyed by effect parameters."""
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Raster]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, build: Callable[[], Raster]) -> Raster:
+        """Return the raster for key, building (and caching) it on a miss."""
+        raster = self._entries.get(key)
+        if raster is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return raster
+        self.misses += 1
+        raster = build()
+        self._entries[key] = raster
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return raster
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_report(self) -> Dict[str, Any]:
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+# Shared by every geometric effect
+RASTER_CACHE = RasterCache()
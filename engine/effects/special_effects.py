@@ -13,18 +13,29 @@ Effects included:
 - Frost patterns
 - Sun rays (crepuscular rays)
 
-Each effect has its own particle system or rendering approach.
+Each effect has its own particle system or rendering approach. Effects
+provide update(dt, ...) and render(screen, x_offset, y_offset), and
+list the extra keyword inputs their update() takes in INPUTS so the
+SpecialEffectsManager can dispatch without inspecting signatures.
 """
 from __future__ import annotations
 import math
-import random
 import time
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import List, Tuple, Optional, Callable
 
+import numpy as np
 from asciimatics.screen import Screen
 
+from engine.rendering.core import TIER_SKIP
+from engine.rendering.framebuffer import CellBuffer, blit_cells
+from engine.effects.pool import ParticlePool
+from engine.effects.raster import Raster, RASTER_CACHE, last_writer
+from engine.rng import stream
+
+_rng = stream('effects')
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # 🎨 COLOR DEFINITIONS
@@ -72,6 +83,7 @@ class AuroraBorealis:
     """
     
     CHARS = ["░", "▒", "▓", "█", "≋", "~"]
+    CHAR_CODES = np.array([ord(c) for c in CHARS], dtype=np.int32)
     COLORS = [
         Screen.COLOUR_GREEN,
         Screen.COLOUR_CYAN,
@@ -80,6 +92,9 @@ class AuroraBorealis:
         Screen.COLOUR_CYAN,
     ]
     
+    FLICKER_POOL = 8      # Pre-generated flicker masks, rotated per frame
+    FLICKER_KEEP = 0.9    # Chance a curtain cell is lit in a given mask
+    
     def __init__(self, width: int, height: int, intensity: float = 1.0):
         self.width = width
         self.height = height
@@ -87,20 +102,42 @@ class AuroraBorealis:
         self.time = 0.0
         self.waves: List[AuroraWave] = []
         self._init_waves()
+        self._init_buffers()
     
     def _init_waves(self):
         """Initialize aurora wave structures."""
-        num_waves = random.randint(3, 6)
+        num_waves = _rng.randint(3, 6)
         for i in range(num_waves):
             self.waves.append(AuroraWave(
-                y_base=random.uniform(2, self.height * 0.4),
-                amplitude=random.uniform(2, 5),
-                frequency=random.uniform(0.02, 0.05),
-                phase=random.uniform(0, 2 * math.pi),
-                color=random.choice(self.COLORS),
-                intensity=random.uniform(0.5, 1.0),
+                y_base=_rng.uniform(2, self.height * 0.4),
+                amplitude=_rng.uniform(2, 5),
+                frequency=_rng.uniform(0.02, 0.05),
+                phase=_rng.uniform(0, 2 * math.pi),
+                color=_rng.choice(self.COLORS),
+                intensity=_rng.uniform(0.5, 1.0),
             ))
     
+    def _init_buffers(self):
+        """
+        Curtain buffers and the flicker pool, sized to the effect area.
+        
+        Rows and columns are effect-area cells: render() clips each curtain
+        to rows [0, height) and adds x_offset / y_offset only when drawing.
+        """
+        shape = (self.height, self.width)
+        self._level = np.full(shape, -1, dtype=np.int8)   # CHARS index, -1 = empty
+        self._colour = np.zeros(shape, dtype=np.int16)
+        self._flicker = _rng.generator.random((self.FLICKER_POOL,) + shape) < self.FLICKER_KEEP
+        self._flicker_index = 0
+    
+    def resize(self, width: int, height: int):
+        """Keep the curtains at the same relative height."""
+        scale = height / max(1, self.height)
+        for wave in self.waves:
+            wave.y_base *= scale
+        self.width, self.height = width, height
+        self._init_buffers()
+    
     def update(self, dt: float = 0.033):
         """Update aurora animation."""
         self.time += dt
@@ -111,35 +148,51 @@ class AuroraBorealis:
             wave.amplitude += math.sin(self.time * 0.1 + wave.phase) * 0.05
             wave.amplitude = max(1, min(6, wave.amplitude))
     
-    def render(self, screen, x_offset: int = 0, y_offset: int = 0):
-        """Render aurora to screen."""
-        for x in range(self.width):
-            for wave in self.waves:
-                # Calculate y position using sine wave
-                y = wave.y_base + wave.amplitude * math.sin(
-                    x * wave.frequency + wave.phase + self.time * 0.5
-                )
-                y = int(y) + y_offset
-                
-                # Draw vertical "curtain" from y upward
-                curtain_height = int(wave.amplitude * 2 * wave.intensity)
-                for dy in range(curtain_height):
-                    draw_y = y - dy
-                    if 0 <= draw_y < self.height:
-                        # Intensity decreases with height
-                        intensity = 1.0 - (dy / curtain_height)
-                        char_idx = int(intensity * (len(self.CHARS) - 1))
-                        char = self.CHARS[char_idx]
-                        
-                        # Flicker effect
-                        if random.random() > 0.1:
-                            try:
-                                screen.print_at(
-                                    char, x + x_offset, draw_y,
-                                    colour=wave.color
-                                )
-                            except Exception:
-                                pass
+    def render(self, screen, x_offset: int = 0, y_offset: int = 0, column_step: int = 1):
+        """
+        Render aurora to screen.
+        
+        Wave heights for every column come from one sin() per wave; each
+        curtain is a (columns x height) block written into the intensity
+        buffer, later waves over earlier ones. Flicker is a mask from a
+        pool of pre-generated ones, so no per-cell random() either.
+        """
+        level, colour = self._level, self._colour
+        level.fill(-1)
+        xs = np.arange(0, self.width, column_step)
+        n_chars = len(self.CHARS)
+        
+        for wave in self.waves:
+            curtain_height = int(wave.amplitude * 2 * wave.intensity)
+            if curtain_height <= 0:
+                continue
+            base = wave.y_base + wave.amplitude * np.sin(
+                xs * wave.frequency + wave.phase + self.time * 0.5
+            )
+            tops = base.astype(np.int32)
+            
+            # Intensity decreases with height above the wave line
+            dy = np.arange(curtain_height)
+            char_idx = ((1.0 - dy / curtain_height) * (n_chars - 1)).astype(np.int8)
+            ys = tops[:, None] - dy[None, :]
+            inside = (ys >= 0) & (ys < self.height)
+            cols = np.broadcast_to(xs[:, None], ys.shape)[inside]
+            rows = ys[inside]
+            level[rows, cols] = np.broadcast_to(char_idx, ys.shape)[inside]
+            colour[rows, cols] = wave.color
+        
+        # Rotate through the flicker pool (random stride hides the cycle)
+        self._flicker_index = (self._flicker_index + _rng.randint(1, self.FLICKER_POOL - 1)) % self.FLICKER_POOL
+        lit = (level >= 0) & self._flicker[self._flicker_index]
+        rows, cols = np.nonzero(lit)
+        if rows.size == 0:
+            return
+        blit_cells(screen, cols + x_offset, rows + y_offset, self.CHAR_CODES[level[rows, cols]],
+                   colour[rows, cols])
+    
+    def render_reduced(self, screen, x_offset: int = 0, y_offset: int = 0):
+        """Cheaper aurora: every other column of the curtain."""
+        self.render(screen, x_offset, y_offset, column_step=2)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -171,11 +224,17 @@ class HeatShimmer:
         for i in range(num_lines):
             self.shimmer_lines.append({
                 'y': self.height - 5 - i * 2,
-                'phase': random.uniform(0, 2 * math.pi),
-                'speed': random.uniform(0.05, 0.15),
-                'amplitude': random.uniform(0.5, 1.5),
+                'phase': _rng.uniform(0, 2 * math.pi),
+                'speed': _rng.uniform(0.05, 0.15),
+                'amplitude': _rng.uniform(0.5, 1.5),
             })
     
+    def resize(self, width: int, height: int):
+        """Shimmer lines are anchored to the ground; lay them out again."""
+        self.width, self.height = width, height
+        self.shimmer_lines.clear()
+        self._init_lines()
+    
     def update(self, dt: float = 0.033):
         """Update shimmer animation."""
         self.time += dt
@@ -183,9 +242,9 @@ class HeatShimmer:
     def render(self, screen, x_offset: int = 0, y_offset: int = 0):
         """Render heat shimmer effect."""
         for line in self.shimmer_lines:
-            y = line['y'] + y_offset
-            if not (0 <= y < self.height):
+            if not (0 <= line['y'] < self.height):
                 continue
+            y = line['y'] + y_offset
             
             for x in range(self.width):
                 # Sine wave distortion
@@ -194,9 +253,9 @@ class HeatShimmer:
                 ) * line['amplitude']
                 
                 # Only draw occasionally for shimmer effect
-                if random.random() < 0.3 * self.intensity:
-                    char = random.choice(self.CHARS)
-                    color = Screen.COLOUR_YELLOW if random.random() > 0.5 else Screen.COLOUR_WHITE
+                if _rng.random() < 0.3 * self.intensity:
+                    char = _rng.choice(self.CHARS)
+                    color = Screen.COLOUR_YELLOW if _rng.random() > 0.5 else Screen.COLOUR_WHITE
                     try:
                         screen.print_at(char, x + x_offset, y, colour=color)
                     except Exception:
@@ -226,6 +285,7 @@ class Rainbow:
         Screen.COLOUR_BLUE,
         Screen.COLOUR_MAGENTA,  # Violet
     ]
+    SOLID, SHADED = ord("█"), ord("▓")
     
     def __init__(self, width: int, height: int, intensity: float = 1.0):
         self.width = width
@@ -239,6 +299,13 @@ class Rainbow:
         self.center_y = height + 10  # Below screen
         self.radius = int(height * 0.8)
     
+    def resize(self, width: int, height: int):
+        """Recompute the arc for the new area (fade carries on)."""
+        self.width, self.height = width, height
+        self.center_x = width // 2
+        self.center_y = height + 10
+        self.radius = int(height * 0.8)
+    
     def update(self, dt: float = 0.033):
         """Update rainbow (fading over time)."""
         # Slowly fade
@@ -246,51 +313,49 @@ class Rainbow:
         if self.fade <= 0:
             self.visible = False
     
+    def _raster(self) -> Raster:
+        """Arc cells for the current geometry (built once, then cached)."""
+        key = ('rainbow', self.width, self.height, self.center_x, self.center_y, self.radius)
+        return RASTER_CACHE.get(key, self._build_raster)
+    
+    def _build_raster(self) -> Raster:
+        rad = np.radians(np.arange(30, 151, 2))  # 30° to 150° arc
+        cos, sin = np.cos(rad), np.sin(rad)
+        xs, ys, colours = [], [], []
+        for band, color in enumerate(self.COLORS):
+            radius = self.radius - band * 2
+            xs.append((self.center_x + radius * cos).astype(np.int32))
+            ys.append((self.center_y - radius * sin).astype(np.int32))
+            colours.append(np.full(rad.size, color, dtype=np.int16))
+        return Raster(np.concatenate(xs), np.concatenate(ys),
+                      {'colour': np.concatenate(colours)})
+    
     def render(self, screen, x_offset: int = 0, y_offset: int = 0):
-        """Render rainbow arc."""
+        """Render rainbow arc: cached arc cells, per-frame fade mask."""
         if not self.visible or self.fade <= 0:
             return
         
-        for band, color in enumerate(self.COLORS):
-            radius = self.radius - band * 2
-            
-            # Draw arc using parametric circle
-            for angle in range(30, 151, 2):  # 30° to 150° arc
-                rad = math.radians(angle)
-                x = int(self.center_x + radius * math.cos(rad)) + x_offset
-                y = int(self.center_y - radius * math.sin(rad)) + y_offset
-                
-                if 0 <= x < self.width and 0 <= y < self.height:
-                    # Vary character based on position
-                    if random.random() < self.fade * self.intensity:
-                        char = "█" if random.random() > 0.3 else "▓"
-                        try:
-                            screen.print_at(char, x, y, colour=color)
-                        except Exception:
-                            pass
+        raster = self._raster()
+        xs, ys, keep = raster.place(x_offset, y_offset, self.width, self.height)
+        keep &= _rng.generator.random(len(raster)) < self.fade * self.intensity
+        idx = np.flatnonzero(keep)
+        idx = idx[last_writer(xs[idx], ys[idx])]
+        glyphs = np.where(_rng.generator.random(idx.size) > 0.3, self.SOLID, self.SHADED)
+        blit_cells(screen, xs[idx], ys[idx], glyphs, raster.attrs['colour'][idx])
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # 🧊 HAIL PARTICLES
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass
-class HailStone:
-    """Individual hail particle."""
-    x: float
-    y: float
-    vx: float
-    vy: float
-    size: int  # 0=small, 1=medium, 2=large
-    rotation: float = 0.0
-    bounces: int = 0
-
-
 class HailEffect:
     """
     Hail particle system.
     Larger, faster particles than rain with bouncing behavior.
     
+    Hailstones live in a fixed-capacity ParticlePool; spawn, motion,
+    bounce and cull are whole-array operations.
+    
     "Ice falls from the sky with purpose. 
     The insurance companies call it an 'act of God'. 
     The Divines call it 'Tuesday'." - Stormy
@@ -301,151 +366,186 @@ class HailEffect:
         1: ["○", "◦", "o"],
         2: ["●", "◎", "O"],
     }
+    CHAR_CODES = np.array([[ord(c) for c in chars] for chars in CHARS_BY_SIZE.values()],
+                          dtype=np.int32)
+    SIZE_WEIGHTS = [0.5, 0.35, 0.15]
+    CAPACITY = 1024
+    INPUTS = ('wind_x',)
     
     def __init__(self, width: int, height: int, intensity: float = 1.0):
         self.width = width
         self.height = height
         self.intensity = intensity
-        self.hailstones: List[HailStone] = []
+        self.hailstones = ParticlePool(self.CAPACITY, {
+            'x': np.float32, 'y': np.float32, 'vx': np.float32, 'vy': np.float32,
+            'size': np.int8, 'bounces': np.int8,
+        })
         self.spawn_rate = int(5 * intensity)
+        self._spawn_carry = 0.0
     
     def update(self, dt: float = 0.033, wind_x: float = 0):
         """Update hail particles."""
-        # Spawn new hailstones
-        for _ in range(self.spawn_rate):
-            if random.random() < 0.3 * self.intensity:
-                size = random.choices([0, 1, 2], weights=[0.5, 0.35, 0.15])[0]
-                self.hailstones.append(HailStone(
-                    x=random.uniform(0, self.width),
-                    y=random.uniform(-5, 0),
-                    vx=wind_x + random.uniform(-0.5, 0.5),
-                    vy=random.uniform(2, 4) + size * 0.5,
-                    size=size,
-                ))
+        # Spawn new hailstones: expected count per frame, carried over
+        self._spawn_carry += self.spawn_rate * min(1.0, 0.3 * self.intensity)
+        n = int(self._spawn_carry)
+        self._spawn_carry -= n
+        if n:
+            size = _rng.generator.choice(3, n, p=self.SIZE_WEIGHTS)
+            self.hailstones.spawn(
+                n,
+                x=_rng.generator.uniform(0, self.width, n),
+                y=_rng.generator.uniform(-5, 0, n),
+                vx=wind_x + _rng.generator.uniform(-0.5, 0.5, n),
+                vy=_rng.generator.uniform(2, 4, n) + size * 0.5,
+                size=size,
+            )
         
         # Update existing hailstones
-        for stone in self.hailstones:
-            stone.x += stone.vx
-            stone.y += stone.vy
-            stone.vy += 0.15  # Gravity
-            
-            # Ground bounce
-            if stone.y >= self.height - 2:
-                stone.bounces += 1
-                stone.vy = -stone.vy * 0.4
-                stone.y = self.height - 2
+        h = self.hailstones
+        h.x += h.vx
+        h.y += h.vy
+        h.vy += 0.15  # Gravity
+        
+        # Ground bounce
+        ground = h.y >= self.height - 2
+        h.bounces[ground] += 1
+        h.vy[ground] *= -0.4
+        h.y[ground] = self.height - 2
         
         # Remove dead particles
-        self.hailstones = [
-            s for s in self.hailstones 
-            if s.bounces < 3 and 0 <= s.x < self.width
-        ]
+        h.cull((h.bounces < 3) & (h.x >= 0) & (h.x < self.width))
     
     def render(self, screen, x_offset: int = 0, y_offset: int = 0):
         """Render hailstones."""
-        for stone in self.hailstones:
-            x = int(stone.x) + x_offset
-            y = int(stone.y) + y_offset
-            
-            if 0 <= x < self.width and 0 <= y < self.height:
-                chars = self.CHARS_BY_SIZE[stone.size]
-                char = random.choice(chars)
-                try:
-                    screen.print_at(char, x, y, colour=Screen.COLOUR_WHITE)
-                except Exception:
-                    pass
+        h = self.hailstones
+        if not len(h):
+            return
+        xs = h.x.astype(np.int32)
+        ys = h.y.astype(np.int32)
+        keep = np.flatnonzero((xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height))
+        glyphs = self.CHAR_CODES[h.size[keep], _rng.generator.integers(0, 3, keep.size)]
+        blit_cells(screen, xs[keep] + x_offset, ys[keep] + y_offset, glyphs, Screen.COLOUR_WHITE)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # 🏜️ SANDSTORM / DUST STORM
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass
-class DustParticle:
-    """Individual dust/sand particle."""
-    x: float
-    y: float
-    vx: float
-    vy: float
-    char: str
-    alpha: float = 1.0
-
-
 class SandstormEffect:
     """
     Sandstorm/dust storm effect.
     Horizontal particles with reduced visibility.
     
+    Dust lives in a fixed-capacity ParticlePool, and the visibility
+    overlay cycles through a few speckle patterns rasterized up front,
+    so a heavy storm costs the same per frame as a light one.
+    
     "The earth rises up in anger. Or perhaps just inconvenience.
     The Wasteland knows this dance well." - Stormy
     """
     
     DUST_CHARS = [".", "·", ",", "'", ":", ";", "`"]
     SAND_CHARS = ["∘", "°", "⋅", "•"]
+    DUST_CODES = np.array([ord(c) for c in DUST_CHARS], dtype=np.int32)
+    SAND_CODES = np.array([ord(c) for c in SAND_CHARS], dtype=np.int32)
+    SPECKLE = ord("░")
+    SPECKLE_PATTERNS = 8
+    CAPACITY = 2048
+    INPUTS = ('wind_speed',)
     
     def __init__(self, width: int, height: int, intensity: float = 1.0):
         self.width = width
         self.height = height
         self.intensity = intensity
-        self.particles: List[DustParticle] = []
+        self.particles = ParticlePool(self.CAPACITY, {
+            'x': np.float32, 'y': np.float32, 'vx': np.float32, 'vy': np.float32,
+            'glyph': np.int32, 'alpha': np.float32,
+        })
         self.visibility = max(0.2, 1.0 - intensity * 0.6)
+        self._spawn_carry = 0.0
+        self._speckles: List[Raster] = []
+        self._speckle_size: Tuple[int, int] = (0, 0)
+        self._speckle_index = 0
     
     def update(self, dt: float = 0.033, wind_speed: float = 2.0):
         """Update sandstorm particles."""
         # Spawn new particles from left side
-        spawn_count = int(15 * self.intensity)
-        for _ in range(spawn_count):
-            if random.random() < 0.4:
-                is_sand = random.random() < 0.3
-                chars = self.SAND_CHARS if is_sand else self.DUST_CHARS
-                self.particles.append(DustParticle(
-                    x=random.uniform(-10, 5),
-                    y=random.uniform(0, self.height),
-                    vx=wind_speed * random.uniform(0.8, 1.5),
-                    vy=random.uniform(-0.3, 0.3),
-                    char=random.choice(chars),
-                    alpha=random.uniform(0.5, 1.0),
-                ))
+        self._spawn_carry += int(15 * self.intensity) * 0.4
+        n = int(self._spawn_carry)
+        self._spawn_carry -= n
+        if n:
+            is_sand = _rng.generator.random(n) < 0.3
+            glyph = np.where(is_sand,
+                             self.SAND_CODES[_rng.generator.integers(0, self.SAND_CODES.size, n)],
+                             self.DUST_CODES[_rng.generator.integers(0, self.DUST_CODES.size, n)])
+            self.particles.spawn(
+                n,
+                x=_rng.generator.uniform(-10, 5, n),
+                y=_rng.generator.uniform(0, self.height, n),
+                vx=wind_speed * _rng.generator.uniform(0.8, 1.5, n),
+                vy=_rng.generator.uniform(-0.3, 0.3, n),
+                glyph=glyph,
+                alpha=_rng.generator.uniform(0.5, 1.0, n),
+            )
         
         # Update particles
-        for p in self.particles:
-            p.x += p.vx
-            p.y += p.vy
-            # Turbulence
-            p.vy += random.uniform(-0.1, 0.1)
-            p.vy = max(-1, min(1, p.vy))
+        p = self.particles
+        p.x += p.vx
+        p.y += p.vy
+        # Turbulence
+        p.vy += _rng.generator.uniform(-0.1, 0.1, len(p))
+        np.clip(p.vy, -1, 1, out=p.vy)
         
         # Remove off-screen particles
-        self.particles = [
-            p for p in self.particles 
-            if p.x < self.width + 10 and 0 <= p.y < self.height
-        ]
+        p.cull((p.x < self.width + 10) & (p.y >= 0) & (p.y < self.height))
     
     def render(self, screen, x_offset: int = 0, y_offset: int = 0):
         """Render sandstorm."""
-        # Draw visibility overlay (reduced by filling with dim chars)
-        if self.intensity > 0.5:
-            for _ in range(int(self.width * self.height * (1 - self.visibility) * 0.1)):
-                x = random.randint(0, self.width - 1) + x_offset
-                y = random.randint(0, self.height - 1) + y_offset
-                if random.random() < 0.2:
-                    try:
-                        screen.print_at("░", x, y, colour=Screen.COLOUR_YELLOW)
-                    except Exception:
-                        pass
-        
-        # Draw particles
-        for p in self.particles:
-            x = int(p.x) + x_offset
-            y = int(p.y) + y_offset
-            
-            if 0 <= x < self.width and 0 <= y < self.height:
-                if random.random() < p.alpha:
-                    color = Screen.COLOUR_YELLOW if random.random() > 0.3 else Screen.COLOUR_WHITE
-                    try:
-                        screen.print_at(p.char, x, y, colour=color)
-                    except Exception:
-                        pass
+        self._render_overlay(screen, x_offset, y_offset)
+        self._render_particles(screen, x_offset, y_offset)
+    
+    def render_reduced(self, screen, x_offset: int = 0, y_offset: int = 0):
+        """Cheaper sandstorm: particles only, no visibility overlay."""
+        self._render_particles(screen, x_offset, y_offset)
+    
+    def _build_speckles(self):
+        """Rasterize the overlay speckle patterns for the current size."""
+        w, h = self.width, self.height
+        tries = int(w * h * (1 - self.visibility) * 0.1)
+        self._speckles = []
+        for _ in range(self.SPECKLE_PATTERNS):
+            n = _rng.generator.binomial(tries, 0.2) if tries > 0 else 0
+            self._speckles.append(Raster(_rng.generator.integers(0, max(w, 1), n),
+                                         _rng.generator.integers(0, max(h, 1), n)))
+        self._speckle_size = (w, h)
+    
+    def _render_overlay(self, screen, x_offset: int, y_offset: int):
+        """Draw visibility overlay (reduced by filling with dim chars)."""
+        if self.intensity <= 0.5:
+            return
+        if self._speckle_size != (self.width, self.height):
+            self._build_speckles()
+        # Hop through the patterns with a random stride so they don't visibly cycle
+        self._speckle_index = (self._speckle_index
+                               + _rng.randint(1, self.SPECKLE_PATTERNS - 1)) % self.SPECKLE_PATTERNS
+        speckle = self._speckles[self._speckle_index]
+        if len(speckle):
+            blit_cells(screen, speckle.xs + x_offset, speckle.ys + y_offset,
+                       np.full(len(speckle), self.SPECKLE, dtype=np.int32), Screen.COLOUR_YELLOW)
+    
+    def _render_particles(self, screen, x_offset: int, y_offset: int):
+        """Draw dust and sand particles."""
+        p = self.particles
+        if not len(p):
+            return
+        xs = np.floor(p.x).astype(np.int32)
+        ys = p.y.astype(np.int32)
+        keep = ((xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+                & (_rng.generator.random(len(p)) < p.alpha))
+        idx = np.flatnonzero(keep)
+        colours = np.where(_rng.generator.random(idx.size) > 0.3,
+                           Screen.COLOUR_YELLOW, Screen.COLOUR_WHITE)
+        blit_cells(screen, xs[idx] + x_offset, ys[idx] + y_offset, p.glyph[idx], colours)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -456,83 +556,105 @@ class FrostPatterns:
     """
     Frost crystal patterns on screen edges for very cold weather.
     
+    Frost lives in a persistent glyph layer (0 = bare glass). The cells
+    to draw are cached as one Raster and only rebuilt when a crystal
+    forms or melts; per frame, sparkle is a small random delta of cells
+    redrawn in cyan over the static layer.
+    
     "The cold writes upon the glass. Each crystal a tiny poem 
     about thermodynamics. The Nords just say 'it's cold'." - Stormy
     """
     
     FROST_CHARS = ["❄", "❆", "✧", "✦", "*", "·", "°", "∘"]
     CRYSTAL_CHARS = ["╱", "╲", "─", "│", "╳", "╋"]
+    FROST_CODES = np.array([ord(c) for c in FROST_CHARS], dtype=np.int32)
+    SPARKLE_FRACTION = 0.1  # share of crystals glinting cyan each frame
     
     def __init__(self, width: int, height: int, intensity: float = 1.0):
         self.width = width
         self.height = height
         self.intensity = intensity
-        self.frost_points: List[Tuple[int, int, str]] = []
+        self.layer = np.zeros((height, width), dtype=np.int32)
+        self._cells: Optional[Raster] = None
         self._generate_frost()
     
+    def _grow(self, region: Tuple[slice, slice], prob: np.ndarray):
+        """Seed crystals in a layer region with per-cell probability prob."""
+        view = self.layer[region]
+        hit = _rng.generator.random(view.shape) < prob
+        view[hit] = _rng.generator.choice(self.FROST_CODES, int(hit.sum()))
+    
     def _generate_frost(self):
         """Generate frost pattern points."""
         # Frost accumulates at edges and corners
-        edge_width = int(self.width * 0.15 * self.intensity)
-        edge_height = int(self.height * 0.2 * self.intensity)
+        w, h, k = self.width, self.height, self.intensity
+        edge_width = min(int(w * 0.15 * k), w)
+        edge_height = min(int(h * 0.2 * k), h)
         
-        # Top edge
-        for x in range(self.width):
-            for y in range(edge_height):
-                prob = (1 - y / edge_height) * 0.3 * self.intensity
-                if random.random() < prob:
-                    char = random.choice(self.FROST_CHARS)
-                    self.frost_points.append((x, y, char))
+        if edge_height > 0:
+            ramp = np.arange(edge_height)[:, None] / edge_height
+            # Top edge, then bottom edge
+            self._grow((slice(0, edge_height), slice(None)), (1 - ramp) * 0.3 * k)
+            self._grow((slice(h - edge_height, h), slice(None)), ramp * 0.2 * k)
         
-        # Bottom edge
-        for x in range(self.width):
-            for y in range(self.height - edge_height, self.height):
-                prob = ((y - (self.height - edge_height)) / edge_height) * 0.2 * self.intensity
-                if random.random() < prob:
-                    char = random.choice(self.FROST_CHARS)
-                    self.frost_points.append((x, y, char))
-        
-        # Side edges
-        for y in range(self.height):
-            for x in range(edge_width):
-                prob = (1 - x / edge_width) * 0.2 * self.intensity
-                if random.random() < prob:
-                    char = random.choice(self.FROST_CHARS)
-                    self.frost_points.append((x, y, char))
-            
-            for x in range(self.width - edge_width, self.width):
-                prob = ((x - (self.width - edge_width)) / edge_width) * 0.2 * self.intensity
-                if random.random() < prob:
-                    char = random.choice(self.FROST_CHARS)
-                    self.frost_points.append((x, y, char))
+        if edge_width > 0:
+            ramp = np.arange(edge_width)[None, :] / edge_width
+            # Side edges
+            self._grow((slice(None), slice(0, edge_width)), (1 - ramp) * 0.2 * k)
+            self._grow((slice(None), slice(w - edge_width, w)), ramp * 0.2 * k)
+        self._cells = None
+    
+    @property
+    def frost_points(self) -> List[Tuple[int, int, str]]:
+        """Crystals as (x, y, char), row-major."""
+        cells = self._raster()
+        return [(x, y, chr(g)) for x, y, g in
+                zip(cells.xs.tolist(), cells.ys.tolist(), cells.attrs['glyph'].tolist())]
+    
+    def _raster(self) -> Raster:
+        """Drawable cells of the layer, rebuilt only after the frost changed."""
+        if self._cells is None:
+            ys, xs = np.nonzero(self.layer)
+            self._cells = Raster(xs.astype(np.int32), ys.astype(np.int32),
+                                 {'glyph': self.layer[ys, xs]})
+        return self._cells
+    
+    def resize(self, width: int, height: int):
+        """Frost grows from the edges, so regrow it for the new edges."""
+        self.width, self.height = width, height
+        self.layer = np.zeros((height, width), dtype=np.int32)
+        self._generate_frost()
     
     def update(self, dt: float = 0.033):
         """Update frost (mostly static with occasional sparkle)."""
-        # Occasionally add/remove frost points for sparkle effect
-        if random.random() < 0.05:
-            if self.frost_points and random.random() < 0.5:
-                idx = random.randint(0, len(self.frost_points) - 1)
-                self.frost_points.pop(idx)
+        # Occasionally a crystal melts or forms
+        if _rng.random() < 0.05:
+            cells = self._raster()
+            if len(cells) and _rng.random() < 0.5:
+                i = _rng.randrange(len(cells))
+                self.layer[cells.ys[i], cells.xs[i]] = 0
             else:
-                x = random.choice([
-                    random.randint(0, int(self.width * 0.1)),
-                    random.randint(int(self.width * 0.9), self.width - 1)
+                x = _rng.choice([
+                    _rng.randint(0, int(self.width * 0.1)),
+                    _rng.randint(int(self.width * 0.9), self.width - 1)
                 ])
-                y = random.randint(0, self.height - 1)
-                self.frost_points.append((x, y, random.choice(self.FROST_CHARS)))
+                y = _rng.randint(0, self.height - 1)
+                self.layer[y, x] = ord(_rng.choice(self.FROST_CHARS))
+            self._cells = None
     
     def render(self, screen, x_offset: int = 0, y_offset: int = 0):
-        """Render frost patterns."""
-        for x, y, char in self.frost_points:
-            draw_x = x + x_offset
-            draw_y = y + y_offset
-            if 0 <= draw_x < self.width and 0 <= draw_y < self.height:
-                # Sparkle effect
-                color = Screen.COLOUR_WHITE if random.random() > 0.1 else Screen.COLOUR_CYAN
-                try:
-                    screen.print_at(char, draw_x, draw_y, colour=color)
-                except Exception:
-                    pass
+        """Render frost: the cached layer in white, then this frame's sparkle in cyan."""
+        cells = self._raster()
+        if not len(cells):
+            return
+        xs, ys, keep = cells.place(x_offset, y_offset, self.width, self.height)
+        idx = np.flatnonzero(keep)
+        glyphs = cells.attrs['glyph']
+        blit_cells(screen, xs[idx], ys[idx], glyphs[idx], Screen.COLOUR_WHITE)
+        
+        sparkle = idx[_rng.generator.random(idx.size) < self.SPARKLE_FRACTION]
+        if sparkle.size:
+            blit_cells(screen, xs[sparkle], ys[sparkle], glyphs[sparkle], Screen.COLOUR_CYAN)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -550,6 +672,7 @@ class SunRays:
     
     RAY_CHARS = ["│", "║", "┃", "╏", "╎"]
     BRIGHT_CHARS = ["█", "▓", "▒", "░"]
+    BRIGHT_CODES = np.array([ord(c) for c in BRIGHT_CHARS], dtype=np.int32)
     
     def __init__(self, width: int, height: int, sun_x: int = None, sun_y: int = 2):
         self.width = width
@@ -562,17 +685,24 @@ class SunRays:
     
     def _init_rays(self):
         """Initialize sun ray parameters."""
-        num_rays = random.randint(4, 8)
+        num_rays = _rng.randint(4, 8)
         for i in range(num_rays):
-            angle = random.uniform(-0.5, 0.5)  # Spread angle
+            angle = _rng.uniform(-0.5, 0.5)  # Spread angle
             self.rays.append({
                 'angle': angle,
-                'length': random.uniform(0.5, 0.9) * self.height,
-                'width': random.randint(1, 3),
-                'intensity': random.uniform(0.5, 1.0),
-                'flicker_phase': random.uniform(0, 2 * math.pi),
+                'length': _rng.uniform(0.5, 0.9) * self.height,
+                'width': _rng.randint(1, 3),
+                'intensity': _rng.uniform(0.5, 1.0),
+                'flicker_phase': _rng.uniform(0, 2 * math.pi),
             })
     
+    def resize(self, width: int, height: int):
+        """Scale the sun position and ray lengths to the new area."""
+        self.sun_x = int(self.sun_x * width / max(1, self.width))
+        for ray in self.rays:
+            ray['length'] *= height / max(1, self.height)
+        self.width, self.height = width, height
+    
     def update(self, dt: float = 0.033):
         """Update sun rays (subtle animation)."""
         self.time += dt
@@ -582,36 +712,47 @@ class SunRays:
                 self.time * 0.5 + ray['flicker_phase']
             )
     
-    def render(self, screen, x_offset: int = 0, y_offset: int = 0):
-        """Render sun rays."""
-        for ray in self.rays:
-            # Draw ray from sun position downward
+    def _raster(self) -> Raster:
+        """Ray cells with their falloff (built once per geometry, then cached)."""
+        key = ('sun_rays', self.width, self.height, self.sun_x, self.sun_y,
+               tuple((ray['angle'], int(ray['length']), ray['width']) for ray in self.rays))
+        return RASTER_CACHE.get(key, self._build_raster)
+    
+    def _build_raster(self) -> Raster:
+        xs, ys, falloff, ray_idx = [], [], [], []
+        for r, ray in enumerate(self.rays):
             length = int(ray['length'])
             for i in range(length):
-                # Calculate position along ray
                 t = i / length
-                x = int(self.sun_x + ray['angle'] * i) + x_offset
-                y = int(self.sun_y + i) + y_offset
-                
+                x = int(self.sun_x + ray['angle'] * i)
+                y = int(self.sun_y + i)
                 # Ray width expands with distance
                 width = int(ray['width'] * (1 + t))
-                
                 for w in range(-width // 2, width // 2 + 1):
-                    draw_x = x + w
-                    if 0 <= draw_x < self.width and 0 <= y < self.height:
-                        # Intensity decreases with distance and width offset
-                        intensity = ray['intensity'] * (1 - t * 0.5) * (1 - abs(w) / (width + 1))
-                        
-                        if random.random() < intensity:
-                            char_idx = int((1 - intensity) * (len(self.BRIGHT_CHARS) - 1))
-                            char = self.BRIGHT_CHARS[min(char_idx, len(self.BRIGHT_CHARS) - 1)]
-                            try:
-                                screen.print_at(
-                                    char, draw_x, y,
-                                    colour=Screen.COLOUR_YELLOW
-                                )
-                            except Exception:
-                                pass
+                    xs.append(x + w)
+                    ys.append(y)
+                    # Intensity decreases with distance and width offset
+                    falloff.append((1 - t * 0.5) * (1 - abs(w) / (width + 1)))
+                    ray_idx.append(r)
+        return Raster(np.array(xs, dtype=np.int32), np.array(ys, dtype=np.int32), {
+            'falloff': np.array(falloff), 'ray': np.array(ray_idx, dtype=np.int32),
+        })
+    
+    def render(self, screen, x_offset: int = 0, y_offset: int = 0):
+        """Render sun rays: cached ray cells, per-frame flicker and brightness."""
+        if not self.rays:
+            return
+        raster = self._raster()
+        xs, ys, keep = raster.place(x_offset, y_offset, self.width, self.height)
+        ray_intensity = np.array([ray['intensity'] for ray in self.rays])
+        intensity = ray_intensity[raster.attrs['ray']] * raster.attrs['falloff']
+        keep &= _rng.generator.random(len(raster)) < intensity
+        idx = np.flatnonzero(keep)
+        idx = idx[last_writer(xs[idx], ys[idx])]
+        
+        n = len(self.BRIGHT_CHARS)
+        char_idx = np.minimum(((1 - intensity[idx]) * (n - 1)).astype(np.int32), n - 1)
+        blit_cells(screen, xs[idx], ys[idx], self.BRIGHT_CODES[char_idx], Screen.COLOUR_YELLOW)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -632,7 +773,7 @@ class HeatLightning:
         self.flash_intensity = 0.0
         self.flash_duration = 0
         self.flash_region = (0, 0, width, height)  # x, y, w, h
-        self.next_flash_time = random.uniform(3, 10)
+        self.next_flash_time = _rng.uniform(3, 10)
         self.time = 0.0
     
     def update(self, dt: float = 0.033):
@@ -646,16 +787,16 @@ class HeatLightning:
         
         # Trigger new flash
         if self.time >= self.next_flash_time:
-            self.flash_intensity = random.uniform(0.3, 0.8)
-            self.flash_duration = random.randint(2, 6)
+            self.flash_intensity = _rng.uniform(0.3, 0.8)
+            self.flash_duration = _rng.randint(2, 6)
             
             # Random region for flash (usually horizon)
-            x = random.randint(0, self.width - 20)
-            w = random.randint(15, 30)
+            x = _rng.randint(0, self.width - 20)
+            w = _rng.randint(15, 30)
             self.flash_region = (x, 0, w, int(self.height * 0.3))
             
             self.time = 0
-            self.next_flash_time = random.uniform(5, 15)
+            self.next_flash_time = _rng.uniform(5, 15)
     
     def render(self, screen, x_offset: int = 0, y_offset: int = 0):
         """Render heat lightning flash."""
@@ -666,13 +807,12 @@ class HeatLightning:
         
         for y in range(rh):
             for x in range(rw):
-                draw_x = rx + x + x_offset
-                draw_y = ry + y + y_offset
-                
-                if 0 <= draw_x < self.width and 0 <= draw_y < self.height:
-                    if random.random() < self.flash_intensity * 0.3:
-                        char = "░" if random.random() > 0.5 else "▒"
-                        color = Screen.COLOUR_WHITE if random.random() > 0.3 else Screen.COLOUR_YELLOW
+                if 0 <= rx + x < self.width and 0 <= ry + y < self.height:
+                    draw_x = rx + x + x_offset
+                    draw_y = ry + y + y_offset
+                    if _rng.random() < self.flash_intensity * 0.3:
+                        char = "░" if _rng.random() > 0.5 else "▒"
+                        color = Screen.COLOUR_WHITE if _rng.random() > 0.3 else Screen.COLOUR_YELLOW
                         try:
                             screen.print_at(char, draw_x, draw_y, colour=color)
                         except Exception:
@@ -683,16 +823,76 @@ class HeatLightning:
 # 🎬 EFFECT MANAGER
 # ═══════════════════════════════════════════════════════════════════════════════
 
+@dataclass
+class EffectSlot:
+    """A registered effect with its declared inputs and cost accounting."""
+    effect: object
+    inputs: Tuple[str, ...] = ()
+    update_ms: float = 0.0  # Smoothed cost of one update()
+    render_ms: float = 0.0  # Smoothed cost of one full render()
+    render_every: int = 1   # Throttle: render on every Nth frame
+    cells: Optional[Tuple[np.ndarray, ...]] = None  # Last render, replayed between renders
+    site: str = ''          # PerformanceGuard site, unique per slot
+    
+    @property
+    def name(self) -> str:
+        return type(self.effect).__name__
+    
+    @property
+    def frame_ms(self) -> float:
+        """Average cost per frame at the current throttle."""
+        return self.update_ms + self.render_ms / self.render_every
+
+
 class SpecialEffectsManager:
     """
     Manages all special weather effects.
     Determines which effects to show based on conditions.
+    
+    Effects are registered once with the inputs their update() takes
+    (their INPUTS attribute by default), so each frame the manager hands
+    every effect exactly its inputs without inspecting signatures.
+    
+    Every effect's update and render time is measured. The effects
+    together get budget_ms per frame, split evenly; an effect whose
+    render doesn't fit its share is throttled to every Nth frame (up to
+    MAX_RENDER_EVERY), and its last render is replayed in between so it
+    doesn't flicker.
     """
     
-    def __init__(self, width: int, height: int):
+    BUDGET_MS = 5.0          # Default per-frame budget for all effects
+    MAX_RENDER_EVERY = 4
+    COST_SMOOTHING = 0.2     # EMA weight of the newest timing sample
+    
+    def __init__(self, width: int, height: int, budget_ms: float = BUDGET_MS):
         self.width = width
         self.height = height
-        self.active_effects: List = []
+        self.budget_ms = budget_ms
+        self.slots: List[EffectSlot] = []
+        self.frame = 0
+        self._scratch: Optional[CellBuffer] = None
+    
+    @property
+    def active_effects(self) -> List:
+        return [slot.effect for slot in self.slots]
+    
+    def register(self, effect, inputs: Optional[Tuple[str, ...]] = None) -> EffectSlot:
+        """
+        Add an effect. inputs names the keyword arguments its update()
+        takes from the manager's update() (default: effect.INPUTS).
+        """
+        if inputs is None:
+            inputs = getattr(effect, 'INPUTS', ())
+        slot = EffectSlot(effect, tuple(inputs))
+        # Each slot is its own guard site; repeats of an effect get a number
+        twins = sum(1 for other in self.slots if other.name == slot.name)
+        slot.site = f"effect:{slot.name}" + (f"#{twins + 1}" if twins else "")
+        self.slots.append(slot)
+        return slot
+    
+    def clear(self):
+        """Drop all effects."""
+        self.slots.clear()
     
     def update_for_conditions(
         self,
@@ -706,77 +906,175 @@ class SpecialEffectsManager:
         wind_speed: float = 5.0,
     ):
         """Update active effects based on weather conditions."""
-        self.active_effects.clear()
+        self.clear()
         
         # Aurora - high latitude + clear night
         if is_night and latitude > 50 and condition in ('clear', 'partly_cloudy'):
-            if random.random() < 0.3:  # Not every night
-                self.active_effects.append(
+            if _rng.random() < 0.3:  # Not every night
+                self.register(
                     AuroraBorealis(self.width, self.height, intensity=0.7)
                 )
         
         # Heat shimmer - very hot days
         if temperature_f > 95 and not is_night:
             intensity = min(1.0, (temperature_f - 95) / 15)
-            self.active_effects.append(
+            self.register(
                 HeatShimmer(self.width, self.height, intensity=intensity)
             )
         
         # Rainbow - clearing after rain
         if recent_rain and condition in ('clear', 'partly_cloudy') and not is_night:
-            self.active_effects.append(
+            self.register(
                 Rainbow(self.width, self.height, intensity=0.8)
             )
         
         # Frost patterns - very cold
         if temperature_f < 25:
             intensity = min(1.0, (25 - temperature_f) / 25)
-            self.active_effects.append(
+            self.register(
                 FrostPatterns(self.width, self.height, intensity=intensity)
             )
         
         # Sun rays - partly cloudy daytime
         if condition == 'partly_cloudy' and not is_night:
-            self.active_effects.append(
+            self.register(
                 SunRays(self.width, self.height)
             )
         
         # Heat lightning - warm humid nights
         if is_night and temperature_f > 70 and humidity > 60:
-            if random.random() < 0.2:
-                self.active_effects.append(
+            if _rng.random() < 0.2:
+                self.register(
                     HeatLightning(self.width, self.height)
                 )
         
         # Low visibility - sandstorm/dust (would need condition detection)
         if visibility < 1000 and humidity < 30:
             intensity = min(1.0, (1000 - visibility) / 800)
-            self.active_effects.append(
+            self.register(
                 SandstormEffect(self.width, self.height, intensity=intensity)
             )
     
+    def resize(self, width: int, height: int):
+        """
+        Resize active effects in place (terminal resize).
+        
+        Effects with layout-derived state implement resize(); the rest
+        (hail, sandstorm, heat lightning) cull against width/height on
+        their own and only need the new bounds.
+        """
+        self.width, self.height = width, height
+        for slot in self.slots:
+            effect = slot.effect
+            if hasattr(effect, 'resize'):
+                effect.resize(width, height)
+            else:
+                effect.width, effect.height = width, height
+            slot.cells = None
+    
     def add_hail(self, intensity: float = 1.0):
         """Manually add hail effect."""
-        self.active_effects.append(
+        self.register(
             HailEffect(self.width, self.height, intensity=intensity)
         )
     
-    def update(self, dt: float = 0.033, **kwargs):
-        """Update all active effects."""
-        for effect in self.active_effects:
-            if hasattr(effect, 'update'):
-                # Pass relevant kwargs to effect
-                try:
-                    effect.update(dt=dt, **{k: v for k, v in kwargs.items() 
-                                           if k in effect.update.__code__.co_varnames})
-                except TypeError:
-                    effect.update(dt)
+    def update(self, dt: float = 0.033, **inputs):
+        """Update all active effects, passing each only its declared inputs."""
+        for slot in self.slots:
+            kwargs = {name: inputs[name] for name in slot.inputs if name in inputs}
+            start = time.perf_counter()
+            slot.effect.update(dt, **kwargs)
+            slot.update_ms = self._smooth(slot.update_ms, (time.perf_counter() - start) * 1000)
     
-    def render(self, screen, x_offset: int = 0, y_offset: int = 0):
-        """Render all active effects."""
-        for effect in self.active_effects:
-            if hasattr(effect, 'render'):
-                effect.render(screen, x_offset, y_offset)
+    def render(self, screen, x_offset: int = 0, y_offset: int = 0, guard=None):
+        """
+        Render all active effects.
+        
+        With a PerformanceGuard each effect is its own guarded site, so an
+        expensive effect can fall back to render_reduced() (or be skipped)
+        for a frame without affecting the others. Throttled effects render
+        on their frame (staggered so they don't all land on the same one)
+        and replay their cached cells on the others; if the guard skips
+        one on its frame, the previous render is replayed again.
+        """
+        self.frame += 1
+        for i, slot in enumerate(self.slots):
+            throttled = slot.render_every > 1
+            if throttled and slot.cells is not None and (self.frame + i) % slot.render_every:
+                self._replay(screen, slot)
+                continue
+            
+            start = time.perf_counter()
+            if throttled:
+                scratch = self._scratch_for(screen)
+                rendered = self._render_effect(slot, scratch, x_offset, y_offset, guard)
+                if rendered:
+                    self._capture(slot, scratch)
+                if slot.cells is not None:
+                    self._replay(screen, slot)
+            else:
+                slot.cells = None
+                rendered = self._render_effect(slot, screen, x_offset, y_offset, guard)
+            if rendered:
+                # A skipped frame costs nothing and says nothing about the render
+                slot.render_ms = self._smooth(slot.render_ms, (time.perf_counter() - start) * 1000)
+            self._throttle(slot)
+    
+    def _render_effect(self, slot: EffectSlot, target, x_offset: int, y_offset: int, guard) -> bool:
+        """Render through the guard if there is one; False if it skipped the effect."""
+        effect = slot.effect
+        if guard is None:
+            effect.render(target, x_offset, y_offset)
+            return True
+        guard.register(slot.site, effect.render, reduced=getattr(effect, 'render_reduced', None))
+        guard.run(slot.site, target, x_offset, y_offset)
+        return guard.sites[slot.site].last_tier != TIER_SKIP
+    
+    def _throttle(self, slot: EffectSlot):
+        """Pick the smallest N for which update + render/N fits the effect's share."""
+        headroom = self.budget_ms / len(self.slots) - slot.update_ms
+        if headroom <= 0:
+            slot.render_every = self.MAX_RENDER_EVERY
+        else:
+            slot.render_every = max(1, min(self.MAX_RENDER_EVERY,
+                                           math.ceil(slot.render_ms / headroom)))
+    
+    def _smooth(self, average: float, sample: float) -> float:
+        if average == 0.0:
+            return sample
+        return average + (sample - average) * self.COST_SMOOTHING
+    
+    def _scratch_for(self, screen) -> CellBuffer:
+        """Off-screen buffer matching the target, with every cell marked untouched."""
+        w, h = screen.width, screen.height
+        if self._scratch is None or (self._scratch.width, self._scratch.height) != (w, h):
+            self._scratch = CellBuffer(w, h)
+        self._scratch.glyph.fill(-1)
+        return self._scratch
+    
+    @staticmethod
+    def _capture(slot: EffectSlot, scratch: CellBuffer):
+        ys, xs = np.nonzero(scratch.glyph >= 0)
+        slot.cells = (xs, ys, scratch.glyph[ys, xs], scratch.fg[ys, xs], scratch.bg[ys, xs])
+    
+    @staticmethod
+    def _replay(screen, slot: EffectSlot):
+        xs, ys, glyphs, fgs, bgs = slot.cells
+        if xs.size:
+            blit_cells(screen, xs, ys, glyphs, fgs, bg=bgs)
+    
+    def get_report(self) -> List[dict]:
+        """Per-effect cost accounting, in registration order."""
+        return [
+            {
+                'name': slot.name,
+                'update_ms': round(slot.update_ms, 3),
+                'render_ms': round(slot.render_ms, 3),
+                'render_every': slot.render_every,
+                'frame_ms': round(slot.frame_ms, 3),
+            }
+            for slot in self.slots
+        ]
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -10,7 +10,6 @@ Now powered by the unified dialogue pool in data/dialogue.py — all 200+ lines
 of noir/wasteland/prophet/crooner/absurdist writing, no longer dead code.
 """
 from __future__ import annotations
-import random
 import time
 from datetime import datetime
 from typing import Dict, List, Optional, Callable, Any
@@ -22,6 +21,9 @@ from data.dialogue import (
     WEATHER_COMMENTS, TEMP_COMMENTS, GREETINGS, QUIPS,
     WEATHER_TYPE_MAP, get_temp_category,
 )
+from engine.rng import stream
+
+_rng = stream('personality')
 
 
 class Mood(Enum):
@@ -160,7 +162,7 @@ class MoodStateMachine:
         # Natural transition probability increases over time
         base_prob = min(0.3, self.time_in_mood * 0.01)
 
-        if force_transition or random.random() < base_prob:
+        if force_transition or _rng.random() < base_prob:
             return self._transition(weather_type)
 
         return False
@@ -175,14 +177,14 @@ class MoodStateMachine:
 
         # Transition-based candidates
         for (from_mood, to_mood), prob in self.TRANSITIONS.items():
-            if from_mood == self.current_mood and random.random() < prob:
+            if from_mood == self.current_mood and _rng.random() < prob:
                 candidates.append(to_mood)
 
         # Random fallback
         if not candidates:
             candidates = list(Mood)
 
-        new_mood = random.choice(candidates)
+        new_mood = _rng.choice(candidates)
 
         if new_mood != self.current_mood:
             self.mood_history.append(new_mood)
@@ -242,7 +244,7 @@ class Memory:
         if total <= 0:
             return None
 
-        r = random.uniform(0, total)
+        r = _rng.uniform(0, total)
         cumulative = 0
 
         for entry, weight in zip(candidates, weights):
@@ -323,7 +325,7 @@ class PersonalityEngine:
         if not available:
             available = comments
 
-        comment = random.choice(available)
+        comment = _rng.choice(available)
 
         # Track and store
         self._track_comment(comment)
@@ -343,7 +345,7 @@ class PersonalityEngine:
         if not available:
             available = comments
 
-        comment = random.choice(available)
+        comment = _rng.choice(available)
         self._track_comment(comment)
         self.memory.store(f"Said about weather: {comment[:50]}...",
                          importance=0.3, category="weather_comment")
@@ -369,7 +371,7 @@ class PersonalityEngine:
         if not available:
             available = greetings
 
-        greeting = random.choice(available)
+        greeting = _rng.choice(available)
         self._track_comment(greeting)
         return greeting
 
@@ -385,13 +387,13 @@ class PersonalityEngine:
         if not available:
             available = comments
 
-        comment = random.choice(available)
+        comment = _rng.choice(available)
         self._track_comment(comment)
         return comment
 
     def get_quip(self, meta_chance: float = 0.3) -> str:
         """Get a general quip or meta-comment about the simulation."""
-        if random.random() < meta_chance:
+        if _rng.random() < meta_chance:
             pool = self.dialogue.META_QUIPS
         else:
             pool = self.dialogue.QUIPS
@@ -401,7 +403,7 @@ class PersonalityEngine:
         if not available:
             available = pool
 
-        quip = random.choice(available)
+        quip = _rng.choice(available)
         self._track_comment(quip)
 
         return quip
@@ -412,7 +414,7 @@ class PersonalityEngine:
 
         Returns None if no callback is appropriate.
         """
-        if random.random() > self.config.callback_chance:
+        if _rng.random() > self.config.callback_chance:
             return None
 
         memory = self.memory.recall()
@@ -423,7 +425,7 @@ class PersonalityEngine:
                 f"As I said before... {memory}",
                 f"Speaking of which... {memory}",
             ]
-            return random.choice(callbacks)
+            return _rng.choice(callbacks)
 
         return None
 
@@ -10,6 +10,8 @@ from engine.physics.atmosphere import (
     AtmosphericModel, AtmosphericState, StabilityClass,
     WindModel, calculate_wind_chill, calculate_heat_index
 )
+from engine.physics.ground import GroundField, RippleSurface
+from engine.physics.fluid import WindField
 
 __all__ = [
     'PerlinNoise', 'SimplexNoise', 'FractalNoise', 'DomainWarp', 'NoiseConfig',
@@ -18,4 +20,5 @@ __all__ = [
     'ForceGenerator', 'IntegrationType',
     'AtmosphericModel', 'AtmosphericState', 'StabilityClass',
     'WindModel', 'calculate_wind_chill', 'calculate_heat_index',
+    'GroundField', 'RippleSurface', 'WindField',
 ]
@@ -26,6 +26,10 @@ from typing import Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum, auto
 
+from engine.rng import stream
+
+_rng = stream('weather')
+
 
 # Physical constants
 R_GAS = 8.314462  # Universal gas constant (J/(mol·K))
@@ -324,10 +328,9 @@ class WindModel:
         self.gust_timer -= dt
         if self.gust_timer <= 0:
             # Generate new gust
-            import random
-            if random.random() < turbulence * 0.1:
-                self.gust_state = random.uniform(0.5, 2.0) * self.base_speed
-            self.gust_timer = random.uniform(0.5, 3.0)
+            if _rng.random() < turbulence * 0.1:
+                self.gust_state = _rng.uniform(0.5, 2.0) * self.base_speed
+            self.gust_timer = _rng.uniform(0.5, 3.0)
     
     def get_wind(self) -> Tuple[float, float]:
         """Get current wind vector including gusts."""
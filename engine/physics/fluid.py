@@ -0,0 +1,242 @@
+"""
+Stable-Fluids Wind Field
+========================
+A coarse 2D velocity field over the animation pane, solved with Jos
+Stam's semi-Lagrangian stable fluids: force, diffuse, advect, project.
+Everything is whole-grid NumPy with a fixed number of warm-started
+Jacobi iterations, so a step costs the same every frame; the grid
+resolution (terminal cells per fluid cell) is the quality knob, and
+max_cells caps it whatever the pane size.
+
+The field relaxes towards the weather's mean wind, gust events push a
+blob of air that projection turns into a pair of eddies, and a little
+random stirring keeps it turbulent. Particles look up their local wind
+with one bilinear sample per batch, and named density channels (cloud,
+fog, ...) are carried along by the same advection.
+
+Units: velocities are terminal cells per frame, positions are
+pane-relative terminal cells. The pane wraps horizontally (air leaving
+on the right comes back on the left, so clouds keep circulating); the
+top and bottom are walls.
+
+Physical Models:
+- Incompressible Navier-Stokes: ∂u/∂t = -(u·∇)u - ∇p + ν∇²u + f, ∇·u = 0
+- Pressure projection by Jacobi iteration on ∇²p = ∇·u
+
+References:
+- "Stable Fluids" - Stam, SIGGRAPH 1999
+- "Real-Time Fluid Dynamics for Games" - Stam, GDC 2003
+
+"Wind is just air that has somewhere better to be." - Stormy
+"""
+from __future__ import annotations
+import math
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+
+class WindField:
+    """Coarse incompressible wind over a width x height pane."""
+
+    RELAX = 0.05          # Per-frame pull of the flow towards the mean wind
+    SMOOTHING = 0.2       # EMA weight for the reported step time
+
+    def __init__(self, width: int, height: int, cell: Tuple[int, int] = (4, 2),
+                 iterations: int = 12, viscosity: float = 0.1, stir: float = 0.03,
+                 max_cells: int = 4096, rng: Optional[np.random.Generator] = None):
+        self.iterations = iterations  # Jacobi sweeps per projection (fixed cost)
+        self.viscosity = viscosity
+        self.stir = stir
+        self.max_cells = max_cells
+        self.rng = np.random.default_rng() if rng is None else rng
+        self.target = (0.0, 0.0)
+        self.densities: Dict[str, np.ndarray] = {}
+        self.step_ms = 0.0
+        self._cell = cell
+        self.resize(width, height)
+
+    # ── grid ────────────────────────────────────────────────────────────────
+
+    def resize(self, width: int, height: int):
+        """Fit the grid to a new pane; velocity restarts, densities are resampled."""
+        cx, cy = self._cell
+        gw, gh = max(4, math.ceil(width / cx)), max(3, math.ceil(height / cy))
+        # Bound the cost: coarsen uniformly until the grid fits max_cells
+        while gw * gh > self.max_cells:
+            cx, cy = cx + 1, cy + (1 if cy < cx else 0)
+            gw, gh = max(4, math.ceil(width / cx)), max(3, math.ceil(height / cy))
+        self.width, self.height = width, height
+        self.cx, self.cy = cx, cy
+        old = self.densities
+        self.u = np.zeros((gh, gw))
+        self.v = np.zeros((gh, gw))
+        self._pad = np.zeros((gh + 2, gw + 2))
+        self._pressure = np.zeros((gh, gw))
+        self._rows, self._cols = np.mgrid[0:gh, 0:gw].astype(np.float64)
+        self.densities = {}
+        for name, field in old.items():
+            rows = np.minimum(np.arange(gh) * field.shape[0] // gh, field.shape[0] - 1)
+            cols = np.minimum(np.arange(gw) * field.shape[1] // gw, field.shape[1] - 1)
+            self.densities[name] = field[np.ix_(rows, cols)]
+        self.u[:] = self.target[0]
+        self.v[:] = self.target[1]
+        self._fix_walls()
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.u.shape
+
+    def centres(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Pane coordinates of every grid cell centre, as (xs, ys) grids."""
+        gh, gw = self.shape
+        return np.meshgrid((np.arange(gw) + 0.5) * self.cx, (np.arange(gh) + 0.5) * self.cy)
+
+    def density(self, name: str, fill: float = 0.0) -> np.ndarray:
+        """A named density channel on the grid, created on first use."""
+        if name not in self.densities:
+            self.densities[name] = np.full(self.shape, fill)
+        return self.densities[name]
+
+    # ── forcing ─────────────────────────────────────────────────────────────
+
+    def set_wind(self, wind_x: float, wind_y: float):
+        """Mean wind the field relaxes towards (cells per frame)."""
+        self.target = (wind_x, wind_y)
+
+    def gust(self, x: float, y: float, fx: float, fy: float, radius: float):
+        """Push a Gaussian blob of air centred on pane cell (x, y)."""
+        xs, ys = self.centres()
+        dx = (xs - x + self.width / 2) % self.width - self.width / 2  # Wraps with the pane
+        weight = np.exp(-(dx ** 2 + (ys - y) ** 2) / (2.0 * radius ** 2))
+        self.u += fx * weight
+        self.v += fy * weight
+        self._fix_walls()
+
+    # ── solver ──────────────────────────────────────────────────────────────
+
+    def step(self, frames: int = 1):
+        """
+        Advance one frame: force, diffuse, advect, project, carry densities.
+
+        frames > 1 takes one larger step covering that many frames
+        (compounded relaxation, scaled diffusion and advection), which
+        semi-Lagrangian advection stays stable for.
+        """
+        start = time.perf_counter()
+        tx, ty = self.target
+        relax = self.RELAX if frames == 1 else 1.0 - (1.0 - self.RELAX) ** frames
+        self.u += relax * (tx - self.u)
+        self.v += relax * (ty - self.v)
+        if self.stir:
+            stir = self.stir * math.sqrt(frames)  # Random kicks add up as a random walk
+            self.u += stir * self.rng.standard_normal(self.shape)
+            self.v += stir * self.rng.standard_normal(self.shape)
+        if self.viscosity:
+            self.u = self._diffuse(self.u, self.viscosity * frames)
+            self.v = self._diffuse(self.v, self.viscosity * frames)
+        back = self._stencil(*self._backtrace(frames))
+        self.u, self.v = self._gather(self.u, back), self._gather(self.v, back)
+        self._project()
+        for name, field in self.densities.items():
+            self.densities[name] = self._gather(field, back)
+        elapsed = (time.perf_counter() - start) * 1000
+        self.step_ms += self.SMOOTHING * (elapsed - self.step_ms)
+
+    def _fix_walls(self):
+        """No flow through the top and bottom of the pane."""
+        self.v[0] = 0.0
+        self.v[-1] = 0.0
+
+    def _padded(self, f: np.ndarray) -> np.ndarray:
+        """f with a one-cell halo: wrapped in x, mirrored at the walls."""
+        pad = self._pad
+        pad[1:-1, 1:-1] = f
+        pad[1:-1, 0] = f[:, -1]
+        pad[1:-1, -1] = f[:, 0]
+        pad[0] = pad[1]
+        pad[-1] = pad[-2]
+        return pad
+
+    def _neighbours(self, f: np.ndarray) -> np.ndarray:
+        """Sum of the four neighbours: periodic in x, mirrored at the walls."""
+        pad = self._padded(f)
+        return pad[:-2, 1:-1] + pad[2:, 1:-1] + pad[1:-1, :-2] + pad[1:-1, 2:]
+
+    def _diffuse(self, f: np.ndarray, a: float) -> np.ndarray:
+        """Implicit diffusion, (1 - a∇²) f' = f, with a few Jacobi sweeps."""
+        out = f
+        for _ in range(max(1, self.iterations // 4)):
+            out = (f + a * self._neighbours(out)) / (1.0 + 4.0 * a)
+        return out
+
+    def _project(self):
+        """Remove divergence: solve ∇²p = ∇·u (fixed sweeps) and subtract ∇p."""
+        # Grid units, so the anisotropic cell shape doesn't skew the solve
+        pad = self._padded(self.u / self.cx)
+        div = pad[1:-1, 2:] - pad[1:-1, :-2]
+        pad = self._padded(self.v / self.cy)
+        pad[0] = 0.0   # Walls: no flow in or out
+        pad[-1] = 0.0
+        div += pad[2:, 1:-1] - pad[:-2, 1:-1]
+        div *= 0.5
+        # Warm start from last frame's pressure: the flow changes slowly
+        p = self._pressure
+        for _ in range(self.iterations):
+            p = (self._neighbours(p) - div) * 0.25
+        self._pressure = p
+        pad = self._padded(p)
+        self.u -= 0.5 * (pad[1:-1, 2:] - pad[1:-1, :-2]) * self.cx
+        self.v -= 0.5 * (pad[2:, 1:-1] - pad[:-2, 1:-1]) * self.cy
+        self._fix_walls()
+
+    def _backtrace(self, frames: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """Grid coordinates each cell's contents came from frames frames ago."""
+        return self._cols - self.u * frames / self.cx, self._rows - self.v * frames / self.cy
+
+    def _stencil(self, gx: np.ndarray, gy: np.ndarray) -> tuple:
+        """
+        Bilinear corners and weights for fractional grid coordinates (x wraps,
+        y clamps), computed once and shared by every field sampled there.
+        """
+        gh, gw = self.shape
+        gy = np.clip(gy, 0.0, gh - 1.0)
+        x0 = np.floor(gx)
+        y0 = np.minimum(np.floor(gy), gh - 2)
+        fx, fy = gx - x0, gy - y0
+        x0 = x0.astype(np.intp) % gw
+        x1 = (x0 + 1) % gw
+        row = y0.astype(np.intp) * gw
+        corners = (row + x0, row + x1, row + gw + x0, row + gw + x1)
+        weights = ((1.0 - fx) * (1.0 - fy), fx * (1.0 - fy), (1.0 - fx) * fy, fx * fy)
+        return corners, weights
+
+    @staticmethod
+    def _gather(field: np.ndarray, stencil: tuple) -> np.ndarray:
+        corners, weights = stencil
+        flat = field.ravel()
+        return (flat[corners[0]] * weights[0] + flat[corners[1]] * weights[1]
+                + flat[corners[2]] * weights[2] + flat[corners[3]] * weights[3])
+
+    # ── lookups ─────────────────────────────────────────────────────────────
+
+    def _lookup(self, xs, ys) -> tuple:
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        return self._stencil(xs / self.cx - 0.5, ys / self.cy - 0.5)
+
+    def sample(self, xs, ys) -> Tuple[np.ndarray, np.ndarray]:
+        """Wind (u, v) at pane positions, by bilinear lookup."""
+        at = self._lookup(xs, ys)
+        return self._gather(self.u, at), self._gather(self.v, at)
+
+    def sample_density(self, name: str, xs, ys) -> np.ndarray:
+        """A density channel at pane positions, by bilinear lookup."""
+        return self._gather(self.density(name), self._lookup(xs, ys))
+
+    def get_report(self) -> Dict[str, Any]:
+        gh, gw = self.shape
+        return {'grid': f"{gw}x{gh}", 'cell': (self.cx, self.cy),
+                'step_ms': round(self.step_ms, 3),
+                'mean_wind': (round(float(self.u.mean()), 3), round(float(self.v.mean()), 3))}
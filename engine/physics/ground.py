@@ -0,0 +1,167 @@
+"""
+Ground Accumulation
+===================
+Rain puddles and snow drifts as a NumPy height field, one value per
+pane column, plus a rippling puddle surface.
+
+Landing particles are deposited as a histogram of their columns (one
+np.bincount however many land), evaporation is one random draw per
+column done as a single array, and snow can slump through a sandpile
+automaton: wherever the step between neighbouring columns exceeds the
+angle of repose, part of the excess slides down the slope. Wind lowers
+the repose threshold downwind and raises it upwind, so drifts creep
+and pile on the lee side. Every stage is a fixed number of whole-array
+passes per frame.
+
+RippleSurface is the rain counterpart: a damped 1D wave equation along
+the ground row, where each landing drop dips the surface and the
+ripple spreads through the puddle.
+
+Physical Models:
+- Wave equation: u_tt = c² u_xx - k u, leapfrog with velocity damping
+- Angle of repose: flow when h[i] - h[i±1] > repose (Bak-Tang-Wiesenfeld
+  style slumping with a continuous height)
+- Wind-biased transport: repose * (1 ∓ bias) downwind / upwind
+
+"Snow doesn't fall where it lands. It lands, then thinks about it." - Stormy
+"""
+from __future__ import annotations
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+
+class GroundField:
+    """Per-column accumulation height, capped at max_height."""
+
+    def __init__(self, width: int, max_height: float = 5.0, repose: float = 1.0,
+                 flow: float = 0.5, rng: Optional[np.random.Generator] = None):
+        self.max_height = max_height
+        self.repose = repose  # Steepest stable step between neighbouring columns
+        self.flow = flow      # Fraction of the excess that slides per pass
+        self.rng = np.random.default_rng() if rng is None else rng
+        self.heights = np.zeros(max(1, width), dtype=np.float64)
+
+    @property
+    def width(self) -> int:
+        return self.heights.size
+
+    def resize(self, width: int):
+        """Resample the profile to a new width (nearest column)."""
+        width = max(1, width)
+        src = np.minimum((np.arange(width) * self.width) // width, self.width - 1)
+        self.heights = self.heights[src]
+
+    def clear(self):
+        self.heights.fill(0.0)
+
+    def deposit(self, columns, amount: float = 0.5):
+        """Add amount per landing particle, binned by column in one pass."""
+        columns = np.asarray(columns, dtype=np.intp)
+        if columns.size == 0:
+            return
+        columns = columns[(columns >= 0) & (columns < self.width)]
+        counts = np.bincount(columns, minlength=self.width)
+        np.minimum(self.heights + counts * amount, self.max_height, out=self.heights)
+
+    def evaporate(self, chance: float = 0.005, amount: float = 0.1, frames: int = 1):
+        """
+        Each column loses amount with probability chance per frame.
+
+        frames > 1 evaporates several frames at once: the number of
+        losses per column is one binomial draw.
+        """
+        if frames == 1:
+            drying = self.rng.random(self.width) < chance
+            self.heights[drying] = np.maximum(0.0, self.heights[drying] - amount)
+            return
+        losses = self.rng.binomial(frames, chance, self.width)
+        np.maximum(0.0, self.heights - amount * losses, out=self.heights)
+
+    def slump(self, wind: float = 0.0, passes: int = 1):
+        """
+        Relax slopes steeper than the angle of repose, mass-conserving.
+
+        wind in [-1, 1] biases transport: positive wind lets material
+        slide right on shallower steps and holds it back from sliding
+        left. The ends are closed, so nothing is lost off the pane.
+        """
+        if self.width < 2:
+            return
+        bias = float(np.clip(wind, -0.9, 0.9))
+        right_repose = self.repose * (1.0 - bias)
+        left_repose = self.repose * (1.0 + bias)
+        h = self.heights
+        for _ in range(passes):
+            step = h[:-1] - h[1:]  # > 0 where column i stands above column i + 1
+            # Halve each flux so a column losing both ways can't go negative
+            to_right = np.maximum(step - right_repose, 0.0) * (self.flow / 2)
+            to_left = np.maximum(-step - left_repose, 0.0) * (self.flow / 2)
+            net = to_right - to_left  # Flux across each boundary, rightwards
+            h[:-1] -= net
+            h[1:] += net
+        np.clip(h, 0.0, self.max_height, out=h)
+
+    def levels(self) -> np.ndarray:
+        """Integer height per column, for choosing glyphs."""
+        return self.heights.astype(np.int32)
+
+    def get_report(self) -> Dict[str, Any]:
+        return {'columns': self.width, 'total': float(self.heights.sum()),
+                'peak': float(self.heights.max())}
+
+
+class RippleSurface:
+    """
+    Damped 1D wave equation along the ground row, for puddle ripples.
+
+    One fixed-size stencil update per frame (leapfrog, c <= 1 for
+    stability); landing drops push the surface down in their columns and
+    the dip spreads both ways as a ripple. Dry columns are pinned flat,
+    so ripples reflect off the edges of a puddle instead of crossing
+    dry ground.
+    """
+
+    def __init__(self, width: int, speed: float = 0.5, damping: float = 0.05,
+                 restore: float = 0.1, impulse: float = 1.5):
+        self.speed = speed      # Cells per frame (Courant number; keep <= 1)
+        self.damping = damping  # Fraction of velocity lost per frame
+        self.restore = restore  # Pull back towards flat; dips would pile up otherwise
+        self.impulse = impulse  # Depth of the dip one drop makes
+        self.u = np.zeros(max(1, width), dtype=np.float64)
+        self.u_prev = np.zeros_like(self.u)
+
+    @property
+    def width(self) -> int:
+        return self.u.size
+
+    def resize(self, width: int):
+        """Ripples don't survive a relayout; start flat at the new width."""
+        self.u = np.zeros(max(1, width), dtype=np.float64)
+        self.u_prev = np.zeros_like(self.u)
+
+    def splash(self, columns):
+        """Drop impacts: one binned dip per landing column."""
+        columns = np.asarray(columns, dtype=np.intp)
+        if columns.size == 0:
+            return
+        columns = columns[(columns >= 0) & (columns < self.width)]
+        self.u -= np.bincount(columns, minlength=self.width) * self.impulse
+
+    def step(self, wet: Optional[np.ndarray] = None):
+        """Advance one frame; wet (bool per column) limits where water moves."""
+        u = self.u
+        lap = np.empty_like(u)
+        lap[1:-1] = u[:-2] - 2.0 * u[1:-1] + u[2:]
+        lap[0] = u[1] - u[0] if u.size > 1 else 0.0  # Reflective ends
+        lap[-1] = u[-2] - u[-1] if u.size > 1 else 0.0
+        velocity = (u - self.u_prev) * (1.0 - self.damping)
+        u_next = u + velocity + (self.speed ** 2) * lap - self.restore * u
+        if wet is not None:
+            u_next[~wet] = 0.0
+        self.u_prev, self.u = u, u_next
+
+    def shade(self, levels: np.ndarray, top: int) -> np.ndarray:
+        """Glyph index per column: the puddle's level moved by the surface height."""
+        shaded = np.clip(levels + np.rint(self.u).astype(np.int32), 1, top)
+        return np.where(levels > 0, shaded, 0)
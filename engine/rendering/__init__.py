@@ -1,11 +1,25 @@
 """Rendering Engine Module - Performance-aware frame rendering."""
 
 from engine.rendering.core import (
-    RenderEngine, RenderStats, FrameBudget, RenderQueue,
-    RenderCommand, RenderLayer, profile_function, guard_performance
+    RenderEngine, RenderStats, FrameBudget, BandwidthBudget, RenderQueue,
+    RenderCommand, RenderLayer, profile_function, guard_performance,
+    PerformanceGuard, GuardSite, TIER_FULL, TIER_REDUCED, TIER_SKIP,
 )
+from engine.rendering.framebuffer import CellBuffer
+from engine.rendering.ansi import AnsiWriter, ByteCounter
+from engine.rendering.scheduler import IdleScheduler, CpuMeter, LodScheduler, LodTask
+from engine.rendering.occupancy import OccupancyMask
+from engine.rendering.quality import QualityProfile, QUALITY_PROFILES, get_quality
+from engine.rendering.dither import DitherRamp, ordered_dither, bayer_matrix, BAYER_4
+from engine.rendering.subcell import rasterize_points, half_block_codes, SUBCELL_MODES
 
 __all__ = [
-    'RenderEngine', 'RenderStats', 'FrameBudget', 'RenderQueue',
+    'RenderEngine', 'RenderStats', 'FrameBudget', 'BandwidthBudget', 'RenderQueue',
     'RenderCommand', 'RenderLayer', 'profile_function', 'guard_performance',
+    'PerformanceGuard', 'GuardSite', 'TIER_FULL', 'TIER_REDUCED', 'TIER_SKIP',
+    'CellBuffer', 'AnsiWriter', 'ByteCounter', 'IdleScheduler', 'CpuMeter',
+    'LodScheduler', 'LodTask',
+    'OccupancyMask', 'QualityProfile', 'QUALITY_PROFILES', 'get_quality',
+    'DitherRamp', 'ordered_dither', 'bayer_matrix', 'BAYER_4',
+    'rasterize_points', 'half_block_codes', 'SUBCELL_MODES',
 ]
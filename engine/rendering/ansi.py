@@ -0,0 +1,297 @@
+"""
+Direct ANSI Output
+==================
+Turns the difference between two CellBuffers into one pre-built byte
+string and writes it with a single os.write per frame.
+
+Compared with pushing every cell through asciimatics print_at, this:
+- Diffs the whole region with array ops and only walks changed cells
+- Picks the cheapest cursor movement (none, reprint, CUF or CUP)
+- Emits SGR colour escapes only when the colour state changes
+- Brackets the frame in synchronized-update mode (DEC 2026) so the
+  terminal swaps it in at once instead of tearing
+- Can cap a frame to a byte budget, deferring low-priority cells
+
+asciimatics still owns input and screen setup; this only paints a
+region of the screen after asciimatics has refreshed the rest.
+"""
+from __future__ import annotations
+import os
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from engine.rendering.framebuffer import CellBuffer, narrow_glyphs
+
+
+CSI = "\x1b["
+SYNC_BEGIN = "\x1b[?2026h"
+SYNC_END = "\x1b[?2026l"
+SGR_RESET = "\x1b[0m"
+
+# asciimatics attribute constants → SGR parameters
+_ATTR_SGR = {1: "1", 3: "7", 4: "4"}
+
+
+def _fg_sgr(colour: int) -> str:
+    if colour < 0:
+        return "39"
+    if colour < 8:
+        return f"3{colour}"
+    return f"38;5;{colour}"
+
+
+def _bg_sgr(colour: int) -> str:
+    if colour < 0:
+        return "49"
+    if colour < 8:
+        return f"4{colour}"
+    return f"48;5;{colour}"
+
+
+class ByteCounter:
+    """
+    Transparent wrapper around a text stream that counts encoded bytes.
+
+    Installed over sys.stdout it measures what asciimatics writes, so the
+    asciimatics path can be compared with AnsiWriter on the same terms.
+    """
+
+    def __init__(self, stream, encoding: str = "utf-8"):
+        self._stream = stream
+        self._encoding = encoding
+        self.bytes_written = 0
+
+    def write(self, text: str) -> int:
+        self.bytes_written += len(text.encode(self._encoding, "replace"))
+        return self._stream.write(text)
+
+    def take(self) -> int:
+        """Return bytes counted since the last call and reset."""
+        count, self.bytes_written = self.bytes_written, 0
+        return count
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+class AnsiWriter:
+    """
+    Emit a CellBuffer region as minimal ANSI output.
+
+    Keeps a front buffer holding what the terminal is believed to show.
+    Each flush() diffs the back buffer against it, builds the escape
+    string, writes it in one os.write and updates the front buffer.
+    Call invalidate() whenever something else may have painted over the
+    region (asciimatics full redraw, another screen, resize).
+
+    With a byte cap, changed cells are emitted in priority order until
+    the cap is reached; the rest stay marked as changed and go out on a
+    later frame. Deferral resumes from the row where it stopped, so no
+    part of the region is starved.
+    """
+
+    def __init__(self, width: int, height: int,
+                 region: Optional[Tuple[int, int, int, int]] = None,
+                 fd: Optional[int] = None, synchronized: bool = True):
+        self.width = width
+        self.height = height
+        self.region = region or (0, 0, width, height)
+        self.fd = fd
+        self.synchronized = synchronized
+        self.front = CellBuffer(width, height)
+        self._resume_row = 0
+        self.invalidate()
+
+        # Instrumentation
+        self.frames = 0
+        self.total_bytes = 0
+        self.last_bytes = 0
+        self.last_cells = 0
+        self.last_deferred = 0
+
+    def invalidate(self):
+        """Forget what the terminal shows; the next flush repaints the region."""
+        x, y, w, h = self.region
+        self.front.glyph[y:y + h, x:x + w] = -1
+
+    def changed_cells(self, back: CellBuffer) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (ys, xs) of region cells that differ from the front buffer, row-major."""
+        x, y, w, h = self.region
+        rows, cols = slice(y, y + h), slice(x, x + w)
+        f = self.front
+        changed = (
+            (back.glyph[rows, cols] != f.glyph[rows, cols])
+            | (back.fg[rows, cols] != f.fg[rows, cols])
+            | (back.bg[rows, cols] != f.bg[rows, cols])
+            | (back.attr[rows, cols] != f.attr[rows, cols])
+        )
+        ys, xs = np.nonzero(changed)
+        return ys + y, xs + x
+
+    def budget_order(self, ys: np.ndarray, xs: np.ndarray,
+                     priority: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Reorder changed cells for a capped frame: cells set in the
+        priority mask first, then the rest starting at the resume row.
+        Row-major within each group so cursor moves stay cheap.
+        """
+        key = ((ys - self._resume_row) % self.height) * self.width + xs
+        if priority is not None:
+            key = key + np.where(priority[ys, xs], 0, self.height * self.width)
+        order = np.argsort(key, kind="stable")
+        return ys[order], xs[order]
+
+    def encode(self, back: CellBuffer, ys: np.ndarray, xs: np.ndarray,
+               max_bytes: Optional[int] = None) -> Tuple[bytes, int]:
+        """
+        Build the escape string that paints the given cells of back.
+
+        Returns (data, count) where count is how many of the cells fit
+        under max_bytes; they are always a prefix of the input order.
+        """
+        if ys.size == 0:
+            return b"", 0
+
+        glyphs = back.glyph[ys, xs].tolist()
+        fgs = back.fg[ys, xs].tolist()
+        bgs = back.bg[ys, xs].tolist()
+        attrs = back.attr[ys, xs].tolist()
+        ys_l = ys.tolist()
+        xs_l = xs.tolist()
+
+        # Row data for reprinting short gaps instead of moving the cursor
+        b_glyph, b_fg, b_bg, b_attr = back.glyph, back.fg, back.bg, back.attr
+
+        head = (SYNC_BEGIN if self.synchronized else "") + SGR_RESET
+        tail = SGR_RESET + (SYNC_END if self.synchronized else "")
+        budget = None if max_bytes is None else max_bytes - len(head) - len(tail)
+
+        out: List[str] = [head]
+        size = 0
+        count = 0
+        cur_x = cur_y = -1
+        cur_fg = cur_bg = cur_attr = None
+
+        for i in range(len(ys_l)):
+            y, x = ys_l[i], xs_l[i]
+            fg, bg, attr = fgs[i], bgs[i], attrs[i]
+            cell: List[str] = []
+
+            # ── Cursor movement: pick the cheapest way to reach (x, y) ──
+            if y != cur_y or x < cur_x:
+                cell.append(f"{CSI}{y + 1};{x + 1}H")
+            elif x > cur_x:
+                gap = x - cur_x
+                move = f"{CSI}C" if gap == 1 else f"{CSI}{gap}C"
+                if gap < len(move) and self._can_reprint(
+                        b_glyph, b_fg, b_bg, b_attr, y, cur_x, x, cur_fg, cur_bg, cur_attr):
+                    cell.append("".join(map(chr, b_glyph[y, cur_x:x].tolist())))
+                else:
+                    cell.append(move)
+
+            # ── Colour state: only emit what changed ──
+            norm_attr = attr if attr in _ATTR_SGR else 0
+            new_fg, new_bg, new_attr = cur_fg, cur_bg, cur_attr
+            if norm_attr != cur_attr:
+                params = ["0"]
+                if norm_attr:
+                    params.append(_ATTR_SGR[norm_attr])
+                params.append(_fg_sgr(fg))
+                params.append(_bg_sgr(bg))
+                cell.append(f"{CSI}{';'.join(params)}m")
+                new_attr, new_fg, new_bg = norm_attr, fg, bg
+            elif fg != cur_fg or bg != cur_bg:
+                params = []
+                if fg != cur_fg:
+                    params.append(_fg_sgr(fg))
+                if bg != cur_bg:
+                    params.append(_bg_sgr(bg))
+                cell.append(f"{CSI}{';'.join(params)}m")
+                new_fg, new_bg = fg, bg
+
+            # Escapes and reprinted gaps are ASCII; only the glyph may be wider
+            g = glyphs[i]
+            cost = sum(map(len, cell)) + (1 if g < 0x80 else 2 if g < 0x800 else 3 if g < 0x10000 else 4)
+            if budget is not None and size + cost > budget:
+                break
+
+            out.extend(cell)
+            out.append(chr(g))
+            size += cost
+            count += 1
+            if narrow_glyphs(g):
+                cur_x, cur_y = x + 1, y
+            else:
+                # Wide or unknown width: don't guess where the terminal left
+                # the cursor, place the next cell with CUP
+                cur_x = cur_y = -1
+            cur_fg, cur_bg, cur_attr = new_fg, new_bg, new_attr
+
+        if count == 0:
+            return b"", 0
+        out.append(tail)
+        return "".join(out).encode("utf-8", "replace"), count
+
+    @staticmethod
+    def _can_reprint(glyph, fg, bg, attr, y, x0, x1, cur_fg, cur_bg, cur_attr) -> bool:
+        """
+        True if cells [x0, x1) are ASCII (so one column each, never wide)
+        and already in the current colour state.
+        """
+        if cur_attr is None:
+            return False
+        for x in range(x0, x1):
+            cell_attr = int(attr[y, x])
+            if (not 0 <= glyph[y, x] < 128 or fg[y, x] != cur_fg or bg[y, x] != cur_bg
+                    or (cell_attr if cell_attr in _ATTR_SGR else 0) != cur_attr):
+                return False
+        return True
+
+    def render(self, back: CellBuffer, max_bytes: Optional[int] = None,
+               priority: Optional[np.ndarray] = None) -> bytes:
+        """
+        Diff back against the front buffer and return the frame's bytes.
+
+        max_bytes caps the frame; priority is a screen-sized bool mask of
+        cells (UI text) to send before anything else when capped.
+        """
+        ys, xs = self.changed_cells(back)
+        if max_bytes is not None and ys.size:
+            ys, xs = self.budget_order(ys, xs, priority)
+        data, count = self.encode(back, ys, xs, max_bytes)
+
+        if count == ys.size:
+            self.front.copy_from(back, self.region)
+        else:
+            self.front.copy_cells(back, ys[:count], xs[:count])
+            self._resume_row = int(ys[count])
+        self.last_cells = count
+        self.last_deferred = int(ys.size) - count
+        return data
+
+    def flush(self, back: CellBuffer, max_bytes: Optional[int] = None,
+              priority: Optional[np.ndarray] = None) -> int:
+        """Render and write the frame in a single os.write. Returns bytes written."""
+        data = self.render(back, max_bytes, priority)
+        if data and self.fd is not None:
+            view = memoryview(data)
+            while view:
+                try:
+                    written = os.write(self.fd, view)
+                except InterruptedError:
+                    continue
+                except OSError:
+                    # Terminal went away mid-resize; repaint next time
+                    self.invalidate()
+                    break
+                view = view[written:]
+
+        self.frames += 1
+        self.last_bytes = len(data)
+        self.total_bytes += len(data)
+        return len(data)
+
+    @property
+    def avg_bytes_per_frame(self) -> float:
+        return self.total_bytes / self.frames if self.frames else 0.0
@@ -8,6 +8,8 @@ This module provides:
 - Double buffering (conceptual, via asciimatics)
 - Render layer system (background, particles, UI)
 - Performance profiling hooks
+- Per-call-site adaptive guards with tiered fallbacks
+- Output byte budgets for slow links
 - Dirty rectangle optimization
 
 Design Philosophy:
@@ -25,6 +27,7 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 from abc import ABC, abstractmethod
 from functools import wraps
+from collections import deque
 import statistics
 
 
@@ -46,6 +49,9 @@ class RenderStats:
     frame_times: List[float] = field(default_factory=list)
     layer_times: Dict[str, List[float]] = field(default_factory=dict)
     particle_counts: List[int] = field(default_factory=list)
+    guard_decisions: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    guard_last: Dict[str, str] = field(default_factory=dict)
+    output_bytes: Dict[str, List[int]] = field(default_factory=dict)
     dropped_frames: int = 0
     total_frames: int = 0
     
@@ -74,6 +80,19 @@ class RenderStats:
         if len(self.layer_times[layer_name]) > self.sample_window:
             self.layer_times[layer_name].pop(0)
     
+    def record_guard(self, site: str, tier: str):
+        """Record which tier a performance guard chose for a call site."""
+        counts = self.guard_decisions.setdefault(site, {})
+        counts[tier] = counts.get(tier, 0) + 1
+        self.guard_last[site] = tier
+    
+    def record_output(self, source: str, nbytes: int):
+        """Record bytes sent to the terminal this frame by an output path."""
+        samples = self.output_bytes.setdefault(source, [])
+        samples.append(nbytes)
+        if len(samples) > self.sample_window:
+            samples.pop(0)
+    
     @property
     def avg_frame_time(self) -> float:
         """Average frame time in ms."""
@@ -109,7 +128,16 @@ class RenderStats:
                 name: round(statistics.mean(times) * 1000, 2)
                 for name, times in self.layer_times.items()
                 if times
-            }
+            },
+            'bytes_per_frame': {
+                source: round(statistics.mean(samples), 0)
+                for source, samples in self.output_bytes.items()
+                if samples
+            },
+            'guards': {
+                site: {'last': self.guard_last.get(site), **counts}
+                for site, counts in self.guard_decisions.items()
+            },
         }
 
 
@@ -191,6 +219,79 @@ class FrameBudget:
         return frame_time
 
 
+class BandwidthBudget:
+    """
+    Output byte budget for slow links (SSH, serial).
+
+    Measures bytes written per second over a sliding window and turns a
+    bytes/second cap into a per-frame byte budget. When the link is
+    saturated (output deferred, or the window rate at the cap) the frame
+    rate steps down; with headroom it climbs back towards the target.
+    """
+
+    def __init__(self, max_bytes_per_sec: int, target_fps: float = 30.0,
+                 min_fps: float = 4.0, window_s: float = 1.0):
+        self.max_bytes_per_sec = max_bytes_per_sec
+        self.target_fps = target_fps
+        self.min_fps = min_fps
+        self.window_s = window_s
+        self.fps = target_fps
+
+        self._samples: deque = deque()  # (timestamp, nbytes)
+        self._window_bytes = 0
+
+        # Last frame, for the HUD
+        self.frame_bytes = 0
+        self.deferred_cells = 0
+        self.saturated = False
+
+    def frame_cap(self) -> int:
+        """Bytes one frame may write at the current frame rate."""
+        return int(self.max_bytes_per_sec / self.fps)
+
+    def frame_interval(self) -> float:
+        """Seconds between frames at the current frame rate."""
+        return 1.0 / self.fps
+
+    def record(self, nbytes: int, now: Optional[float] = None):
+        """Record bytes written to the terminal."""
+        now = time.monotonic() if now is None else now
+        self._samples.append((now, nbytes))
+        self._window_bytes += nbytes
+        self.frame_bytes = nbytes
+        self._expire(now)
+
+    def _expire(self, now: float):
+        while self._samples and now - self._samples[0][0] > self.window_s:
+            self._window_bytes -= self._samples.popleft()[1]
+
+    def bytes_per_sec(self, now: Optional[float] = None) -> float:
+        """Measured output rate over the window."""
+        self._expire(time.monotonic() if now is None else now)
+        return self._window_bytes / self.window_s
+
+    def end_frame(self, deferred_cells: int = 0, now: Optional[float] = None):
+        """Adapt the frame rate to how close the last frame ran to the cap."""
+        self.deferred_cells = deferred_cells
+        rate = self.bytes_per_sec(now)
+        self.saturated = deferred_cells > 0 or rate >= self.max_bytes_per_sec * 0.95
+        if self.saturated:
+            self.fps = max(self.min_fps, self.fps * 0.85)
+        elif rate < self.max_bytes_per_sec * 0.6:
+            self.fps = min(self.target_fps, self.fps + 0.5)
+
+    def get_report(self) -> Dict[str, Any]:
+        return {
+            'max_bytes_per_sec': self.max_bytes_per_sec,
+            'bytes_per_sec': round(self.bytes_per_sec(), 0),
+            'fps': round(self.fps, 1),
+            'frame_cap': self.frame_cap(),
+            'frame_bytes': self.frame_bytes,
+            'deferred_cells': self.deferred_cells,
+            'saturated': self.saturated,
+        }
+
+
 def profile_function(stats: RenderStats, layer_name: str):
     """Decorator to profile function execution time."""
     def decorator(func: Callable) -> Callable:
@@ -387,17 +488,162 @@ class RenderEngine:
             self.queue.add_text(x, y + i, line, 7, RenderLayer.DEBUG)
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# PERFORMANCE GUARDS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Tier names, richest first. A site may register any prefix of these plus SKIP.
+TIER_FULL = 'full'
+TIER_REDUCED = 'reduced'
+TIER_SKIP = 'skip'
+
+
+class GuardSite:
+    """
+    Guard state for a single call site.
+    
+    Keeps an exponential moving average of the cost (ms) of each tier
+    and counts how often each tier was chosen. Tiers are ordered from
+    richest to cheapest; SKIP is always available and costs nothing.
+    """
+    
+    def __init__(self, name: str, tiers: List[Tuple[str, Callable]],
+                 alpha: float = 0.2, decay: float = 0.98):
+        self.name = name
+        self.tiers = tiers
+        self.alpha = alpha
+        self.decay = decay
+        self.estimates: Dict[str, Optional[float]] = {t: None for t, _ in tiers}
+        self.decisions: Dict[str, int] = {t: 0 for t, _ in tiers}
+        self.decisions[TIER_SKIP] = 0
+        self.last_tier = TIER_FULL
+    
+    def choose(self, remaining_ms: float) -> Tuple[str, Optional[Callable]]:
+        """Pick the richest tier whose estimated cost fits in remaining_ms."""
+        chosen: Tuple[str, Optional[Callable]] = (TIER_SKIP, None)
+        for tier, func in self.tiers:
+            estimate = self.estimates[tier]
+            # Unmeasured tiers are tried optimistically so they get an estimate
+            if estimate is None or estimate <= remaining_ms:
+                chosen = (tier, func)
+                break
+        
+        # Tiers passed over drift cheaper so they are re-probed eventually
+        for tier, _ in self.tiers:
+            if tier == chosen[0]:
+                break
+            if self.estimates[tier] is not None:
+                self.estimates[tier] *= self.decay
+        
+        self.decisions[chosen[0]] += 1
+        self.last_tier = chosen[0]
+        return chosen
+    
+    def record(self, tier: str, elapsed_ms: float):
+        """Fold a measured cost into the tier's moving average."""
+        estimate = self.estimates.get(tier)
+        if estimate is None:
+            self.estimates[tier] = elapsed_ms
+        else:
+            self.estimates[tier] = estimate + self.alpha * (elapsed_ms - estimate)
+    
+    def get_report(self) -> Dict[str, Any]:
+        """Decision counts and current cost estimates for this site."""
+        return {
+            'last': self.last_tier,
+            'decisions': dict(self.decisions),
+            'cost_ms': {
+                tier: round(est, 2) for tier, est in self.estimates.items()
+                if est is not None
+            },
+        }
+
+
+class PerformanceGuard:
+    """
+    Adaptive per-call-site guard with tiered fallbacks.
+    
+    Each named site registers an ordered list of implementations
+    (full → reduced → skip). On every call the guard compares each
+    tier's moving-average cost with what is left of the FrameBudget
+    and runs the richest one that fits.
+    
+    Usage:
+        guard = PerformanceGuard(budget, stats)
+        guard.register('clouds', draw_clouds, reduced=draw_clouds_lowres)
+        guard.run('clouds')
+    """
+    
+    def __init__(self, budget: FrameBudget, stats: Optional[RenderStats] = None,
+                 headroom_ms: float = 1.0, alpha: float = 0.2):
+        self.budget = budget
+        self.stats = stats
+        self.headroom_ms = headroom_ms
+        self.alpha = alpha
+        self.sites: Dict[str, GuardSite] = {}
+    
+    def register(self, name: str, full: Callable,
+                 reduced: Optional[Callable] = None) -> GuardSite:
+        """Register (or replace the implementations of) a guarded site."""
+        tiers = [(TIER_FULL, full)]
+        if reduced is not None:
+            tiers.append((TIER_REDUCED, reduced))
+        
+        site = self.sites.get(name)
+        if site is None:
+            site = GuardSite(name, tiers, alpha=self.alpha)
+            self.sites[name] = site
+        else:
+            # Keep learned costs when only the callables change
+            site.tiers = tiers
+            for tier, _ in tiers:
+                site.estimates.setdefault(tier, None)
+                site.decisions.setdefault(tier, 0)
+        return site
+    
+    def run(self, name: str, *args, **kwargs) -> Any:
+        """Run the best-fitting tier for a registered site."""
+        site = self.sites[name]
+        remaining = self.budget.time_remaining_ms() - self.headroom_ms
+        tier, func = site.choose(remaining)
+        
+        if self.stats is not None:
+            self.stats.record_guard(name, tier)
+        if func is None:
+            return None
+        
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        site.record(tier, (time.perf_counter() - start) * 1000)
+        return result
+    
+    def guard(self, name: str, reduced: Optional[Callable] = None):
+        """Decorator form of register() + run()."""
+        def decorator(func: Callable) -> Callable:
+            self.register(name, func, reduced=reduced)
+            
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                return self.run(name, *args, **kwargs)
+            return wrapper
+        return decorator
+    
+    def get_report(self) -> Dict[str, Any]:
+        """Per-site decisions and cost estimates."""
+        return {name: site.get_report() for name, site in self.sites.items()}
+
+
 # Performance guard decorator
 def guard_performance(max_ms: float = 16.0, fallback: Callable = None):
     """
     Guard against functions taking too long.
     
     If execution exceeds max_ms, calls fallback instead next time.
+    Each decorated function keeps its own state. For budget-aware
+    tiered fallbacks use PerformanceGuard.
     """
-    skip_next = False
-    
     def decorator(func: Callable) -> Callable:
-        nonlocal skip_next
+        skip_next = False
         
         @wraps(func)
         def wrapper(*args, **kwargs):
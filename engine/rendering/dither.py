@@ -0,0 +1,65 @@
+"""
+Ordered Dithering
+=================
+Map a continuous field (fog density, haze, ...) to a few glyph levels
+without banding.
+
+Plain rounding turns a smooth gradient into hard contour lines of ░
+then ▒. Ordered dithering adds a fixed Bayer threshold per screen cell
+before truncating, so a density halfway between two levels comes out
+as an even checker of both. The thresholds are a small tiled matrix,
+so quantising any number of cells is a handful of array ops and the
+pattern stays put as the field drifts through it (no shimmer).
+
+"Fog isn't grey. It's white and nothing, argued over very
+patiently." - Stormy
+"""
+from __future__ import annotations
+from typing import Sequence
+
+import numpy as np
+
+
+def bayer_matrix(order: int) -> np.ndarray:
+    """2**order square Bayer threshold matrix, values evenly spaced in [0, 1)."""
+    m = np.zeros((1, 1), dtype=np.int64)
+    for _ in range(order):
+        m = np.block([[4 * m, 4 * m + 2], [4 * m + 3, 4 * m + 1]])
+    return (m + 0.5) / m.size
+
+
+BAYER_4 = bayer_matrix(2)
+
+
+def ordered_dither(values: np.ndarray, xs: np.ndarray, ys: np.ndarray, levels: int,
+                   matrix: np.ndarray = BAYER_4) -> np.ndarray:
+    """
+    Quantise values in [0, 1] at screen cells (xs, ys) to 0 .. levels - 1.
+
+    A value v lands on level floor(v * (levels - 1) + threshold), the
+    threshold taken from the matrix tiled over the screen.
+    """
+    n = matrix.shape[0]
+    threshold = matrix[ys % n, xs % n]
+    scaled = np.clip(values, 0.0, 1.0) * (levels - 1) + threshold
+    return np.minimum(scaled.astype(np.int32), levels - 1)
+
+
+class DitherRamp:
+    """A glyph ramp (level 0 first, usually blank) quantised by ordered dither."""
+
+    def __init__(self, glyphs: Sequence[str], matrix: np.ndarray = BAYER_4):
+        self.codes = np.array([ord(g) for g in glyphs], dtype=np.int32)
+        self.matrix = matrix
+
+    @property
+    def levels(self) -> int:
+        return int(self.codes.size)
+
+    def quantise(self, values: np.ndarray, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Level index per cell."""
+        return ordered_dither(values, xs, ys, self.levels, self.matrix)
+
+    def glyphs(self, levels: np.ndarray) -> np.ndarray:
+        """Glyph codepoints for level indices (one table lookup)."""
+        return self.codes[levels]
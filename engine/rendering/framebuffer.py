@@ -0,0 +1,210 @@
+"""
+Cell Framebuffer
+================
+NumPy-backed grid of terminal cells for direct output backends.
+
+A CellBuffer mimics the drawing half of an asciimatics Screen
+(print_at / clear_buffer / width / height), so existing draw code can
+target it unchanged. Each cell stores a glyph codepoint plus
+foreground, attribute and background, in parallel arrays that can be
+diffed against the previously emitted frame with array ops.
+
+Coordinates are screen coordinates; the buffer is screen-sized and an
+output backend chooses which region of it to emit.
+"""
+from __future__ import annotations
+from typing import Tuple
+
+import numpy as np
+
+
+SPACE = ord(" ")
+
+
+class CellBuffer:
+    """
+    Screen-sized cell grid with an asciimatics-compatible drawing API.
+
+    Arrays are indexed [y, x]:
+    - glyph: int32 Unicode codepoints (-1 = unknown, never equal to a real cell)
+    - fg, bg: int16 colour indices (-1 = terminal default)
+    - attr: uint8 asciimatics attribute (0/2 normal, 1 bold, 3 reverse, 4 underline)
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.glyph = np.full((height, width), SPACE, dtype=np.int32)
+        self.fg = np.full((height, width), 7, dtype=np.int16)
+        self.attr = np.zeros((height, width), dtype=np.uint8)
+        self.bg = np.zeros((height, width), dtype=np.int16)
+
+    def clear_buffer(self, fg: int, attr: int, bg: int,
+                     x: int = 0, y: int = 0, w: int = None, h: int = None):
+        """Fill a rectangle (default: everything) with blank cells."""
+        w = self.width if w is None else w
+        h = self.height if h is None else h
+        rows = slice(max(0, y), min(self.height, y + h))
+        cols = slice(max(0, x), min(self.width, x + w))
+        self.glyph[rows, cols] = SPACE
+        self.fg[rows, cols] = fg
+        self.attr[rows, cols] = attr
+        self.bg[rows, cols] = bg
+
+    def print_at(self, text: str, x: int, y: int, colour: int = 7,
+                 attr: int = 0, bg: int = 0, transparent: bool = False):
+        """Write text at (x, y), clipped to the buffer."""
+        if not text or not 0 <= y < self.height or x >= self.width:
+            return
+
+        if len(text) == 1:
+            # Fast path: most callers draw single glyphs
+            if x < 0 or (transparent and text == " "):
+                return
+            self.glyph[y, x] = ord(text)
+            self.fg[y, x] = colour
+            self.attr[y, x] = attr
+            self.bg[y, x] = bg
+            return
+
+        codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.int32)
+        if x < 0:
+            codes = codes[-x:]
+            x = 0
+        codes = codes[:self.width - x]
+        if codes.size == 0:
+            return
+
+        cols = slice(x, x + codes.size)
+        if transparent:
+            mask = codes != SPACE
+            self.glyph[y, cols][mask] = codes[mask]
+            self.fg[y, cols][mask] = colour
+            self.attr[y, cols][mask] = attr
+            self.bg[y, cols][mask] = bg
+        else:
+            self.glyph[y, cols] = codes
+            self.fg[y, cols] = colour
+            self.attr[y, cols] = attr
+            self.bg[y, cols] = bg
+
+    def put_cells(self, xs: np.ndarray, ys: np.ndarray, glyphs, colours,
+                  attr: int = 0, bg=0):
+        """
+        Scatter individual cells in one go (vectorized print_at).
+
+        xs/ys/glyphs are parallel arrays (glyphs as codepoints); colours
+        and bg may be arrays or scalars. Out-of-bounds cells are dropped.
+        Cells should be unique: with duplicate positions, which one lands
+        is unspecified.
+        """
+        keep = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        if not keep.all():
+            xs, ys = xs[keep], ys[keep]
+            glyphs = glyphs[keep]
+            if np.ndim(colours):
+                colours = colours[keep]
+            if np.ndim(bg):
+                bg = bg[keep]
+        self.glyph[ys, xs] = glyphs
+        self.fg[ys, xs] = colours
+        self.attr[ys, xs] = attr
+        self.bg[ys, xs] = bg
+
+    def get_cell(self, x: int, y: int) -> Tuple[str, int, int, int]:
+        """Return (char, fg, attr, bg) at (x, y)."""
+        return (chr(self.glyph[y, x]), int(self.fg[y, x]),
+                int(self.attr[y, x]), int(self.bg[y, x]))
+
+    def row_text(self, y: int, x: int = 0, w: int = None) -> str:
+        """Glyphs of one row as a string (handy for tests and screenshots)."""
+        w = self.width - x if w is None else w
+        return "".join(map(chr, self.glyph[y, x:x + w]))
+
+    def copy_from(self, other: 'CellBuffer', region: Tuple[int, int, int, int] = None):
+        """Copy cells from another same-sized buffer, optionally only a region."""
+        x, y, w, h = region or (0, 0, self.width, self.height)
+        rows, cols = slice(y, y + h), slice(x, x + w)
+        self.glyph[rows, cols] = other.glyph[rows, cols]
+        self.fg[rows, cols] = other.fg[rows, cols]
+        self.attr[rows, cols] = other.attr[rows, cols]
+        self.bg[rows, cols] = other.bg[rows, cols]
+
+    def copy_cells(self, other: 'CellBuffer', ys: np.ndarray, xs: np.ndarray):
+        """Copy individual cells (parallel index arrays) from another buffer."""
+        self.glyph[ys, xs] = other.glyph[ys, xs]
+        self.fg[ys, xs] = other.fg[ys, xs]
+        self.attr[ys, xs] = other.attr[ys, xs]
+        self.bg[ys, xs] = other.bg[ys, xs]
+
+
+def narrow_glyphs(glyphs):
+    """
+    True where a codepoint is known to be one column wide: Latin and
+    other scripts below U+1100, box drawing, blocks and geometric shapes
+    (U+2500-U+25FF), braille (U+2800-U+28FF). The symbols and dingbats
+    in between (☁ ❄ ⚡ ...) are often drawn two columns wide, so they
+    don't count. Works on arrays and on single ints.
+    """
+    return ((glyphs < 0x1100) | ((glyphs >= 0x2500) & (glyphs < 0x2600))
+            | ((glyphs >= 0x2800) & (glyphs < 0x2900)))
+
+
+def blit_cells(target, xs: np.ndarray, ys: np.ndarray, glyphs: np.ndarray,
+               colours, attr: int = 0, bg=0):
+    """
+    Draw a batch of cells on any drawing target.
+
+    A CellBuffer takes the whole batch with array ops; anything else (the
+    asciimatics Screen) gets one print_at per run of cells that follow
+    each other along a row in the same colours, in batch order, so area
+    fills (fog, aurora curtains) cost a print per run, not per cell.
+    """
+    if isinstance(target, CellBuffer):
+        target.put_cells(xs, ys, glyphs, colours, attr, bg)
+        return
+    if xs.size == 0:
+        return
+    colours = np.broadcast_to(colours, xs.shape)
+    bgs = np.broadcast_to(bg, xs.shape)
+    # Only join glyphs known to be one column wide; anything else keeps a print of its own
+    narrow = narrow_glyphs(glyphs)
+    joins = ((xs[1:] == xs[:-1] + 1) & (ys[1:] == ys[:-1])
+             & (colours[1:] == colours[:-1]) & (bgs[1:] == bgs[:-1])
+             & narrow[1:] & narrow[:-1])
+    starts = np.flatnonzero(np.concatenate(([True], ~joins)))
+    ends = np.append(starts[1:], xs.size).tolist()
+    chars = "".join(map(chr, glyphs.tolist()))
+    runs = zip(starts.tolist(), ends, xs[starts].tolist(), ys[starts].tolist(),
+               colours[starts].tolist(), bgs[starts].tolist())
+    for start, end, x, y, colour, b in runs:
+        target.print_at(chars[start:end], x, y, colour=colour, attr=attr, bg=b)
+
+
+def rasterize_cells(xs: np.ndarray, ys: np.ndarray, priority: np.ndarray,
+                    left: int, top: int, width: int, height: int,
+                    weights=None) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Resolve a batch of points to one winner per screen cell.
+
+    Positions are floored to cells and culled to the width x height area
+    at (left, top); where several points share a cell the one with the
+    highest priority wins (ties go to the later point). All in one sort,
+    no per-point Python.
+
+    Returns (winners, cell_xs, cell_ys, density): indices into the input
+    of the winning points, their cells, and how many points landed in
+    each of those cells (summing weights per point instead, if given, so
+    e.g. trail points can be left out of the count).
+    """
+    cx = np.floor(np.asarray(xs, dtype=np.float64)).astype(np.intp)
+    cy = np.floor(np.asarray(ys, dtype=np.float64)).astype(np.intp)
+    idx = np.flatnonzero((cx >= left) & (cx < left + width) & (cy >= top) & (cy < top + height))
+    cell = (cy[idx] - top) * width + (cx[idx] - left)
+    order = np.lexsort((idx, np.asarray(priority)[idx], cell))
+    cell = cell[order]
+    last = np.flatnonzero(np.diff(cell, append=-1))  # Last point of each cell's run
+    winners = idx[order[last]]
+    w = None if weights is None else np.broadcast_to(weights, cx.shape)[idx]
+    density = np.bincount(cell, weights=None if w is None else w[order], minlength=width * height)
+    return winners, cx[winners], cy[winners], density[cell[last]]
@@ -0,0 +1,42 @@
+"""
+Quality Profiles
+================
+Static detail knobs chosen at startup with --quality.
+
+The FrameBudget and PerformanceGuard adapt per frame to how long the
+frame is taking; a QualityProfile is the fixed ceiling they work
+under: how fine the simulation grids are, how many iterations the
+solvers get, how long particle trails are and how many scrolling rain
+sheets fill in behind the simulated rain. Low suits a Raspberry Pi or a
+shared box, high a desktop terminal with cycles to spare.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+
+@dataclass(frozen=True)
+class QualityProfile:
+    """One level of simulation detail."""
+    name: str
+    wind_cell: Tuple[int, int]    # Terminal (columns, rows) per wind-field cell
+    wind_iterations: int          # Jacobi sweeps per pressure projection
+    wind_max_cells: int           # Hard cap on the wind grid, whatever the pane size
+    trail_length: int             # Motion-trail points kept per precipitation particle
+    sheet_layers: int             # Scrolling background rain sheets (parallax layers)
+    sheet_density: float          # Fraction of sheet cells holding a drop, per layer, in heavy rain
+
+
+QUALITY_PROFILES: Dict[str, QualityProfile] = {
+    'low': QualityProfile('low', wind_cell=(8, 4), wind_iterations=6, wind_max_cells=512,
+                          trail_length=1, sheet_layers=1, sheet_density=0.025),
+    'medium': QualityProfile('medium', wind_cell=(4, 2), wind_iterations=10, wind_max_cells=1024,
+                             trail_length=3, sheet_layers=2, sheet_density=0.03),
+    'high': QualityProfile('high', wind_cell=(2, 1), wind_iterations=16, wind_max_cells=2048,
+                           trail_length=5, sheet_layers=3, sheet_density=0.035),
+}
+
+
+def get_quality(name: str) -> QualityProfile:
+    """The named profile; unknown names fall back to medium."""
+    return QUALITY_PROFILES.get(name, QUALITY_PROFILES['medium'])
@@ -0,0 +1,250 @@
+"""
+Frame Scheduling
+================
+Decides how often the main loop ticks.
+
+A clear sky with a few drifting motes does not need 30 frames a
+second. The IdleScheduler watches an activity estimate (roughly, the
+fraction of the animation pane that changes per frame) and drops to a
+low tick rate once the scene has been quiet for a while. Any key press
+or weather change wakes it straight back to the full rate.
+
+It also keeps a CPU meter: process CPU seconds spent per wall-clock
+minute, the number that matters for a dashboard left open in a tmux
+pane all day.
+
+Idle ticks are further apart, not slower: sim_frames() says how many
+frames of simulation a tick covers (active_fps / idle_fps when idle),
+so drifting clouds and motes cross the pane at the same speed at
+either rate, just in larger steps.
+
+Within a tick, the LodScheduler decides which subsystems update at all:
+cloud feeds, evaporation or creature spawn rolls don't need every
+frame, so each declares how often it runs and catches up on the frames
+it skipped. Their turns are staggered so they don't all land on the
+same frame.
+"""
+from __future__ import annotations
+import math
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+
+class CpuMeter:
+    """Process CPU time per wall-clock minute over a sliding window."""
+
+    def __init__(self, window_s: float = 60.0):
+        self.window_s = window_s
+        self._samples: deque = deque()  # (wall, cpu)
+
+    def sample(self, wall: Optional[float] = None, cpu: Optional[float] = None):
+        wall = time.monotonic() if wall is None else wall
+        cpu = time.process_time() if cpu is None else cpu
+        self._samples.append((wall, cpu))
+        # Keep one sample older than the window as the baseline
+        while len(self._samples) > 2 and wall - self._samples[1][0] >= self.window_s:
+            self._samples.popleft()
+
+    def cpu_seconds_per_minute(self) -> float:
+        if len(self._samples) < 2:
+            return 0.0
+        (w0, c0), (w1, c1) = self._samples[0], self._samples[-1]
+        if w1 <= w0:
+            return 0.0
+        return (c1 - c0) / (w1 - w0) * 60.0
+
+
+class IdleScheduler:
+    """
+    Picks the tick interval from how much of the scene is changing.
+
+    observe() takes the activity estimate for the frame just simulated
+    (fraction of pane cells expected to change, >= 1.0 meaning "something
+    is happening, stay awake"). After quiet_frames consecutive ticks below
+    quiet_threshold the scheduler goes idle and ticks at idle_fps; wake()
+    or a frame above quiet_threshold * wake_factor restores active_fps.
+    The gap between the two thresholds keeps a scene that hovers around
+    the line from flapping between rates.
+    """
+
+    def __init__(self, active_fps: float = 30.0, idle_fps: float = 8.0,
+                 quiet_threshold: float = 0.12, quiet_frames: int = 45,
+                 wake_factor: float = 1.5):
+        self.active_fps = active_fps
+        self.idle_fps = idle_fps
+        self.quiet_threshold = quiet_threshold
+        self.quiet_frames = quiet_frames
+        self.wake_factor = wake_factor
+
+        self.activity = 0.0
+        self.idle = False
+        self._quiet_run = 0
+        self._frame_carry = 0.0
+        self.wakeups = 0
+        self.cpu = CpuMeter()
+
+    def observe(self, activity: float):
+        """Feed the activity estimate for the current frame."""
+        self.activity = activity
+        self.cpu.sample()
+        if self.idle:
+            if activity >= self.quiet_threshold * self.wake_factor:
+                self.wake()
+            return
+        if activity >= self.quiet_threshold:
+            self._quiet_run = 0
+            return
+        self._quiet_run += 1
+        if self._quiet_run >= self.quiet_frames:
+            self.idle = True
+
+    def wake(self):
+        """Something the user will notice happened: back to full rate now."""
+        if self.idle:
+            self.wakeups += 1
+        self.idle = False
+        self._quiet_run = 0
+
+    @property
+    def tick_rate(self) -> float:
+        return self.idle_fps if self.idle else self.active_fps
+
+    def tick_interval(self) -> float:
+        """Seconds to wait for input before the next tick."""
+        return 1.0 / self.tick_rate
+
+    def sim_frames(self) -> int:
+        """
+        Simulation frames the coming tick should advance: 1 when active,
+        active_fps / idle_fps when idle, the fraction carried over to the
+        next tick so the long-run speed is exact.
+        """
+        if not self.idle:
+            self._frame_carry = 0.0
+            return 1
+        self._frame_carry += self.active_fps / self.idle_fps
+        frames = int(self._frame_carry)
+        self._frame_carry -= frames
+        return frames
+
+    def get_report(self) -> Dict[str, Any]:
+        return {
+            'tick_rate': self.tick_rate,
+            'idle': self.idle,
+            'activity': round(self.activity, 3),
+            'wakeups': self.wakeups,
+            'cpu_s_per_min': round(self.cpu.cpu_seconds_per_minute(), 2),
+        }
+
+
+class LodTask:
+    """One subsystem on the LOD schedule: runs on frames where (frame - phase) % every == 0."""
+
+    def __init__(self, name: str, func: Callable, every: int, phase: int, cost: float,
+                 alpha: float = 0.2):
+        self.name = name
+        self.func = func
+        self.every = every
+        self.phase = phase
+        self.cost = cost  # Relative cost hint, used to stagger phases
+        self.alpha = alpha
+        self.runs = 0
+        self.last_frame: Optional[int] = None
+        self.cost_ms = 0.0   # Moving average of measured run time
+        self.rate_hz = 0.0   # Moving average of runs per wall-clock second
+        self._last_time: Optional[float] = None
+
+    def due(self, frame: int, frames: int = 1) -> bool:
+        """True if one of its turns falls in the frames frames ending at frame."""
+        return (frame - self.phase) % self.every < frames
+
+    def record(self, frame: int, start: float, end: float):
+        """Fold a run's cost and the time since the previous run into the averages."""
+        self.runs += 1
+        self.last_frame = frame
+        elapsed_ms = (end - start) * 1000
+        self.cost_ms += self.alpha * (elapsed_ms - self.cost_ms)
+        if self._last_time is not None and start > self._last_time:
+            rate = 1.0 / (start - self._last_time)
+            self.rate_hz = rate if self.runs == 2 else self.rate_hz + self.alpha * (rate - self.rate_hz)
+        self._last_time = start
+
+    def get_report(self) -> Dict[str, Any]:
+        return {
+            'every': self.every,
+            'phase': self.phase,
+            'runs': self.runs,
+            'rate_hz': round(self.rate_hz, 1),
+            'cost_ms': round(self.cost_ms, 3),
+        }
+
+
+class LodScheduler:
+    """
+    Level-of-detail update rates for subsystems that don't need every frame.
+
+    Each subsystem registers with the number of frames between updates
+    (every) and a rough relative cost. It is given the phase where the
+    work already scheduled on the same frames is lightest, so a task
+    every 2 frames and one every 10 don't stack on the same frame when
+    they could alternate. run() calls a task only on its frames, passing
+    how many frames have passed since its last run so it can catch up
+    (scale a feed rate, roll frames' worth of dice, step further).
+    Phases depend only on the declared rates and costs, so a seeded run
+    replays exactly.
+
+    Usage:
+        lod = LodScheduler()
+        lod.register('ground', lambda frames: ground.evaporate(frames=frames), every=10)
+        lod.tick()          # once per frame (tick(n) for a step covering n frames)
+        lod.run('ground')
+    """
+
+    def __init__(self):
+        self.frame = 0
+        self.step = 1  # Frames covered by the current tick
+        self.tasks: Dict[str, LodTask] = {}
+
+    def _load(self, every: int, phase: int) -> float:
+        """Cost already scheduled on the frames a (every, phase) task would run on."""
+        load = 0.0
+        for task in self.tasks.values():
+            common = math.gcd(every, task.every)
+            if (phase - task.phase) % common == 0:
+                # Share of our frames that task also runs on
+                load += task.cost * common / task.every
+        return load
+
+    def register(self, name: str, func: Callable, every: int = 1, cost: float = 1.0) -> LodTask:
+        """Schedule func(frames, ...) every N frames, staggered against the other tasks."""
+        every = max(1, int(every))
+        self.tasks.pop(name, None)
+        phase = min(range(every), key=lambda p: (self._load(every, p), p))
+        task = self.tasks[name] = LodTask(name, func, every, phase, cost)
+        return task
+
+    def tick(self, frames: int = 1):
+        """Advance by frames frames (more than one when the main loop ticks slower)."""
+        self.frame += frames
+        self.step = frames
+
+    def run(self, name: str, *args, **kwargs) -> Any:
+        """Run a task if one of its turns fell in this tick (else return None)."""
+        task = self.tasks[name]
+        if not task.due(self.frame, self.step):
+            return None
+        frames = task.every if task.last_frame is None else self.frame - task.last_frame
+        start = time.perf_counter()
+        result = task.func(frames, *args, **kwargs)
+        task.record(self.frame, start, time.perf_counter())
+        return result
+
+    def since(self, name: str) -> int:
+        """Frames since a task last ran (0 on its own frame, for extrapolating in between)."""
+        task = self.tasks[name]
+        return 0 if task.last_frame is None else self.frame - task.last_frame
+
+    def get_report(self) -> Dict[str, Any]:
+        """Per-task rate (frames between runs and measured Hz), phase and cost."""
+        return {name: task.get_report() for name, task in self.tasks.items()}
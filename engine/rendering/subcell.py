@@ -0,0 +1,95 @@
+"""
+Sub-Cell Rasterizer
+===================
+Pack point positions into the dots of a terminal cell: 2x4 braille
+dots (U+2800-U+28FF) or a top/bottom half-block (▀ ▄ █).
+
+With one glyph per cell, every particle that lands in an occupied cell
+is simulated for nothing. Braille gives eight addressable dots per
+cell and half-blocks two, so the same particles show as distinct
+points. Rasterizing is all array work: positions are scaled to the
+dot grid, each dot becomes one bit of its cell's glyph, duplicate dots
+are dropped with np.unique and a cell's bits are OR-ed together as a
+weighted bincount. The cost is a few passes over the points, however
+many share a cell.
+
+Half-blocks also serve as a double-vertical-resolution mask: sample a
+field at the top and bottom of each cell and pick the glyph from the
+two bits (see half_block_codes).
+
+"Eight raindrops in one character. Finally, a cell that gets me." - Stormy
+"""
+from __future__ import annotations
+from typing import Tuple
+
+import numpy as np
+
+BRAILLE_BASE = 0x2800
+
+# Bit for the dot at (row, column) within a braille cell (Unicode dot order 1-8)
+BRAILLE_BITS = np.array([
+    [0x01, 0x08],
+    [0x02, 0x10],
+    [0x04, 0x20],
+    [0x40, 0x80],
+], dtype=np.int32)
+
+# Glyph for the half-block bits (1 = top half, 2 = bottom half)
+HALF_BLOCK_CODES = np.array([ord(c) for c in " ▀▄█"], dtype=np.int32)
+
+SUBCELL_MODES = ('glyph', 'braille', 'halfblock')
+
+
+def _pack(xs: np.ndarray, ys: np.ndarray, cols: int, rows: int,
+          width: int, height: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Dot indices for points on a (cols x rows) dot grid per cell.
+
+    Returns (cell, dot, keep) for the points inside the width x
+    height cell area, cell being a flat row-major index.
+    """
+    dx = np.floor(np.asarray(xs, dtype=np.float64) * cols).astype(np.intp)
+    dy = np.floor(np.asarray(ys, dtype=np.float64) * rows).astype(np.intp)
+    keep = (dx >= 0) & (dx < width * cols) & (dy >= 0) & (dy < height * rows)
+    dx, dy = dx[keep], dy[keep]
+    cell = (dy // rows) * width + dx // cols
+    sub = (dy % rows) * cols + dx % cols
+    return cell, sub, keep
+
+
+def rasterize_points(xs: np.ndarray, ys: np.ndarray, width: int, height: int,
+                     mode: str = 'braille', colours=None) -> Tuple[np.ndarray, ...]:
+    """
+    Rasterize points in cell coordinates into sub-cell glyphs.
+
+    xs, ys are float positions relative to the area's top-left cell;
+    points outside width x height are dropped. mode is 'braille' (2x4
+    dots per cell) or 'halfblock' (1x2). colours, if given (one per
+    point), colour each cell by the last point drawn into it, so pass
+    higher-priority points last.
+
+    Returns (cell_xs, cell_ys, codes, colours, dots), where dots is the
+    number of distinct dots lit; colours is None when none were given.
+    """
+    if mode == 'braille':
+        cols, rows, bits, table = 2, 4, BRAILLE_BITS.ravel(), None
+    else:
+        cols, rows, bits, table = 1, 2, np.array([1, 2], dtype=np.int32), HALF_BLOCK_CODES
+    cell, sub, keep = _pack(xs, ys, cols, rows, width, height)
+    # Distinct dots, then OR per cell: distinct bits of one cell sum without carries
+    dots = np.unique(cell * 8 + sub)
+    combined = np.bincount(dots // 8, weights=bits[dots % 8], minlength=width * height)
+    lit = np.flatnonzero(combined)
+    combined = combined[lit].astype(np.int32)
+    codes = BRAILLE_BASE + combined if table is None else table[combined]
+    cell_colours = None
+    if colours is not None:
+        per_cell = np.zeros(width * height, dtype=np.int32)
+        per_cell[cell] = np.broadcast_to(colours, keep.shape)[keep]
+        cell_colours = per_cell[lit]
+    return lit % width, lit // width, codes, cell_colours, int(dots.size)
+
+
+def half_block_codes(top: np.ndarray, bottom: np.ndarray) -> np.ndarray:
+    """Glyph per cell from top-half and bottom-half masks (' ' where neither)."""
+    return HALF_BLOCK_CODES[top.astype(np.intp) | (bottom.astype(np.intp) << 1)]
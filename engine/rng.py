@@ -0,0 +1,126 @@
+"""
+Random Streams
+==============
+One seeded random generator per subsystem, so a run can be replayed and
+one subsystem's draws never shift another's.
+
+Everything used to share the global `random` module: a creature spawn
+or an extra raindrop changed every later draw, and anything that
+called random.seed() reset everyone else. A RandomStream owns a NumPy
+Generator for bulk draws (stream.generator.random(n), .uniform, ...)
+and hands out scalars from a buffer of uniforms refilled a few
+thousand at a time, through the same names the `random` module uses
+(random, uniform, randint, randrange, choice, shuffle), so call sites
+swap `random.` for their stream and nothing else.
+
+Streams are named ('spawner', 'effects', 'lightning', ...) and each is
+seeded from the run's seed plus its name, so a stream's sequence does
+not depend on which other streams exist or in what order they were
+created. reseed() restarts every stream in place, which is what a
+benchmark run wants.
+
+"Chaos is just order nobody wrote down. So write it down." - Stormy
+"""
+from __future__ import annotations
+import zlib
+from typing import Dict, List, MutableSequence, Optional, Sequence, TypeVar
+
+import numpy as np
+
+T = TypeVar('T')
+
+
+class RandomStream:
+    """
+    A seeded generator with a cheap scalar API.
+
+    Scalars come from a pre-drawn list of uniforms (next() on a list
+    iterator, so a refill racing another thread at worst draws a fresh
+    buffer twice). Bulk draws go straight to the Generator.
+    """
+
+    def __init__(self, seed=None, buffer_size: int = 4096):
+        self.buffer_size = buffer_size
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        """
+        Restart the stream (seed: int, SeedSequence or None for fresh entropy).
+
+        The Generator object is kept and its state replaced, so anything
+        holding stream.generator (a WindField, a worker) follows along.
+        """
+        if getattr(self, 'generator', None) is None:
+            self.generator = np.random.default_rng(seed)
+        else:
+            self.generator.bit_generator.state = np.random.PCG64(seed).state
+        self._values = iter(())
+
+    def random(self) -> float:
+        """Uniform float in [0, 1)."""
+        try:
+            return next(self._values)
+        except StopIteration:
+            self._values = iter(self.generator.random(self.buffer_size).tolist())
+            return next(self._values)
+
+    def uniform(self, a: float, b: float) -> float:
+        return a + (b - a) * self.random()
+
+    def randint(self, a: int, b: int) -> int:
+        """Integer in [a, b], both ends included (like random.randint)."""
+        return a + int(self.random() * (b - a + 1))
+
+    def randrange(self, n: int) -> int:
+        return int(self.random() * n)
+
+    def choice(self, seq: Sequence[T]) -> T:
+        return seq[int(self.random() * len(seq))]
+
+    def shuffle(self, items: MutableSequence):
+        """Shuffle in place (Fisher-Yates)."""
+        for i in range(len(items) - 1, 0, -1):
+            j = int(self.random() * (i + 1))
+            items[i], items[j] = items[j], items[i]
+
+
+class RandomStreams:
+    """Named RandomStreams derived from one run seed."""
+
+    def __init__(self, seed: Optional[int] = None):
+        self._streams: Dict[str, RandomStream] = {}
+        self.reseed(seed)
+
+    def _seed_for(self, name: str) -> np.random.SeedSequence:
+        return np.random.SeedSequence(self.entropy, spawn_key=(zlib.crc32(name.encode()),))
+
+    def get(self, name: str) -> RandomStream:
+        """The stream for a subsystem, created on first use."""
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = self._streams[name] = RandomStream(self._seed_for(name))
+        return stream
+
+    def reseed(self, seed: Optional[int] = None):
+        """Restart every stream from a new run seed (None = fresh entropy)."""
+        self.seed = seed
+        self.entropy = np.random.SeedSequence(seed).entropy
+        for name, stream in self._streams.items():
+            stream.reseed(self._seed_for(name))
+
+    def names(self) -> List[str]:
+        return sorted(self._streams)
+
+
+# Process-wide streams: modules take theirs at import, main() reseeds for --seed
+STREAMS = RandomStreams()
+
+
+def stream(name: str) -> RandomStream:
+    """Shortcut for STREAMS.get(name)."""
+    return STREAMS.get(name)
+
+
+def reseed(seed: Optional[int] = None):
+    """Shortcut for STREAMS.reseed(seed)."""
+    STREAMS.reseed(seed)
@@ -11,6 +11,7 @@ import os
 import math
 import time
 import pytest
+import numpy as np
 from unittest.mock import Mock, MagicMock
 
 # Add parent to path for imports
@@ -31,9 +32,21 @@ from engine.personality.core import (
     PersonalityEngine, MoodStateMachine, Memory, Mood,
     PersonalityConfig, DialogueBank
 )
+from engine.physics.ground import GroundField, RippleSurface
+from engine.physics.fluid import WindField
 from engine.rendering.core import (
-    RenderStats, FrameBudget, RenderQueue, RenderCommand, RenderLayer
+    RenderStats, FrameBudget, RenderQueue, RenderCommand, RenderLayer,
+    PerformanceGuard, guard_performance, TIER_FULL, TIER_REDUCED, TIER_SKIP,
+    BandwidthBudget
 )
+from engine.rendering.framebuffer import CellBuffer, blit_cells, rasterize_cells
+from engine.rendering.ansi import AnsiWriter, SYNC_BEGIN, SYNC_END
+from engine.rendering.scheduler import IdleScheduler, CpuMeter, LodScheduler
+from engine.rendering.occupancy import OccupancyMask
+from engine.rendering.quality import QUALITY_PROFILES, get_quality
+from engine.rendering.dither import DitherRamp, bayer_matrix, ordered_dither
+from engine.rendering.subcell import rasterize_points, half_block_codes
+from engine.rng import RandomStream, RandomStreams
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -315,6 +328,149 @@ class TestAtmosphericModel:
 # PERSONALITY TESTS
 # ═══════════════════════════════════════════════════════════════════════════════
 
+class TestGroundField:
+    """Test the ground accumulation height field."""
+    
+    def test_deposit_bins_columns_and_caps(self):
+        ground = GroundField(5, max_height=1.0)
+        ground.deposit([1, 1, 3, 7, -1], amount=0.25)
+        assert ground.heights.tolist() == [0.0, 0.5, 0.0, 0.25, 0.0]
+        ground.deposit([1] * 10, amount=0.25)
+        assert ground.heights[1] == 1.0
+    
+    def test_evaporate_never_goes_negative(self):
+        ground = GroundField(50, rng=np.random.default_rng(0))
+        ground.heights[:] = 0.05
+        ground.evaporate(chance=1.0, amount=0.1)
+        assert (ground.heights == 0.0).all()
+    
+    def test_evaporate_several_frames_at_once(self):
+        ground = GroundField(10, rng=np.random.default_rng(0))
+        ground.heights[:] = 1.0
+        ground.evaporate(chance=1.0, amount=0.1, frames=3)
+        assert ground.heights == pytest.approx(np.full(10, 0.7))
+        ground.evaporate(chance=0.0, frames=10)
+        assert ground.heights == pytest.approx(np.full(10, 0.7))
+    
+    def test_slump_conserves_mass_and_respects_repose(self):
+        ground = GroundField(9, max_height=10.0, repose=1.0, flow=0.5)
+        ground.heights[4] = 8.0
+        ground.slump(passes=200)
+        assert ground.heights.sum() == pytest.approx(8.0)
+        assert np.abs(np.diff(ground.heights)).max() <= 1.0 + 1e-6
+        assert (ground.heights >= 0).all()
+    
+    def test_wind_pushes_drifts_downwind(self):
+        calm = GroundField(21, max_height=10.0)
+        windy = GroundField(21, max_height=10.0)
+        for ground in (calm, windy):
+            ground.heights[10] = 6.0
+        calm.slump(passes=50)
+        windy.slump(wind=0.8, passes=50)
+        centre = lambda g: (g.heights * np.arange(21)).sum() / g.heights.sum()
+        assert centre(calm) == pytest.approx(10.0)
+        assert centre(windy) > 10.0
+    
+    def test_resize_resamples(self):
+        ground = GroundField(4)
+        ground.heights[:] = [1.0, 2.0, 3.0, 4.0]
+        ground.resize(8)
+        assert ground.heights.tolist() == [1.0, 1.0, 2.0, 2.0, 3.0, 3.0, 4.0, 4.0]
+
+
+class TestRippleSurface:
+    """Test the puddle ripple wave surface."""
+    
+    def test_ripple_spreads_both_ways_and_settles(self):
+        surface = RippleSurface(41)
+        surface.splash([20, 20])
+        assert surface.u[20] == pytest.approx(-2 * surface.impulse)
+        for _ in range(6):
+            surface.step()
+        assert surface.u[17] != 0.0 and surface.u[23] == pytest.approx(surface.u[17])
+        for _ in range(300):
+            surface.step()
+        assert np.abs(surface.u).max() < 0.05
+    
+    def test_dry_columns_stay_flat(self):
+        surface = RippleSurface(20)
+        wet = np.zeros(20, dtype=bool)
+        wet[5:10] = True
+        surface.splash([7, 15])
+        for _ in range(20):
+            surface.step(wet)
+        assert (surface.u[~wet] == 0.0).all()
+    
+    def test_shade_only_moves_puddles(self):
+        surface = RippleSurface(4)
+        surface.u[:] = [2.0, -2.0, 0.4, 3.0]
+        levels = np.array([2, 2, 0, 3])
+        assert surface.shade(levels, 4).tolist() == [4, 1, 0, 4]
+
+
+class TestWindField:
+    """Test the coarse stable-fluids wind field."""
+    
+    def _divergence(self, field):
+        pad = field._padded(field.u / field.cx)
+        div = pad[1:-1, 2:] - pad[1:-1, :-2]
+        pad = field._padded(field.v / field.cy)
+        pad[0] = pad[-1] = 0.0
+        return div + pad[2:, 1:-1] - pad[:-2, 1:-1]
+    
+    def test_relaxes_to_uniform_mean_wind(self):
+        field = WindField(40, 20, cell=(4, 2), stir=0.0)
+        field.set_wind(0.3, 0.0)
+        for _ in range(200):
+            field.step()
+        assert field.u == pytest.approx(np.full(field.shape, 0.3), abs=1e-3)
+        assert np.abs(field.v).max() < 1e-3
+    
+    def test_gust_becomes_divergence_free_eddies(self):
+        field = WindField(40, 20, cell=(4, 2), stir=0.0, iterations=30)
+        field.gust(20, 10, 0.0, 1.0, radius=4)
+        before = np.abs(self._divergence(field)).mean()
+        field.step()
+        assert np.abs(self._divergence(field)).mean() < before * 0.5
+        # Air pushed down towards the ground has to turn aside both ways
+        assert field.u.max() > 0.05 and field.u.min() < -0.05
+    
+    def test_density_is_carried_downwind(self):
+        field = WindField(40, 20, cell=(4, 2), stir=0.0, viscosity=0.0)
+        field.set_wind(1.0, 0.0)
+        field.resize(40, 20)  # Start the flow at the mean wind
+        blob = field.density('cloud')
+        blob[:, 2] = 1.0
+        for _ in range(8):
+            field.step()
+        centre = (field.density('cloud').sum(axis=0) * np.arange(field.shape[1])).sum() \
+            / field.density('cloud').sum()
+        assert centre == pytest.approx(4.0, abs=0.3)  # 8 cells at 1 cell/frame = 2 grid cells
+    
+    def test_sample_is_bilinear_and_wraps(self):
+        field = WindField(40, 20, cell=(4, 2))
+        field.u[:] = 0.0
+        field.u[:, 0] = 1.0
+        xs, ys = field.centres()
+        u, _ = field.sample([xs[3, 0], xs[3, 0] + 2.0, 0.0], [ys[3, 0]] * 3)
+        assert u.tolist() == pytest.approx([1.0, 0.5, 0.5])
+    
+    def test_grid_capped_by_max_cells(self):
+        field = WindField(200, 60, cell=(1, 1), max_cells=500)
+        gh, gw = field.shape
+        assert gh * gw <= 500
+        field.density('fog', 0.5)
+        field.resize(100, 30)
+        assert field.density('fog').shape == field.shape
+        assert (field.density('fog') == 0.5).all()
+    
+    def test_quality_profiles(self):
+        assert get_quality('high').wind_cell < get_quality('low').wind_cell
+        assert get_quality('nonsense') is QUALITY_PROFILES['medium']
+        assert get_quality('low').trail_length < get_quality('high').trail_length
+        assert get_quality('low').sheet_layers < get_quality('high').sheet_layers
+
+
 class TestPersonalityEngine:
     """Test personality system."""
     
@@ -436,6 +592,76 @@ class TestFrameBudget:
         assert budget.quality_level < initial_quality
 
 
+class TestPerformanceGuard:
+    """Test per-call-site adaptive guards."""
+    
+    def test_decorator_state_is_per_function(self):
+        """Functions decorated by one factory must not share skip state."""
+        calls = []
+        guard = guard_performance(max_ms=0.0, fallback=lambda: calls.append('fallback'))
+        
+        @guard
+        def slow():
+            calls.append('slow')
+            time.sleep(0.001)
+        
+        @guard
+        def fast():
+            calls.append('fast')
+        
+        slow()   # Over budget: slow's next call falls back
+        fast()   # Unaffected by slow's overrun
+        slow()
+        
+        assert calls == ['slow', 'fast', 'fallback']
+    
+    def test_tier_chosen_against_remaining_budget(self):
+        """Reduced tier should run once full is known to exceed the budget."""
+        budget = FrameBudget(target_fps=30)
+        guard = PerformanceGuard(budget, headroom_ms=0.0)
+        ran = []
+        site = guard.register('layer', lambda: ran.append('full'),
+                              reduced=lambda: ran.append('reduced'))
+        
+        budget.begin_frame()
+        guard.run('layer')                  # First call measures full
+        site.estimates[TIER_FULL] = 1000.0  # Pretend full costs 1s
+        guard.run('layer')
+        
+        assert ran == ['full', 'reduced']
+        assert site.last_tier == TIER_REDUCED
+    
+    def test_skip_when_nothing_fits(self):
+        """With no budget left every measured tier is skipped."""
+        budget = FrameBudget(target_fps=30)
+        guard = PerformanceGuard(budget)
+        site = guard.register('layer', lambda: 'full', reduced=lambda: 'reduced')
+        site.estimates[TIER_FULL] = 5.0
+        site.estimates[TIER_REDUCED] = 2.0
+        
+        budget.frame_start = time.perf_counter() - 1.0  # Frame already overran
+        assert guard.run('layer') is None
+        assert site.last_tier == TIER_SKIP
+    
+    def test_sites_are_independent_and_reported(self):
+        """Each site keeps its own decisions; stats expose them."""
+        budget = FrameBudget(target_fps=30)
+        stats = RenderStats()
+        guard = PerformanceGuard(budget, stats)
+        guard.register('clouds', lambda: None)
+        guard.register('aurora', lambda: None)
+        
+        budget.begin_frame()
+        guard.run('clouds')
+        guard.run('clouds')
+        guard.run('aurora')
+        
+        report = stats.get_report()['guards']
+        assert report['clouds'][TIER_FULL] == 2
+        assert report['aurora'][TIER_FULL] == 1
+        assert guard.get_report()['clouds']['last'] == TIER_FULL
+
+
 class TestRenderQueue:
     """Test render queue."""
     
@@ -461,6 +687,413 @@ class TestRenderQueue:
         assert len(queue.commands) == 5
 
 
+class TestCellBuffer:
+    """Test the NumPy cell framebuffer."""
+    
+    def test_print_and_clip(self):
+        """Text is written in screen coordinates and clipped at the edges."""
+        buf = CellBuffer(10, 3)
+        buf.print_at("Hello", 7, 1, colour=3)
+        buf.print_at("X", 20, 1)
+        buf.print_at("ab", -1, 0)
+        
+        assert buf.row_text(1, 7, 3) == "Hel"
+        assert buf.get_cell(7, 1) == ("H", 3, 0, 0)
+        assert buf.row_text(0, 0, 2) == "b "
+    
+    def test_transparent_spaces(self):
+        """Transparent prints leave cells under spaces untouched."""
+        buf = CellBuffer(5, 1)
+        buf.print_at("xxxxx", 0, 0)
+        buf.print_at("a b", 0, 0, transparent=True)
+        assert buf.row_text(0) == "axbxx"
+    
+    def test_blit_cells_joins_runs_on_screens(self):
+        """Non-buffer targets get one print per same-colour run along a row."""
+        screen = MagicMock()
+        xs = np.array([2, 3, 4, 6, 7, 2])
+        ys = np.array([1, 1, 1, 1, 1, 2])
+        glyphs = np.array([ord(c) for c in "░▒▓ab中"])
+        colours = np.array([1, 1, 1, 1, 2, 1])
+        blit_cells(screen, xs, ys, glyphs, colours)
+        calls = [(c.args, c.kwargs['colour']) for c in screen.print_at.call_args_list]
+        assert calls == [(("░▒▓", 2, 1), 1), (("a", 6, 1), 1), (("b", 7, 1), 2), (("中", 2, 2), 1)]
+    
+    def test_rasterize_cells_resolves_priority_and_density(self):
+        """One winner per cell by priority, points outside the area culled."""
+        xs = np.array([1.5, 1.2, 3.0, 1.9, 50.0, 0.5])
+        ys = np.array([2.1, 2.9, 2.0, 2.5, 2.0, 2.0])
+        priority = np.array([1, 5, 0, 5, 9, 9])
+        winners, cx, cy, density = rasterize_cells(xs, ys, priority, 1, 2, 5, 3)
+        assert winners.tolist() == [3, 2]  # Tie at priority 5 goes to the later point
+        assert list(zip(cx.tolist(), cy.tolist())) == [(1, 2), (3, 2)]
+        assert density.tolist() == [3, 1]
+        _, _, _, density = rasterize_cells(xs, ys, priority, 1, 2, 5, 3,
+                                           weights=np.array([1, 0, 1, 0, 1, 1]))
+        assert density.tolist() == [1, 1]
+        assert rasterize_cells(xs[:0], ys[:0], priority[:0], 1, 2, 5, 3)[0].size == 0
+
+
+class TestAnsiWriter:
+    """Test direct ANSI diff output."""
+    
+    def test_full_then_incremental(self):
+        """First frame paints the region, unchanged frames emit nothing."""
+        buf = CellBuffer(6, 2)
+        writer = AnsiWriter(6, 2, region=(2, 0, 4, 2))
+        buf.print_at("abcd", 2, 0, colour=2)
+        
+        first = writer.render(buf).decode()
+        assert first.startswith(SYNC_BEGIN) and first.endswith(SYNC_END)
+        assert "abcd" in first
+        assert writer.last_cells == 8
+        
+        assert writer.render(buf) == b""
+    
+    def test_single_change_moves_cursor_once(self):
+        """One changed cell costs one cursor move and one colour change."""
+        buf = CellBuffer(10, 4)
+        writer = AnsiWriter(10, 4)
+        writer.render(buf)
+        
+        buf.print_at("*", 5, 2, colour=6)
+        out = writer.render(buf).decode()
+        
+        assert "\x1b[3;6H" in out
+        assert out.count("36") == 1
+        assert writer.last_cells == 1
+    
+    def test_wide_glyph_resets_cursor_tracking(self):
+        """After a wide glyph the next cell is placed with CUP, not printed or CUF'd on."""
+        buf = CellBuffer(10, 1)
+        writer = AnsiWriter(10, 1)
+        writer.render(buf)
+        
+        buf.print_at("☁", 2, 0, colour=7)
+        buf.print_at("x", 3, 0, colour=7)
+        buf.print_at("y", 6, 0, colour=7)
+        out = writer.render(buf).decode()
+        
+        assert "☁\x1b[1;4Hx" in out
+        assert "x  y" in out  # Narrow glyphs still track the cursor (gap reprinted)
+        
+        buf.print_at("🌧", 2, 0, colour=7)
+        buf.print_at("z", 5, 0, colour=7)
+        out = writer.render(buf).decode()
+        assert "🌧\x1b[1;6Hz" in out
+    
+    def test_colour_emitted_only_on_change(self):
+        """A run of same-coloured cells shares one SGR sequence."""
+        buf = CellBuffer(8, 1)
+        writer = AnsiWriter(8, 1)
+        writer.render(buf)
+        
+        buf.print_at("aaaa", 0, 0, colour=1)
+        buf.print_at("bb", 4, 0, colour=4)
+        out = writer.render(buf).decode()
+        
+        assert out.count("31") == 1
+        assert out.count("34") == 1
+        assert "aaaa" in out and "bb" in out
+    
+    def test_invalidate_repaints_region(self):
+        """invalidate() forces the whole region out again."""
+        buf = CellBuffer(4, 2)
+        writer = AnsiWriter(4, 2)
+        writer.render(buf)
+        writer.invalidate()
+        writer.render(buf)
+        assert writer.last_cells == 8
+
+    
+    def test_byte_cap_defers_and_catches_up(self):
+        """A capped frame sends a prefix; the remainder goes out next frames."""
+        buf = CellBuffer(20, 5)
+        writer = AnsiWriter(20, 5)
+        buf.print_at("#" * 20, 0, 2, colour=3)
+        
+        data = writer.render(buf, max_bytes=60)
+        assert 0 < len(data) <= 60
+        assert writer.last_deferred > 0
+        
+        frames = 1
+        while writer.last_deferred and frames < 50:
+            writer.render(buf, max_bytes=60)
+            frames += 1
+        assert writer.last_deferred == 0
+        assert writer.render(buf) == b""
+    
+    def test_priority_cells_sent_first(self):
+        """Masked (UI) cells win the byte budget over the rest."""
+        buf = CellBuffer(20, 4)
+        writer = AnsiWriter(20, 4)
+        writer.render(buf)
+        buf.print_at("*" * 20, 0, 1)
+        buf.print_at("UI", 0, 3, colour=2)
+        priority = np.zeros((4, 20), dtype=bool)
+        priority[3, :] = True
+        
+        out = writer.render(buf, max_bytes=60, priority=priority).decode()
+        assert "UI" in out
+        assert writer.last_deferred > 0
+
+
+class TestBandwidthBudget:
+    """Test the output byte budget."""
+    
+    def test_frame_cap_follows_fps(self):
+        budget = BandwidthBudget(9600, target_fps=30)
+        assert budget.frame_cap() == 320
+        budget.fps = 10
+        assert budget.frame_cap() == 960
+    
+    def test_saturation_lowers_fps_and_recovers(self):
+        budget = BandwidthBudget(1000, target_fps=30, min_fps=4)
+        for i in range(30):
+            budget.record(200, now=i * 0.1)
+            budget.end_frame(deferred_cells=10, now=i * 0.1)
+        assert budget.saturated
+        assert budget.fps == 4
+        
+        for i in range(30, 200):
+            budget.record(10, now=i * 0.1)
+            budget.end_frame(now=i * 0.1)
+        assert not budget.saturated
+        assert budget.fps == 30
+    
+    def test_rate_window(self):
+        budget = BandwidthBudget(1000, window_s=1.0)
+        budget.record(500, now=0.0)
+        budget.record(300, now=0.5)
+        assert budget.bytes_per_sec(now=0.9) == 800
+        assert budget.bytes_per_sec(now=1.2) == 300
+
+
+class TestIdleScheduler:
+    """Test the idle/low-power tick scheduler."""
+    
+    def test_goes_idle_after_quiet_run(self):
+        sched = IdleScheduler(active_fps=30, idle_fps=5, quiet_threshold=0.1, quiet_frames=10)
+        for _ in range(9):
+            sched.observe(0.01)
+        assert not sched.idle
+        sched.observe(0.01)
+        assert sched.idle
+        assert sched.tick_interval() == pytest.approx(0.2)
+    
+    def test_busy_frame_resets_quiet_run(self):
+        sched = IdleScheduler(quiet_threshold=0.1, quiet_frames=5)
+        for _ in range(4):
+            sched.observe(0.01)
+        sched.observe(0.5)
+        for _ in range(4):
+            sched.observe(0.01)
+        assert not sched.idle
+    
+    def test_wake_hysteresis(self):
+        """Idle survives activity just over the threshold, not well over it."""
+        sched = IdleScheduler(quiet_threshold=0.1, quiet_frames=1, wake_factor=1.5)
+        sched.observe(0.0)
+        sched.observe(0.12)
+        assert sched.idle
+        sched.observe(1.0)
+        assert not sched.idle
+        assert sched.wakeups == 1
+    
+    def test_wake_restores_full_rate(self):
+        sched = IdleScheduler(active_fps=30, quiet_frames=1)
+        sched.observe(0.0)
+        assert sched.tick_rate == sched.idle_fps
+        sched.wake()
+        assert sched.tick_rate == 30
+    
+    def test_cpu_meter_per_minute(self):
+        meter = CpuMeter(window_s=60)
+        meter.sample(wall=0.0, cpu=0.0)
+        meter.sample(wall=30.0, cpu=1.5)
+        assert meter.cpu_seconds_per_minute() == pytest.approx(3.0)
+    
+    def test_idle_ticks_cover_several_frames(self):
+        sched = IdleScheduler(active_fps=30, idle_fps=8, quiet_frames=1)
+        assert sched.sim_frames() == 1
+        sched.observe(0.0)
+        assert sched.idle
+        frames = [sched.sim_frames() for _ in range(8)]
+        assert sum(frames) == 30 and set(frames) == {3, 4}
+        sched.wake()
+        assert sched.sim_frames() == 1
+
+
+class TestLodScheduler:
+    """Test level-of-detail update rates."""
+    
+    def test_runs_every_n_frames_and_passes_catch_up(self):
+        lod = LodScheduler()
+        calls = []
+        lod.register('ground', lambda frames: calls.append((lod.frame, frames)), every=3)
+        for _ in range(9):
+            lod.tick()
+            lod.run('ground')
+        assert [frames for _, frames in calls] == [3, 3, 3]
+        assert calls[1][0] - calls[0][0] == 3
+        assert lod.since('ground') == 9 - calls[-1][0]
+        report = lod.get_report()['ground']
+        assert report['every'] == 3 and report['runs'] == 3
+    
+    def test_staggers_tasks_across_frames(self):
+        """Tasks at the same rate take different phases; the heaviest goes first."""
+        lod = LodScheduler()
+        lod.register('clouds', lambda f: None, every=2, cost=3.0)
+        lod.register('drifters', lambda f: None, every=2, cost=2.0)
+        lod.register('evaporation', lambda f: None, every=4, cost=1.0)
+        phases = {name: task.phase for name, task in lod.tasks.items()}
+        assert phases['clouds'] != phases['drifters']
+        # The light task joins the lighter of the two frames
+        assert phases['evaporation'] % 2 == phases['drifters']
+    
+    def test_every_frame_task_always_runs(self):
+        lod = LodScheduler()
+        frames = []
+        lod.register('fast', frames.append)
+        for _ in range(4):
+            lod.tick()
+            lod.run('fast')
+        assert frames == [1, 1, 1, 1]
+        assert lod.since('fast') == 0
+    
+    def test_multi_frame_tick_runs_tasks_whose_turn_it_passed(self):
+        lod = LodScheduler()
+        calls = []
+        lod.register('slow', calls.append, every=3)
+        for _ in range(4):
+            lod.tick(4)  # Every 4-frame tick passes one of its turns
+            lod.run('slow')
+        assert calls == [3, 4, 4, 4]
+        
+        lod = LodScheduler()
+        calls = []
+        lod.register('slow', calls.append, every=3)
+        for _ in range(4):
+            lod.tick(2)  # Frames 2, 4, 6, 8: turns fall in the ticks to 4 and 6
+            lod.run('slow')
+        assert calls == [3, 2]
+
+class TestOccupancyMask:
+    """Test the per-frame solid-cell mask."""
+    
+    def test_rect_is_clipped(self):
+        occ = OccupancyMask(10, 5)
+        occ.add_rect(8, 3, 5, 5)
+        assert occ.mask.sum() == 4
+        assert occ.mask[3:5, 8:10].all()
+    
+    def test_sprite_ors_opaque_cells_only(self):
+        occ = OccupancyMask(10, 5)
+        opaque = np.array([[False, True], [True, False]])
+        occ.add_sprite(-1, 0, opaque)
+        assert occ.mask[0, 0]
+        assert occ.mask.sum() == 1
+        occ.add_sprite(4, 3, opaque)
+        assert occ.mask[3, 5] and occ.mask[4, 4] and not occ.mask[3, 4]
+    
+    def test_hits_floors_positions_and_ignores_offscreen(self):
+        occ = OccupancyMask(10, 5)
+        occ.add_rect(2, 2, 1, 1)
+        xs = np.array([2.9, 2.0, 3.0, -1.0, 50.0])
+        ys = np.array([2.5, 1.9, 2.0, 2.0, 2.0])
+        assert occ.hits(xs, ys).tolist() == [True, False, False, False, False]
+        occ.clear()
+        assert not occ.hits(xs, ys).any()
+
+class TestDither:
+    """Test ordered dithering of density fields."""
+    
+    def test_bayer_matrix_is_a_permutation(self):
+        m = bayer_matrix(2)
+        assert m.shape == (4, 4)
+        assert sorted((m * 16 - 0.5).round().astype(int).ravel().tolist()) == list(range(16))
+    
+    def test_midpoint_density_splits_evenly(self):
+        """Halfway between two levels, a 4x4 tile is half of each."""
+        ys, xs = np.mgrid[0:4, 0:4]
+        levels = ordered_dither(np.full(16, 0.5), xs.ravel(), ys.ravel(), levels=2)
+        assert levels.sum() == 8
+        assert ordered_dither(np.array([0.0, 1.0, 7.0]), np.zeros(3, int), np.zeros(3, int), 4).tolist() == [0, 3, 3]
+    
+    def test_ramp_maps_levels_to_glyphs(self):
+        ramp = DitherRamp(" ░▒▓")
+        assert ramp.levels == 4
+        assert "".join(map(chr, ramp.glyphs(np.array([0, 3, 1])))) == " ▓░"
+
+
+class TestSubcellRaster:
+    """Test packing points into braille dots and half-blocks."""
+    
+    def test_braille_ors_dots_per_cell(self):
+        """Points sharing a cell become one glyph with both dots."""
+        xs = np.array([0.1, 0.6, 0.7, 1.2, 9.0])
+        ys = np.array([0.1, 0.9, 0.95, 0.3, 0.0])
+        cx, cy, codes, colours, dots = rasterize_points(xs, ys, 3, 2, 'braille',
+                                                        colours=np.array([1, 2, 3, 4, 5]))
+        assert cx.tolist() == [0, 1] and cy.tolist() == [0, 0]
+        assert "".join(map(chr, codes)) == "⢁⠂"
+        assert colours.tolist() == [3, 4]  # Last point in the cell wins
+        assert dots == 3  # The two points on one dot count once
+    
+    def test_half_blocks(self):
+        cx, cy, codes, colours, dots = rasterize_points(
+            np.array([0.5, 0.5, 2.5]), np.array([0.2, 0.7, 1.6]), 3, 2, 'halfblock')
+        assert list(zip(cx.tolist(), cy.tolist())) == [(0, 0), (2, 1)]
+        assert "".join(map(chr, codes)) == "█▄"
+        assert colours is None
+        assert "".join(map(chr, half_block_codes(np.array([1, 0, 0]), np.array([0, 1, 0])))) == "▀▄ "
+    
+    def test_no_points(self):
+        cx, cy, codes, colours, dots = rasterize_points(np.zeros(0), np.zeros(0), 4, 4,
+                                                        colours=np.zeros(0, dtype=int))
+        assert codes.size == 0 and colours.size == 0 and dots == 0
+
+
+class TestRandomStreams:
+    """Test seeded per-subsystem random streams."""
+    
+    def test_same_seed_replays(self):
+        a, b = RandomStreams(42), RandomStreams(42)
+        draws = [a.get("spawner").random() for _ in range(10)]
+        assert draws == [b.get("spawner").random() for _ in range(10)]
+        assert draws != [RandomStreams(43).get("spawner").random() for _ in range(10)]
+    
+    def test_streams_are_independent(self):
+        """Drawing from one stream doesn't shift another, whatever the creation order."""
+        a, b = RandomStreams(7), RandomStreams(7)
+        a.get("effects").random()
+        [a.get("lightning").random() for _ in range(5000)]
+        b.get("lightning")
+        assert [a.get("effects").random() for _ in range(3)] == \
+            [b.get("effects").random() for _ in range(4)][1:]
+    
+    def test_reseed_restarts_in_place(self):
+        streams = RandomStreams(1)
+        stream = streams.get("weather")
+        generator = stream.generator
+        first = [stream.random() for _ in range(3)] + generator.random(2).tolist()
+        streams.reseed(1)
+        assert stream.generator is generator  # Holders of the generator follow along
+        assert [stream.random() for _ in range(3)] + generator.random(2).tolist() == first
+    
+    def test_scalar_api_ranges(self):
+        """Scalars outlast the buffer and keep random-module semantics."""
+        stream = RandomStream(0, buffer_size=16)
+        ints = {stream.randint(1, 3) for _ in range(200)}
+        assert ints == {1, 2, 3}
+        assert all(0 <= stream.randrange(5) < 5 for _ in range(100))
+        assert all(2.0 <= stream.uniform(2.0, 4.0) < 4.0 for _ in range(100))
+        assert stream.choice("abc") in "abc"
+        items = list(range(10))
+        stream.shuffle(items)
+        assert sorted(items) == list(range(10))
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # INTEGRATION TESTS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -594,6 +594,50 @@ class TestSpecialEffects:
         aurora.update(0.033)
         assert aurora.time > initial_time
     
+    def test_aurora_renders_into_cell_buffer(self):
+        """Aurora curtains land in a CellBuffer in one batch, offset applied."""
+        from engine.effects.special_effects import AuroraBorealis
+        from engine.rendering.framebuffer import CellBuffer
+        
+        aurora = AuroraBorealis(60, 20)
+        aurora._flicker[:] = True
+        buf = CellBuffer(80, 20)
+        aurora.render(buf, x_offset=10, y_offset=2)
+        
+        drawn = buf.glyph != ord(" ")
+        assert drawn.any()
+        assert not drawn[:, :10].any()
+        assert set(chr(c) for c in buf.glyph[drawn]) <= set(AuroraBorealis.CHARS)
+    
+    def test_aurora_resize_rebuilds_buffers(self):
+        """Curtain and flicker buffers follow the effect size."""
+        from engine.effects.special_effects import AuroraBorealis
+        
+        aurora = AuroraBorealis(60, 20)
+        aurora.resize(100, 30)
+        assert aurora._level.shape == (30, 100)
+        assert aurora._flicker.shape[1:] == (30, 100)
+    
+    def test_frost_layer_cached_until_changed(self):
+        """Frost cells are rebuilt only when a crystal forms or melts."""
+        import numpy as np
+        from engine.effects.special_effects import FrostPatterns
+        from engine.rendering.framebuffer import CellBuffer
+        
+        frost = FrostPatterns(80, 24, intensity=1.0)
+        assert len(frost.frost_points) == np.count_nonzero(frost.layer)
+        cells = frost._raster()
+        
+        buf = CellBuffer(80, 24)
+        frost.render(buf)
+        frost.render(buf)
+        assert frost._raster() is cells
+        assert np.array_equal(buf.glyph != ord(" "), frost.layer != 0)
+        
+        frost.layer[0, 0] = 0
+        frost._cells = None
+        assert frost._raster() is not cells
+    
     def test_heat_shimmer(self):
         """Test heat shimmer effect."""
         from engine.effects.special_effects import HeatShimmer
@@ -627,6 +671,61 @@ class TestSpecialEffects:
         # Should spawn some hailstones
         assert len(hail.hailstones) > 0
     
+    def test_hail_bounces_and_culls(self):
+        """Hailstones bounce off the ground and are culled after three bounces."""
+        from engine.effects.special_effects import HailEffect
+        
+        hail = HailEffect(80, 24, intensity=0.0)
+        hail.hailstones.spawn(1, x=10.0, y=21.0, vx=0.0, vy=1.0)
+        hail.update(0.033)
+        assert hail.hailstones.y[0] == 22
+        assert hail.hailstones.vy[0] < 0
+        assert hail.hailstones.bounces[0] == 1
+        
+        for _ in range(100):
+            hail.update(0.033)
+        assert len(hail.hailstones) == 0
+    
+    def test_sandstorm_pool_and_overlay(self):
+        """Sandstorm particles stay within capacity; the overlay draws speckles."""
+        from engine.effects.special_effects import SandstormEffect
+        from engine.rendering.framebuffer import CellBuffer
+        
+        storm = SandstormEffect(80, 24, intensity=1.0)
+        for _ in range(60):
+            storm.update(0.033, wind_speed=2.0)
+        assert 0 < len(storm.particles) <= storm.particles.capacity
+        assert (storm.particles.x < 90).all()
+        
+        buf = CellBuffer(80, 24)
+        storm.render(buf)
+        assert (buf.glyph == ord("░")).any()
+    
+    def test_effects_clip_before_offset(self):
+        """Effects drawn at a pane offset show the same cells, shifted, and nothing outside."""
+        import numpy as np
+        from engine.effects.special_effects import HailEffect, Rainbow, SandstormEffect
+        from engine.rendering.framebuffer import CellBuffer
+        from engine.rng import stream
+        
+        hail = HailEffect(60, 20, intensity=0.0)
+        hail.hailstones.spawn(3, x=np.array([1.0, 30.0, 59.0]), y=np.array([1.0, 10.0, 19.0]),
+                              vx=0.0, vy=0.0)
+        storm = SandstormEffect(60, 20, intensity=0.3)
+        storm.particles.spawn(2, x=np.array([-0.5, 58.0]), y=5.0, glyph=ord("~"), alpha=1.0)
+        for effect in (Rainbow(60, 20), hail, storm):
+            stream("effects").reseed(3)
+            plain = CellBuffer(60, 20)
+            effect.render(plain)
+            stream("effects").reseed(3)
+            shifted = CellBuffer(80, 24)
+            effect.render(shifted, x_offset=12, y_offset=2)
+            
+            drawn = shifted.glyph != ord(" ")
+            assert drawn.any()
+            assert not drawn[:, :12].any() and not drawn[:2].any() and not drawn[22:].any()
+            assert np.array_equal(drawn[2:22, 12:72], plain.glyph != ord(" "))
+    
     def test_effects_manager(self):
         """Test effects manager."""
         from engine.effects.special_effects import SpecialEffectsManager
@@ -646,7 +745,731 @@ class TestSpecialEffects:
         heat_effects = [e for e in manager.active_effects 
                        if e.__class__.__name__ == 'HeatShimmer']
         assert len(heat_effects) > 0
+    
+    def test_effects_manager_resize(self):
+        """Resizing keeps active effects and gives them the new bounds."""
+        from engine.effects.special_effects import SpecialEffectsManager
+        
+        manager = SpecialEffectsManager(80, 24)
+        manager.update_for_conditions(
+            temperature_f=10.0,
+            condition='partly_cloudy',
+            is_night=False,
+        )
+        before = list(manager.active_effects)
+        assert before
+        
+        manager.resize(120, 40)
+        
+        assert manager.active_effects == before
+        for effect in manager.active_effects:
+            assert (effect.width, effect.height) == (120, 40)
+    
+    def test_effects_manager_dispatches_declared_inputs(self):
+        """Each effect's update gets exactly the inputs it declared."""
+        from engine.effects.special_effects import SpecialEffectsManager
+        
+        calls = []
+        
+        class Gusty:
+            INPUTS = ('wind_x',)
+            def update(self, dt, wind_x=0.0):
+                calls.append(('gusty', wind_x))
+            def render(self, screen, x_offset=0, y_offset=0):
+                pass
+        
+        class Still:
+            def update(self, dt):
+                calls.append(('still',))
+            def render(self, screen, x_offset=0, y_offset=0):
+                pass
+        
+        manager = SpecialEffectsManager(80, 24)
+        manager.register(Gusty())
+        manager.register(Still())
+        manager.update(0.033, wind_x=1.5, wind_speed=3.0)
+        assert calls == [('gusty', 1.5), ('still',)]
+        
+        report = manager.get_report()
+        assert [fx['name'] for fx in report] == ['Gusty', 'Still']
+        assert all(fx['update_ms'] >= 0 for fx in report)
+    
+    def test_effects_manager_throttles_and_replays(self):
+        """An effect over its budget share renders every Nth frame, replayed in between."""
+        import time
+        from engine.effects.special_effects import SpecialEffectsManager
+        from engine.rendering.framebuffer import CellBuffer
+        
+        class Slow:
+            renders = 0
+            def update(self, dt):
+                pass
+            def render(self, screen, x_offset=0, y_offset=0):
+                Slow.renders += 1
+                time.sleep(0.002)
+                screen.print_at("*", 5, 3, colour=6)
+        
+        manager = SpecialEffectsManager(80, 24, budget_ms=0.5)
+        manager.register(Slow())
+        buf = CellBuffer(80, 24)
+        for _ in range(12):
+            buf.clear_buffer(7, 0, 0)
+            manager.render(buf)
+            assert buf.get_cell(5, 3)[:2] == ("*", 6)
+        
+        assert manager.slots[0].render_every == manager.MAX_RENDER_EVERY
+        assert Slow.renders < 12
+    
+    def test_throttled_effect_skipped_by_guard_keeps_last_render(self):
+        """A guard skip on a throttled effect's frame replays its previous render."""
+        from engine.effects.special_effects import SpecialEffectsManager
+        from engine.rendering.core import FrameBudget, PerformanceGuard, TIER_FULL
+        from engine.rendering.framebuffer import CellBuffer
+        
+        class Static:
+            def update(self, dt):
+                pass
+            def render(self, screen, x_offset=0, y_offset=0):
+                screen.print_at("*", 5, 3, colour=6)
+        
+        manager = SpecialEffectsManager(80, 24)
+        slot = manager.register(Static())
+        budget = FrameBudget(target_fps=30)
+        guard = PerformanceGuard(budget)
+        buf = CellBuffer(80, 24)
+        slot.render_every = 4
+        manager._throttle = lambda slot: None
+        budget.begin_frame()
+        manager.render(buf, guard=guard)  # Rendered and captured
+        
+        guard.sites[slot.site].estimates[TIER_FULL] = 1e9  # Never fits: always skipped
+        for _ in range(8):
+            buf.clear_buffer(7, 0, 0)
+            budget.begin_frame()
+            manager.render(buf, guard=guard)
+            assert buf.get_cell(5, 3)[:2] == ("*", 6)
+        assert guard.get_report()[slot.site]["decisions"]["skip"] >= 2
+    
+    def test_effects_manager_guards_each_slot(self):
+        """Two instances of one effect get separate guard sites and cost estimates."""
+        from engine.effects.special_effects import SpecialEffectsManager
+        from engine.rendering.core import FrameBudget, PerformanceGuard
+        from engine.rendering.framebuffer import CellBuffer
+        
+        manager = SpecialEffectsManager(80, 24)
+        manager.add_hail(intensity=1.0)
+        manager.add_hail(intensity=0.5)
+        guard = PerformanceGuard(FrameBudget(target_fps=30))
+        buf = CellBuffer(80, 24)
+        manager.update(0.033)
+        manager.render(buf, guard=guard)
+        
+        assert [slot.site for slot in manager.slots] == ["effect:HailEffect", "effect:HailEffect#2"]
+        assert set(guard.sites) == {"effect:HailEffect", "effect:HailEffect#2"}
+        for slot in manager.slots:
+            assert guard.sites[slot.site].tiers[0][1] == slot.effect.render
+
+
+class TestCreatures:
+    """Test the creature sprite atlas and multi-creature manager."""
+    
+    def test_atlas_frames_and_masks(self):
+        """Frames are padded glyph arrays; spaces are transparent."""
+        from engine.creatures import ATLAS
+        
+        ghost = next(i for i, c in enumerate(ATLAS.creatures) if c["name"] == "Ghost")
+        assert ATLAS.glyphs[ghost].shape == (3, 6, 9)
+        assert (ATLAS.heights[ghost], ATLAS.widths[ghost]) == (6, 9)
+        assert not ATLAS.masks[ghost][0, 0, 0]
+        assert ATLAS.masks[ghost][0, 0, 3]
+        assert ATLAS.areas[ghost] == ATLAS.masks[ghost][0].sum()
+    
+    def test_spawn_table_keeps_sequential_odds(self):
+        """The cumulative table matches first-success-wins rarity rolls."""
+        from engine.creatures import SpriteAtlas
+        
+        def creature(name, rarity):
+            return {"name": name, "frames": [["x"]], "colour": "SNOW", "speed": 0.1, "rarity": rarity}
+        
+        atlas = SpriteAtlas({"k": [creature("a", 0.1), creature("b", 0.5)]})
+        assert atlas.pick("k", 0.05) == 0
+        assert atlas.pick("k", 0.1 + 0.9 * 0.5 - 1e-9) == 1
+        assert atlas.pick("k", 0.1 + 0.9 * 0.5 + 1e-9) is None
+        assert atlas.pick("missing", 0.0) is None
+    
+    def test_several_creatures_at_once(self, monkeypatch):
+        """Up to max_active creatures share the pane."""
+        from engine.creatures import CreatureManager
+        from engine.rng import stream
+        
+        monkeypatch.setattr(stream("creatures"), "random", lambda: 0.0)
+        manager = CreatureManager(10, 80, 40, max_active=2)
+        assert manager.try_spawn("FOG", 22)
+        assert manager.try_spawn("FOG", 22)
+        assert not manager.try_spawn("FOG", 22)
+        assert len(manager.sprites) == 2
+        assert manager.current_creature_name == "Cthulhu Tentacle"
+    
+    def test_spawns_at_the_edge_take_free_rows(self, monkeypatch):
+        """Creatures entering together get disjoint rows, or don't spawn at all."""
+        from engine.creatures import CreatureManager
+        from engine.rng import stream
+        
+        monkeypatch.setattr(stream("creatures"), "random", lambda: 0.0)
+        manager = CreatureManager(10, 80, 40, max_active=3)
+        while manager.try_spawn("FOG", 22):
+            pass
+        spans = sorted((s.y, s.y + int(manager.atlas.heights[s.index])) for s in manager.sprites)
+        assert len(spans) >= 2
+        assert all(bottom <= top for (_, bottom), (top, _) in zip(spans, spans[1:]))
+        
+        # Once the first has moved on, its rows are free again
+        short = CreatureManager(10, 80, 16, max_active=3)  # Room for one tentacle's rows
+        assert short.try_spawn("FOG", 22)
+        assert not short.try_spawn("FOG", 22)
+        short.sprites[0].x += 40
+        assert short.try_spawn("FOG", 22)
+    
+    def test_spawn_rolls_scale_the_odds(self, monkeypatch):
+        """Several frames' rolls in one draw: the odds scale, the pick stays in the table."""
+        from engine.creatures import CreatureManager
+        from engine.rng import stream
+        
+        manager = CreatureManager(10, 80, 40, max_active=5)
+        key = manager.get_creature_key("FOG", 22)
+        total = float(manager.atlas._tables[key][1][-1])
+        monkeypatch.setattr(stream("creatures"), "random", lambda: min(0.999, total * 3))
+        assert not manager.try_spawn("FOG", 22)
+        assert manager.try_spawn("FOG", 22, rolls=4)
+    
+    def test_draw_clips_to_pane_and_skips_transparent_cells(self):
+        """Sprites are clipped to the pane and spaces leave the background alone."""
+        import numpy as np
+        from engine.creatures import CreatureManager, Sprite, ATLAS
+        from engine.rendering.framebuffer import CellBuffer
+        
+        ghost = next(i for i, c in enumerate(ATLAS.creatures) if c["name"] == "Ghost")
+        manager = CreatureManager(10, 30, 20)
+        manager.sprites.append(Sprite(ghost, x=35.0, y=8))
+        buf = CellBuffer(60, 20)
+        buf.clear_buffer(7, 0, 0)
+        buf.glyph[:] = ord("~")
+        manager.draw(buf, {"SNOW": 7})
+        
+        drawn = buf.glyph != ord("~")
+        ys, xs = np.nonzero(drawn)
+        assert drawn.any()
+        assert xs.max() < 39 and ys.min() >= 8
+        # The ghost's leading spaces are transparent
+        assert buf.glyph[8, 35] == ord("~")
+        assert chr(buf.glyph[8, 38]) == "."
+    
+    def test_stamp_marks_opaque_cells_inside_pane(self):
+        """Sprites stamp the same cells they draw into the occupancy mask."""
+        from engine.creatures import CreatureManager, Sprite, ATLAS
+        from engine.rendering.framebuffer import CellBuffer
+        from engine.rendering.occupancy import OccupancyMask
+        
+        ghost = next(i for i, c in enumerate(ATLAS.creatures) if c["name"] == "Ghost")
+        manager = CreatureManager(10, 30, 20)
+        manager.sprites.append(Sprite(ghost, x=35.0, y=8))
+        occ = OccupancyMask(60, 20)
+        manager.stamp(occ)
+        buf = CellBuffer(60, 20)
+        buf.glyph[:] = 0
+        manager.draw(buf, {"SNOW": 7})
+        
+        assert occ.mask.any()
+        assert (occ.mask == (buf.glyph != 0)).all()
+
+
+class TestParticlePool:
+    """Test the fixed-capacity particle pool."""
+    
+    def test_spawn_respects_capacity(self):
+        """Spawns beyond capacity are dropped and counted."""
+        from engine.effects.pool import ParticlePool
+        
+        pool = ParticlePool(4, {'x': float, 'y': float})
+        assert pool.spawn(3, x=[1.0, 2.0, 3.0], y=5.0) == 3
+        assert pool.spawn(3, x=[4.0, 5.0, 6.0]) == 1
+        assert len(pool) == 4
+        assert pool.dropped == 2
+        assert pool.x.tolist() == [1.0, 2.0, 3.0, 4.0]
+        assert pool.y.tolist() == [5.0, 5.0, 5.0, 0.0]
+    
+    def test_field_updates_and_cull(self):
+        """In-place field updates stick; cull packs survivors in order."""
+        import numpy as np
+        from engine.effects.pool import ParticlePool
+        
+        pool = ParticlePool(8, {'x': float, 'vx': float})
+        pool.spawn(4, x=[0.0, 1.0, 2.0, 3.0], vx=1.0)
+        pool.x += pool.vx
+        pool.cull(np.array([True, False, True, False]))
+        assert pool.x.tolist() == [1.0, 3.0]
+        pool.spawn(1, x=9.0)
+        assert pool.x.tolist() == [1.0, 3.0, 9.0]
+
+
+class TestTrailBuffer:
+    """Test the ring-buffer motion trails."""
+    
+    def test_ring_keeps_last_positions_ranked_by_age(self):
+        """Older positions are overwritten; rank 0 is the oldest kept."""
+        import numpy as np
+        from engine.effects.pool import TrailBuffer
+        
+        trails = TrailBuffer(length=2, capacity=1)
+        trails.spawn(2)  # Grows past the initial capacity
+        for step in range(3):
+            trails.record(np.array([step, 10.0 + step]), np.zeros(2))
+        xs, ys, rank = trails.points()
+        assert sorted(zip(xs.tolist(), rank.tolist())) == [(1.0, 0), (2.0, 1), (11.0, 0), (12.0, 1)]
+    
+    def test_rows_follow_spawn_and_cull(self):
+        """New rows start empty; cull packs survivors like the particle list."""
+        import numpy as np
+        from engine.effects.pool import TrailBuffer
+        
+        trails = TrailBuffer(length=3)
+        trails.spawn(3)
+        trails.record(np.array([1.0, 2.0, 3.0]), np.zeros(3))
+        trails.cull(np.array([False, True, True]))
+        trails.spawn(1)
+        trails.record(np.array([4.0, 5.0, 6.0]), np.zeros(3))
+        trails.remap_x(lambda x: x * 10)
+        xs, _, _ = trails.points()
+        assert sorted(xs.tolist()) == [20.0, 30.0, 40.0, 50.0, 60.0]
+        assert TrailBuffer(length=0).points()[0].size == 0
+    
+    def test_extend_realigns_heads(self):
+        """Rows appended from another buffer keep their age ranks."""
+        import numpy as np
+        from engine.effects.pool import TrailBuffer
+        
+        a, b = TrailBuffer(length=3), TrailBuffer(length=3)
+        a.spawn(1)
+        a.record(np.array([0.0]), np.zeros(1))
+        b.spawn(1)
+        for x in (1.0, 2.0):
+            b.record(np.array([x]), np.zeros(1))
+        a.extend(b)
+        a.record(np.array([5.0, 3.0]), np.zeros(2))
+        xs, _, rank = a.points()
+        ranks = dict(zip(xs.tolist(), rank.tolist()))
+        assert ranks[3.0] == 2 and ranks[2.0] == 1 and ranks[1.0] == 0
+        assert ranks[5.0] == 2 and ranks[0.0] == 1
+
+
+class TestRainSheet:
+    """Test the scrolling background rain sheets."""
+    
+    def test_scrolls_and_tiles(self):
+        """A drop moves down speed rows per frame and repeats every tile."""
+        import numpy as np
+        from engine.effects.sheet import RainSheet
+        
+        sheet = RainSheet("|", speed=2.0, size=(5, 4), rng=np.random.default_rng(0))
+        sheet.rank[:] = 1.0
+        sheet.rank[1, 3] = 0.0  # One drop at tile column 3, row 1
+        xs, ys, codes = sheet.cells(10, 8, density=0.5)
+        assert sorted(zip(xs.tolist(), ys.tolist())) == [(3, 1), (3, 5), (8, 1), (8, 5)]
+        assert set(map(chr, codes)) == {"|"}
+        sheet.scroll()
+        xs, ys, _ = sheet.cells(10, 8, density=0.5)
+        assert sorted(set(ys.tolist())) == [3, 7]
+    
+    def test_skew_leans_rows(self):
+        """Row y is shifted skew * y columns, so the sheet leans with the wind."""
+        import numpy as np
+        from engine.effects.sheet import RainSheet
+        
+        sheet = RainSheet("|", speed=1.0, size=(7, 3), rng=np.random.default_rng(0))
+        sheet.rank[:] = 1.0
+        sheet.rank[:, 0] = 0.0  # A vertical line at column 0
+        xs, ys, _ = sheet.cells(7, 3, density=0.5, skew=1.0)
+        assert sorted(zip(ys.tolist(), xs.tolist())) == [(0, 0), (1, 1), (2, 2)]
+    
+    def test_density_thins_without_rebaking(self):
+        """Lower density shows a subset of the same drops (no flicker while fading)."""
+        import numpy as np
+        from engine.effects.sheet import RainSheet
+        
+        sheet = RainSheet(".:", speed=1.0, rng=np.random.default_rng(3))
+        dense = set(zip(*[a.tolist() for a in sheet.cells(80, 30, 0.2)[:2]]))
+        sparse = set(zip(*[a.tolist() for a in sheet.cells(80, 30, 0.05)[:2]]))
+        assert sparse < dense
+        assert 0.1 < len(dense) / (80 * 30) < 0.3
+        assert sheet.cells(80, 30, 0.0)[0].size == 0
+
+
+class TestLightning:
+    """Test pre-rasterized bolts and the bolt pool."""
+    
+    def test_rasterize_segments(self):
+        """Segments become unique cells covering both endpoints."""
+        from engine.effects.lightning import rasterize_segments
+        
+        raster = rasterize_segments([(0, 0, 3, 3), (3, 3, 3, 5), (0, 0, 0, 0)])
+        cells = set(zip(raster.xs.tolist(), raster.ys.tolist()))
+        assert cells == {(0, 0), (1, 1), (2, 2), (3, 3), (3, 4), (3, 5)}
+        assert len(raster) == len(cells)
+    
+    def test_fractal_bolt_reaches_depth(self):
+        """A fractal bolt starts at the origin and reaches its depth."""
+        import random
+        from engine.effects.lightning import fractal_bolt
+        
+        raster = fractal_bolt(15, rng=random.Random(7))
+        assert (0, 0) in set(zip(raster.xs.tolist(), raster.ys.tolist()))
+        assert raster.ys.max() >= 15
+    
+    def test_dbm_bolt_grows_to_ground(self):
+        """The breakdown channel is connected from the origin to the ground row."""
+        import numpy as np
+        from engine.effects.lightning import dbm_bolt
+        
+        raster = dbm_bolt(60, 20, rng=np.random.default_rng(1))
+        cells = set(zip(raster.xs.tolist(), raster.ys.tolist()))
+        assert (0, 0) in cells
+        assert raster.ys.max() == 20
+        assert np.abs(raster.xs).max() <= 31
+        
+        again = dbm_bolt(60, 20, rng=np.random.default_rng(1))
+        assert np.array_equal(raster.xs, again.xs) and np.array_equal(raster.ys, again.ys)
+    
+    def test_bolt_pool_take_never_waits_for_worker(self):
+        """An empty pool serves the fallback generator instead of the slow one."""
+        import threading
+        import numpy as np
+        from engine.effects.lightning import BoltPool
+        from engine.effects.raster import Raster
+        
+        release = threading.Event()
+        slow = Raster(np.array([1]), np.array([1]))
+        quick = Raster(np.array([0]), np.array([0]))
+        
+        def generate_slowly():
+            release.wait()
+            return slow
+        
+        pool = BoltPool(size=1)
+        pool.configure(generate_slowly, fallback=lambda: quick)
+        assert pool.take() is quick
+        assert pool.misses == 1
+        release.set()
+    
+    def test_bolt_pool_refills_in_background(self):
+        """Taken shapes are replaced by the refill thread; configure drops old ones."""
+        import time
+        from engine.effects.lightning import BoltPool, fractal_bolt
+        
+        pool = BoltPool(size=3, refill_delay=0.0)
+        pool.configure(lambda: fractal_bolt(10))
+        deadline = time.time() + 2
+        while pool.ready() < 3 and time.time() < deadline:
+            time.sleep(0.01)
+        assert pool.ready() == 3
+        
+        pool.take()
+        assert pool.hits == 1 and pool.misses == 0
+        
+        pool.configure(lambda: fractal_bolt(30))
+        deadline = time.time() + 2
+        while pool.ready() < 3 and time.time() < deadline:
+            time.sleep(0.01)
+        assert pool.take().ys.max() >= 30
+
 
+class TestRasterCache:
+    """Test the shared geometry raster cache."""
+    
+    def test_cache_hit_and_eviction(self):
+        """Rasters are built once per key; the oldest entry is evicted."""
+        import numpy as np
+        from engine.effects.raster import Raster, RasterCache
+        
+        cache = RasterCache(max_entries=2)
+        builds = []
+        
+        def build(n):
+            def _build():
+                builds.append(n)
+                return Raster(np.arange(n), np.zeros(n, dtype=int))
+            return _build
+        
+        cache.get('a', build(1))
+        cache.get('a', build(1))
+        cache.get('b', build(2))
+        cache.get('c', build(3))
+        cache.get('a', build(1))
+        
+        assert builds == [1, 2, 3, 1]
+        assert len(cache) == 2
+    
+    def test_last_writer_keeps_final_draw(self):
+        """Overlapping cells keep the one drawn last."""
+        import numpy as np
+        from engine.effects.raster import last_writer
+        
+        xs = np.array([1, 2, 1, 3, 2])
+        ys = np.array([0, 0, 0, 1, 0])
+        assert last_writer(xs, ys).tolist() == [2, 3, 4]
+    
+    def test_rainbow_rasterizes_once(self):
+        """Rendering a rainbow repeatedly reuses the cached arc."""
+        from engine.effects.special_effects import Rainbow
+        from engine.effects.raster import RASTER_CACHE
+        from engine.rendering.framebuffer import CellBuffer
+        
+        rainbow = Rainbow(80, 24)
+        buf = CellBuffer(80, 24)
+        misses = RASTER_CACHE.misses
+        for _ in range(5):
+            rainbow.render(buf)
+        assert RASTER_CACHE.misses - misses <= 1
+        assert (buf.glyph != ord(" ")).any()
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# DASHBOARD TESTS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def make_dashboard(scenario="rain", width=120, height=40, seed=7):
+    """A seeded dashboard on a mock screen, with no network fetches."""
+    import random
+    import weather_dashboard
+    from lib.mock_weather import get_demo_weather
+    
+    weather_dashboard.EXTENDED_WEATHER_AVAILABLE = False
+    weather_dashboard.reseed(seed)
+    random.seed(seed)
+    screen = Mock(width=width, height=height, colours=256)
+    return weather_dashboard.WeatherDashboard(screen, get_demo_weather(scenario))
+
+
+class TestDashboard:
+    """Test the dashboard's simulation bookkeeping (no drawing)."""
+    
+    def test_bolt_pool_leaves_lightning_stream_alone(self):
+        """Strike timing replays under a seed however far the bolt worker has got."""
+        import weather_dashboard
+        
+        dashboard = make_dashboard("thunderstorm")
+        
+        def strike_draws(delay):
+            time.sleep(0.2)  # Let the previous fill finish
+            weather_dashboard.reseed(7)
+            dashboard._configure_bolts()
+            time.sleep(delay)
+            return [weather_dashboard._lightning.random() for _ in range(3)]
+        
+        assert strike_draws(0.0) == strike_draws(0.2)
+    
+    def test_seeded_strike_shapes_replay(self):
+        """Under a seed a strike's shape doesn't depend on how far the bolt worker has got."""
+        import weather_dashboard
+        
+        def strike(drain):
+            dashboard = make_dashboard("thunderstorm")
+            time.sleep(0.2)  # Let the pool fill
+            for _ in range(drain):
+                weather_dashboard._bolt_pool.take()
+            dashboard.lightning_timer = 0
+            while not dashboard.lightning_bolts:
+                dashboard.update()
+            bolt = dashboard.lightning_bolts[-1]
+            return bolt.xs.tolist(), bolt.ys.tolist()
+        
+        assert strike(0) == strike(weather_dashboard._bolt_pool.size)
+    
+    def test_idle_ticks_keep_scene_speed(self):
+        """An idle tick covers active_fps / idle_fps frames, so drifters cross at the same speed."""
+        def drift(idle, ticks):
+            dashboard = make_dashboard("clear")
+            scheduler = dashboard.scheduler
+            tracked = list(dashboard.particles.particles[:20])
+            start = [p.x for p in tracked]
+            scheduler.wake()
+            frame = dashboard.lod.frame
+            for _ in range(ticks):
+                scheduler.idle = idle
+                dashboard.update()
+            assert dashboard.lod.frame - frame == 30
+            return sum(p.x - x for p, x in zip(tracked, start)) / len(tracked)
+        
+        # 30 frames at 30 fps, or 8 ticks at 8 fps: the same second
+        active, idle = drift(False, 30), drift(True, 8)
+        assert active > 5
+        assert idle == pytest.approx(active, rel=0.15)
+    
+    def test_idle_tick_moves_creatures_and_ages_bolts(self):
+        """One idle tick steps creatures and bolts as far as the active frames it covers."""
+        from engine.creatures import Sprite
+        from weather_dashboard import LightningBolt
+        
+        def step(idle, ticks):
+            dashboard = make_dashboard("clear")
+            creatures = dashboard.easter_eggs
+            sprite = Sprite(0, x=float(creatures.ax), y=10)
+            creatures.sprites = [sprite]
+            bolt = LightningBolt(20, 3, 20, dashboard.animation_width)
+            bolt.lifetime = 100
+            dashboard.lightning_bolts = [bolt]
+            dashboard.scheduler.wake()
+            frame = dashboard.lod.frame
+            for _ in range(ticks):
+                dashboard.scheduler.idle = idle
+                dashboard.update()
+            return dashboard.lod.frame - frame, sprite.x - creatures.ax, bolt.age
+        
+        frames, moved, age = step(True, 1)
+        assert frames > 1 and moved > 0
+        assert age == frames
+        assert step(False, frames) == (frames, moved, age)
+    
+    def test_transition_warm_starts_and_keeps_old_trails(self):
+        """New weather is pre-simulated; old particles and their trails stay, in order."""
+        import numpy as np
+        from lib.mock_weather import get_demo_weather
+        
+        def ordered_trails(trails):
+            """Trail rows oldest point first, independent of the ring's head."""
+            return np.roll(trails._history[:trails.count], -trails.head, axis=1)
+        
+        dashboard = make_dashboard("rain")
+        for _ in range(10):
+            dashboard.update()
+        old_physics = list(dashboard.physics_particles)
+        old_simple = list(dashboard.particles.particles)
+        old_trails = ordered_trails(dashboard.trails)
+        assert old_physics and len(old_physics) == len(dashboard.trails)
+        
+        dashboard.transition_to(get_demo_weather("snow"))
+        
+        assert dashboard.warm_frames > 0
+        physics = dashboard.physics_particles
+        assert len(physics) > len(old_physics)
+        assert len(physics) == len(dashboard.trails)
+        assert physics[:len(old_physics)] == old_physics
+        assert dashboard.particles.particles[:len(old_simple)] == old_simple
+        trails = ordered_trails(dashboard.trails)
+        np.testing.assert_array_equal(trails[:len(old_physics)], old_trails)
+        # Warm-started rows were realigned too: each newest point is one step behind its particle
+        newest = trails[len(old_physics):, -1]
+        behind = np.array([(p.x - p.vx, p.y - p.vy) for p in physics[len(old_physics):]])
+        moved = ~np.isnan(newest[:, 0]) & np.array(
+            [p.rest == 0 and not getattr(p, '_hit', False) for p in physics[len(old_physics):]])
+        assert moved.any()
+        np.testing.assert_allclose(newest[moved], behind[moved])
+        
+        for _ in range(5):
+            dashboard.update()
+            assert len(dashboard.physics_particles) == len(dashboard.trails)
+    
+    def test_transition_leaves_the_scene_in_place(self):
+        """The warm start only adds particles: wind, clouds, ground and the LOD schedule don't jump."""
+        import numpy as np
+        from lib.mock_weather import get_demo_weather
+        
+        dashboard = make_dashboard("rain")
+        for _ in range(10):
+            dashboard.update()
+        
+        def scene():
+            field = dashboard.wind_field
+            return {
+                'frames': (dashboard.frame, dashboard.lod.frame, dashboard.cloud_time),
+                'lod': {name: task.last_frame for name, task in dashboard.lod.tasks.items()},
+                'gust': dashboard.wind_gusts.gust_timer,
+                'sheets': [sheet.offset for sheet, _ in dashboard.sheets + dashboard._old_sheets],
+                'arrays': (field.u.copy(), field.v.copy(), field.density('cloud').copy(),
+                           dashboard.ground.heights.copy(), dashboard.ripples.u.copy()),
+            }
+        
+        before = scene()
+        dashboard.transition_to(get_demo_weather("snow"))
+        after = scene()
+        assert dashboard.warm_frames > 0
+        assert len(dashboard.physics_particles) > 0
+        arrays = zip(before.pop('arrays'), after.pop('arrays'))
+        assert after == before
+        for old, new in arrays:
+            np.testing.assert_array_equal(new, old)
+    
+    def test_perf_hud_fits_bandwidth_and_effects(self):
+        """With every optional line present, the HUD keeps its LOD line inside the reserved rows."""
+        from engine.effects.special_effects import Rainbow
+        from weather_dashboard import BandwidthBudget
+        
+        dashboard = make_dashboard("clear")
+        dashboard.bandwidth = BandwidthBudget(64 * 1024)
+        dashboard.special_effects.register(Rainbow(dashboard.animation_width, dashboard.height - 6))
+        dashboard.update()
+        
+        lines = dashboard._perf_hud_lines()
+        assert len(lines) == dashboard.PERF_HUD_ROWS
+        assert lines[-2].startswith("fx ") and lines[-1].startswith("lod ")
+        
+        ax, aw = dashboard.animation_start_x, dashboard.animation_width
+        mask = dashboard._build_pane_priority()
+        assert mask[1:1 + len(lines), ax + 2:ax + aw - 2].all()
+    
+    def test_relayout_resizes_simulation_state(self):
+        """Shrinking and growing the screen resizes every pane-sized piece and keeps particles inside."""
+        import numpy as np
+        from weather_dashboard import LightningBolt
+        
+        dashboard = make_dashboard("rain")
+        for _ in range(10):
+            dashboard.update()
+        
+        for width, height in ((90, 30), (160, 50)):
+            old_ax, old_aw = dashboard.animation_start_x, dashboard.animation_width
+            inside = [p for p in dashboard.physics_particles + dashboard.particles.particles
+                      if old_ax <= p.x < old_ax + old_aw]
+            assert inside
+            bolt = LightningBolt(old_aw - 4, 3, dashboard.height - 5, old_aw)
+            bolt.lifetime = 100
+            dashboard.lightning_bolts = [bolt]
+            right = bolt.xs.max()
+            
+            dashboard.relayout(Mock(width=width, height=height, colours=256))
+            ax, aw = dashboard.animation_start_x, dashboard.animation_width
+            assert aw != old_aw
+            assert dashboard.ground.heights.shape == (aw,)
+            assert dashboard.ripples.u.shape == (aw,)
+            assert (dashboard.wind_field.width, dashboard.wind_field.height) == (aw, height)
+            assert dashboard.occupancy.mask.shape == (height, width)
+            assert all(ax <= p.x < ax + aw for p in inside)
+            xs, ys, _ = dashboard.trails.points()
+            assert xs.size and (xs >= ax - 5).all() and (xs < ax + aw + 5).all()
+            assert len(dashboard.trails) == len(dashboard.physics_particles)
+            assert bolt.xs.size and (bolt.xs >= 0).all() and (bolt.xs < aw).all()
+            assert (bolt.ys < height - 4).all()
+            assert abs(bolt.xs.max() - right * aw / old_aw) <= 1
+            
+            for _ in range(5):
+                dashboard.update()
+            assert len(dashboard.trails) == len(dashboard.physics_particles)
+            assert all(ax <= p.x < ax + aw for p in dashboard.particles.particles)
+    
+    def test_activity_counts_particle_motion(self):
+        """The activity estimate sums each particle's per-frame motion, capped at a cell."""
+        dashboard = make_dashboard("drizzle")
+        for _ in range(10):
+            dashboard.update()
+        dashboard.special_effects = None
+        drifters = dashboard.particles.particles
+        moving = sum(min(1.0, abs(p.vx) + abs(p.vy)) for p in drifters)
+        physics = dashboard._particle_batch(dashboard.physics_particles)
+        dashboard._batches = (physics, dashboard._particle_batch(drifters))
+        with_drifters = dashboard._estimate_activity()
+        dashboard._batches = (physics, dashboard._particle_batch([]))
+        without = dashboard._estimate_activity()
+        pane_cells = (dashboard.animation_width - 2) * (dashboard.height - 4)
+        assert moving > 0
+        assert with_drifters - without == pytest.approx(2 * moving / pane_cells)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # RUN TESTS
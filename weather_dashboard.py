@@ -37,13 +37,31 @@ from asciimatics.event import KeyboardEvent
 from lib.weather_api import get_weather, WeatherCondition, WeatherData, search_and_fetch_weather
 from lib.mock_weather import get_demo_weather
 from lib.particles import Particle, ParticleSystem
-from collections import deque
+from itertools import compress
 from typing import List, Tuple, Optional, Dict, Any
 
+import numpy as np
+
 # Global demo mode flag
 DEMO_MODE = False
 DEMO_SCENARIO = None
 
+# Animation pane output: "asciimatics" (print_at) or "ansi" (direct writer)
+OUTPUT_BACKEND = "asciimatics"
+
+# Output cap in bytes/second for slow links (None = unlimited)
+MAX_BANDWIDTH = None
+
+# Lightning bolt generator: "fractal" (random walk) or "dbm" (dielectric breakdown)
+LIGHTNING_MODEL = "fractal"
+
+# Simulation detail: "low", "medium" or "high" (see engine/rendering/quality.py)
+QUALITY = "medium"
+
+# Particle rasterizer: "glyph" (one character per particle), "braille" (2x4 dots
+# per cell) or "halfblock" (top/bottom half per cell), see engine/rendering/subcell.py
+PARTICLE_RASTER = "glyph"
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # ENHANCED MODULES - New integrated features
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -93,6 +111,11 @@ except ImportError:
         def try_spawn(self, *a, **kw): return False
         def update(self): pass
         def draw(self, *a, **kw): pass
+        def resize(self, *a, **kw): pass
+        def stamp(self, *a, **kw): pass
+        def moving_cells(self): return 0.0
+        is_active = False
+        current_creature_name = None
 
 try:
     from engine.effects.special_effects import SpecialEffectsManager
@@ -112,8 +135,25 @@ from engine.physics.atmosphere import (
     AtmosphericModel, AtmosphericState, StabilityClass,
     calculate_wind_chill, calculate_heat_index
 )
-from engine.rendering.core import RenderStats, FrameBudget, RenderQueue, RenderCommand, RenderLayer
+from engine.rendering.core import (
+    RenderStats, FrameBudget, BandwidthBudget, RenderQueue, RenderCommand, RenderLayer,
+    PerformanceGuard,
+)
+from engine.rendering.framebuffer import CellBuffer, blit_cells, rasterize_cells
+from engine.rendering.ansi import AnsiWriter, ByteCounter
+from engine.rendering.scheduler import IdleScheduler, LodScheduler
+from engine.rendering.occupancy import OccupancyMask
+from engine.physics.ground import GroundField, RippleSurface
+from engine.physics.fluid import WindField
+from engine.rendering.quality import get_quality
+from engine.rendering.dither import DitherRamp
+from engine.rendering.subcell import rasterize_points, half_block_codes
+from engine.effects.raster import Raster
+from engine.effects.pool import TrailBuffer
+from engine.effects.sheet import RainSheet
+from engine.effects.lightning import BoltPool, dbm_bolt, fractal_bolt
 from engine.personality.core import PersonalityEngine, Mood, PersonalityConfig
+from engine.rng import STREAMS, RandomStream, stream, reseed
 from data.dialogue import (
     WEATHER_COMMENTS as DIALOGUE_COMMENTS, TEMP_COMMENTS, GREETINGS,
     ACHIEVEMENTS as DIALOGUE_ACHIEVEMENTS, QUIPS, WEATHER_TYPE_MAP, get_temp_category,
@@ -126,6 +166,25 @@ from screens.bestiary import draw_bestiary_screen
 # Global performance monitoring
 _render_stats = RenderStats()
 _frame_budget = FrameBudget(target_fps=30)
+_idle_scheduler = IdleScheduler(active_fps=_frame_budget.target_fps)
+_bolt_pool = BoltPool()
+
+# Random streams (engine.rng): one per subsystem, so --seed replays a run
+_spawner = stream('spawner')
+_weather = stream('weather')
+_lightning = stream('lightning')
+_bolts = stream('bolts')  # Pooled bolt shapes: drawn on the BoltPool worker thread only
+_bolt_fallback = stream('bolt-fallback')  # Shapes made inline when the pool runs dry
+_personality = stream('personality')
+_render = stream('render')  # Cosmetic draw-time jitter, kept off the simulation's streams
+
+
+def _terminal_fd() -> Optional[int]:
+    """File descriptor of the terminal for direct writes."""
+    try:
+        return sys.__stdout__.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -137,6 +196,69 @@ GRAVITY = 0.5
 AIR_RESISTANCE = 0.02
 TURBULENCE_SCALE = 0.15
 WIND_GUST_FREQUENCY = 0.01
+SPLASH_CHARS = ["'", "`", ","]  # Rain bouncing off sprites and labels
+SPLASH_FRAMES = 4
+SETTLE_FRAMES = 24  # How long snow rests on a sprite or label before melting
+# Frames between updates for subsystems that don't need every frame (see LodScheduler)
+LOD_EVERY = {
+    'clouds': 2,          # Cloud density feed from the noise pattern
+    'drifters': 2,        # Simple particle layer, extrapolated in between
+    'fog': 2,             # Fog density feed
+    'evaporation': 10,    # Puddles and drifts drying out
+    'creatures': 15,      # Creature spawn rolls
+    'chatter': 30,        # Stormy's comment/quip rotation
+    'notifications': 10,  # Expiry of toast notifications
+}
+WARM_START_FRAMES = 90  # Virtual frames pre-simulated before the first draw (~3 s)
+WARM_START_MS = 150  # Wall-clock cap on a warm start
+DRIFT_WIND_BIAS = 3.0  # Gust wind (~0.01 per mph) to snow-drift transport bias
+CLOUD_CONDITIONS = (
+    WeatherCondition.RAIN, WeatherCondition.HEAVY_RAIN,
+    WeatherCondition.THUNDERSTORM, WeatherCondition.SNOW,
+    WeatherCondition.HEAVY_SNOW, WeatherCondition.CLOUDY,
+    WeatherCondition.FOG
+)
+CLOUD_CODES = np.array([ord(c) for c in "█▓▒░"], dtype=np.int32)
+TRAIL_CODE = ord("·")
+CROWD_COUNT = 3  # Particles in one cell before it draws a heavier glyph
+CROWD_GLYPHS = {"|": "‖", ":": "⁞", ".": ":", "'": '"', "·": ":", "*": "✱", "+": "✚", "o": "O"}
+_CROWD_FROM = np.array(sorted(ord(k) for k in CROWD_GLYPHS), dtype=np.int32)
+_CROWD_TO = np.array([ord(CROWD_GLYPHS[chr(k)]) for k in _CROWD_FROM], dtype=np.int32)
+CLOUD_FEED = 0.02  # Per-frame pull of cloud density towards the noise pattern
+CLOUD_TARGET_FRAMES = 30  # Frames to refresh the whole cloud-pattern target
+FOG_RAMP = DitherRamp(" ░▒▓")  # Fog density to glyph, level 0 left undrawn
+FOG_FEED = 0.03  # Per-frame pull of fog density towards its pattern (and away once it lifts)
+FOG_TOP = 6  # First pane row fog is drawn in, below the cloud band
+SHEET_CONDITIONS = (
+    WeatherCondition.RAIN, WeatherCondition.HEAVY_RAIN,
+    WeatherCondition.DRIZZLE, WeatherCondition.THUNDERSTORM
+)
+SHEET_TOP = 3  # First pane row rain sheets are drawn in (the cloud base)
+SHEET_SPEED = 1.5  # Fall speed of the simulated foreground rain, rows per frame
+# Background rain sheets, far to near: share of SHEET_SPEED, glyphs, colour.
+# The quality profile's sheet_layers takes the first n.
+SHEET_LAYERS = (
+    (0.3, "··.", Screen.COLOUR_BLUE),
+    (0.45, ".:", Screen.COLOUR_BLUE),
+    (0.6, ":╎", Screen.COLOUR_CYAN),
+)
+SHEET_FULL_RATE = 20  # Spawn rate drawn at the profile's full sheet density (heavy rain)
+FOREGROUND_SHARE = 0.5  # Share of falling drifter particles still simulated behind sheets
+
+
+def heavier_glyphs(codes: np.ndarray) -> np.ndarray:
+    """Crowded-cell glyph for each codepoint (unchanged where none is defined)."""
+    pos = np.minimum(np.searchsorted(_CROWD_FROM, codes), _CROWD_FROM.size - 1)
+    return np.where(_CROWD_FROM[pos] == codes, _CROWD_TO[pos], codes)
+
+
+def _held_copy(value):
+    """value, with arrays (also inside dicts) copied so in-place updates don't reach it."""
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    if isinstance(value, dict):
+        return {key: _held_copy(item) for key, item in value.items()}
+    return value
 
 
 class PerlinNoise:
@@ -148,14 +270,13 @@ class PerlinNoise:
     
     def __init__(self, seed: int = None):
         # Now uses engine module internally!
-        self._engine = EnginePerlinNoise(seed=seed or int(time.time()))
+        # Seeds come from the weather stream, so --seed reproduces the sky too
+        self.seed = seed or _weather.randint(1, 2 ** 31 - 1)
+        self._engine = EnginePerlinNoise(seed=self.seed)
         self._fractal = FractalNoise(self._engine)
-        # Legacy compat
-        self.seed = seed or int(time.time())
-        random.seed(self.seed)
-        self.perm = list(range(256))
-        random.shuffle(self.perm)
-        self.perm += self.perm
+        # Legacy compat (a local permutation: never reseed the global RNG)
+        perm = np.random.default_rng(self.seed).permutation(256).tolist()
+        self.perm = perm + perm
     
     @staticmethod
     def fade(t: float) -> float:
@@ -232,15 +353,18 @@ class WindGustSystem:
         self.gust_strength = 0
         self.gust_angle = 0
         self.gust_timer = 0
+        self.gust_started = False  # True on the frame a new gust begins
     
     def update(self):
+        self.gust_started = False
         if self.gust_timer > 0:
             self.gust_timer -= 1
             self.gust_strength *= 0.95
-        elif random.random() < WIND_GUST_FREQUENCY:
-            self.gust_strength = random.uniform(0.5, 2.0)
-            self.gust_angle = random.uniform(0, 2 * math.pi)
-            self.gust_timer = random.randint(30, 120)
+        elif _weather.random() < WIND_GUST_FREQUENCY:
+            self.gust_strength = _weather.uniform(0.5, 2.0)
+            self.gust_angle = _weather.uniform(0, 2 * math.pi)
+            self.gust_timer = _weather.randint(30, 120)
+            self.gust_started = True
     
     def get_wind(self) -> Tuple[float, float]:
         gust_x = math.cos(self.gust_angle) * self.gust_strength
@@ -251,47 +375,41 @@ class WindGustSystem:
 class LightningBolt:
     """
     Procedurally generated branching lightning using recursive fractal patterns.
+    
+    The shape is a pre-rasterized cell array (see engine.effects.lightning),
+    usually taken from the shared bolt pool, placed at the strike column
+    and clipped to the pane once; drawing it is a single batched write.
     "Zeus's anger, rendered in Unicode. The ancient Greeks would be impressed.
     Or terrified. Probably terrified." - Stormy
     """
     
-    def __init__(self, start_x: int, start_y: int, end_y: int, width: int):
-        self.segments: List[Tuple[int, int, int, int]] = []
-        self.lifetime = random.randint(3, 8)
+    SOLID, SHADED, THIN = ord("█"), ord("▓"), ord("│")
+    
+    # shape is relative to (start_x, start_y) and, when given, sets the depth instead of end_y
+    def __init__(self, start_x: int, start_y: int, end_y: int, width: int,
+                 shape: Optional[Raster] = None):
+        self.lifetime = _lightning.randint(3, 8)
         self.age = 0
         self.brightness = 1.0
         self.width = width
-        self._generate(start_x, start_y, end_y)
-    
-    def _generate(self, x: int, y: int, target_y: int, depth: int = 0):
-        current_x, current_y = x, y
-        while current_y < target_y:
-            next_x = max(0, min(self.width - 1, current_x + random.randint(-3, 3)))
-            next_y = current_y + random.randint(2, 5)
-            self.segments.append((current_x, current_y, next_x, next_y))
-            
-            # Branching with decreasing probability at depth
-            if depth < 2 and random.random() < (0.3 - depth * 0.1):
-                branch_len = random.randint(3, 6)
-                self._generate_branch(next_x, next_y, branch_len, depth + 1)
-            
-            current_x, current_y = next_x, next_y
-    
-    def _generate_branch(self, x: int, y: int, length: int, depth: int):
-        direction = random.choice([-1, 1])
-        current_x, current_y = x, y
-        for _ in range(length):
-            next_x = max(0, min(self.width - 1, current_x + random.randint(1, 3) * direction))
-            next_y = current_y + random.randint(1, 3)
-            self.segments.append((current_x, current_y, next_x, next_y))
-            current_x, current_y = next_x, next_y
-            if random.random() < 0.15:
-                break
+        if shape is None:
+            shape = fractal_bolt(end_y - start_y, rng=_lightning)
+        xs = shape.xs + start_x
+        keep = (xs >= 0) & (xs < width)
+        self.xs = xs[keep]
+        self.ys = shape.ys[keep] + start_y
     
     def update(self):
         self.age += 1
         self.brightness = max(0, 1.0 - (self.age / self.lifetime))
     
+    def resize(self, width: int, height: int):
+        """Stretch the bolt's columns into a new pane width, dropping cells at or below row height."""
+        xs = (self.xs * (width / max(1, self.width))).astype(self.xs.dtype)
+        keep = self.ys < height
+        self.xs, self.ys = xs[keep], self.ys[keep]
+        self.width = width
+    
     def is_expired(self) -> bool:
         return self.age >= self.lifetime
     
@@ -300,39 +418,22 @@ class LightningBolt:
             return
         
         if self.brightness > 0.7:
-            colour, char = Screen.COLOUR_WHITE, "█"
+            colour, glyph = Screen.COLOUR_WHITE, self.SOLID
         elif self.brightness > 0.4:
-            colour, char = Screen.COLOUR_YELLOW, "▓"
+            colour, glyph = Screen.COLOUR_YELLOW, self.SHADED
         else:
-            colour, char = Screen.COLOUR_CYAN, "│"
+            colour, glyph = Screen.COLOUR_CYAN, self.THIN
         
-        for x1, y1, x2, y2 in self.segments:
-            self._draw_line(screen, x1 + x_offset, y1, x2 + x_offset, y2, char, colour)
-    
-    @staticmethod
-    def _draw_line(screen, x1: int, y1: int, x2: int, y2: int, char: str, colour: int):
-        """Bresenham line algorithm for smooth lightning."""
-        dx, dy = abs(x2 - x1), abs(y2 - y1)
-        sx, sy = (1 if x1 < x2 else -1), (1 if y1 < y2 else -1)
-        err = dx - dy
-        
-        while True:
-            if 0 <= x1 < screen.width and 0 <= y1 < screen.height:
-                screen.print_at(char, x1, y1, colour=colour)
-            if x1 == x2 and y1 == y2:
-                break
-            e2 = 2 * err
-            if e2 > -dy:
-                err -= dy
-                x1 += sx
-            if e2 < dx:
-                err += dx
-                y1 += sy
+        xs = self.xs + x_offset
+        keep = (xs < screen.width) & (self.ys < screen.height)
+        blit_cells(screen, xs[keep], self.ys[keep],
+                   np.full(int(keep.sum()), glyph, dtype=np.int32), colour)
 
 
 class PhysicsParticle:
     """
-    Advanced particle with realistic physics: mass, buoyancy, drag, and trails.
+    Advanced particle with realistic physics: mass, buoyancy and drag.
+    Trails are kept by the dashboard's TrailBuffer, one row per particle.
     "Newton's laws, applied to raindrops. He'd be proud. Or confused by the
     terminal. Probably confused." - Stormy
     """
@@ -347,12 +448,14 @@ class PhysicsParticle:
         self.lifetime = lifetime
         self.age = 0
         self.buoyancy = buoyancy
-        self.trail: deque = deque(maxlen=3)
         self.collided = False
+        self.rest = 0  # Frames left resting on something solid
     
     def update(self, wind_x: float, wind_y: float, turb_x: float, turb_y: float):
-        self.trail.append((int(self.x), int(self.y)))
-        
+        if self.rest > 0:
+            self.rest -= 1
+            self.age += 1
+            return
         # Wind and turbulence
         self.vx += wind_x + turb_x
         self.vy += wind_y + turb_y
@@ -573,12 +676,18 @@ class StormyPersonality:
 class WeatherDashboard:
     """The main Stormy weather dashboard."""
     
+    # Top rows of the animation pane used by the HUD: the most _perf_hud_lines
+    # builds (frame, tick, two bandwidth lines, fx, lod)
+    PERF_HUD_ROWS = 6
+    EFFECTS_BUDGET_SHARE = 0.15  # Share of the frame budget for special effects
+    
     def __init__(self, screen: Screen, weather: WeatherData):
         self.screen = screen
         self.weather = weather
         self.width = screen.width
         self.height = screen.height
         self.frame = 0
+        self.last_fetch = time.time()
         
         # Personality engine
         self.stormy = StormyPersonality()
@@ -592,7 +701,7 @@ class WeatherDashboard:
         if weather.condition == WeatherCondition.THUNDERSTORM:
             self.face = "concerned"
         elif weather.condition == WeatherCondition.CLEAR:
-            self.face = "knowing" if random.random() > 0.5 else "amused"
+            self.face = "knowing" if _personality.random() > 0.5 else "amused"
         elif weather.condition == WeatherCondition.FOG:
             self.face = "contemplative"
         elif weather.condition in (WeatherCondition.RAIN, WeatherCondition.HEAVY_RAIN):
@@ -600,12 +709,23 @@ class WeatherDashboard:
         elif hour < 6 or hour > 22:
             self.face = "contemplative"
         else:
-            self.face = random.choice(list(STORMY_FACES.keys()))
+            self.face = _personality.choice(list(STORMY_FACES.keys()))
         
         # Layout
-        self.sidebar_width = min(50, max(42, self.width // 3))
-        self.animation_start_x = self.sidebar_width + 1
-        self.animation_width = self.width - self.sidebar_width - 2
+        self._compute_layout()
+        
+        # Bandwidth-aware mode: per-frame byte cap, UI text first, flashes
+        # collapse to the pane border, frame rate drops when saturated
+        self.bandwidth: Optional[BandwidthBudget] = None
+        if MAX_BANDWIDTH:
+            self.bandwidth = BandwidthBudget(MAX_BANDWIDTH, target_fps=_frame_budget.target_fps)
+        self.flash_fill = self.bandwidth is None
+        
+        # Output backend: the animation pane is drawn onto self.canvas, which is
+        # either the asciimatics screen or a CellBuffer flushed by AnsiWriter
+        self.output_meter: Optional[ByteCounter] = None
+        self._setup_output()
+        self.show_perf_hud = self.bandwidth is not None
         
         # Animation
         self.particles = ParticleSystem()
@@ -619,14 +739,39 @@ class WeatherDashboard:
         self.turbulence = TurbulenceField()
         
         # Wind gust system with base wind from actual weather
-        wind_rad = math.radians(self.weather.wind_direction)
-        base_wind_x = math.sin(wind_rad) * self.weather.wind_speed_mph * 0.01
-        base_wind_y = math.cos(wind_rad) * self.weather.wind_speed_mph * 0.005
+        base_wind_x, base_wind_y = self._base_wind()
         self.wind_gusts = WindGustSystem(base_wind_x, base_wind_y)
         
-        # Perlin noise for cloud generation
+        # Coarse stable-fluids wind over the pane: particles sample it, and
+        # cloud density is carried along by it. Grid size is the quality knob.
+        self.quality = get_quality(QUALITY)
+        self.wind_field = WindField(
+            self.animation_width, self.height,
+            cell=self.quality.wind_cell,
+            iterations=self.quality.wind_iterations,
+            max_cells=self.quality.wind_max_cells,
+            rng=stream('wind').generator,
+        )
+        # The pane's top and bottom are walls, so the field carries the mean
+        # horizontal wind; the vertical mean is added when particles sample it
+        self.wind_field.set_wind(base_wind_x, 0.0)
+        
+        # Perlin noise for cloud generation (the source the wind field carries)
         self.cloud_noise = PerlinNoise()
         self.cloud_time = 0
+        self._cloud_target: Optional[np.ndarray] = None
+        # Fog pattern: a few slow travelling waves (wavenumbers x, y, phase, speed)
+        self._fog_waves = np.array([
+            (_weather.uniform(0.05, 0.2), _weather.uniform(0.1, 0.4),
+             _weather.uniform(0, 2 * math.pi), _weather.uniform(0.005, 0.02))
+            for _ in range(4)
+        ])
+        self._fog_visible = False
+        # Background rain sheets (set up with the weather, see _setup_sheets)
+        self._old_sheets: List[Tuple[RainSheet, int]] = []  # Fading out over a transition
+        self._old_sheet_density = 0.0
+        self._sheet_skew = 0.0
+        self._particle_dots = 0  # Distinct sub-cell dots lit last frame (sub-cell raster only)
         
         # ═══════════════════════════════════════════════════════════════════
         # ATMOSPHERIC MODEL (engine.physics.atmosphere)
@@ -689,19 +834,44 @@ class WeatherDashboard:
         self.render_stats = _render_stats
         self.frame_budget = _frame_budget
         self.render_queue = RenderQueue()  # Layered rendering queue
+        # Per-layer guards: expensive layers degrade when the frame runs long
+        self.perf_guard = PerformanceGuard(self.frame_budget, self.render_stats)
+        self.perf_guard.register('clouds', self._draw_clouds, reduced=self._draw_clouds_reduced)
+        self.perf_guard.register('fog', self._draw_fog, reduced=self._draw_fog_reduced)
+        self.perf_guard.register('sheets', self._draw_sheets, reduced=self._draw_sheets_reduced)
+        # Level of detail: subsystems that don't need every frame update at
+        # their own rate, staggered so their turns don't pile onto one frame.
+        # Costs are rough relative hints, heaviest first.
+        self.lod = LodScheduler()
+        self.lod.register('clouds', self._feed_clouds, LOD_EVERY['clouds'], cost=3.0)
+        self.lod.register('drifters', self._update_drifters, LOD_EVERY['drifters'], cost=2.0)
+        self.lod.register('fog', self._feed_fog, LOD_EVERY['fog'])
+        self.lod.register('evaporation', self._evaporate, LOD_EVERY['evaporation'])
+        self.lod.register('creatures', self._roll_creatures, LOD_EVERY['creatures'])
+        self.lod.register('chatter', self._update_chatter, LOD_EVERY['chatter'], cost=0.1)
+        self.lod.register('notifications', self._update_notifications,
+                          LOD_EVERY['notifications'], cost=0.1)
+        self._frame_open = False
+        # Tick rate: drops when the scene is quiet, wakes on input/weather change
+        self.scheduler = _idle_scheduler
+        self.scheduler.wake()
         # Advanced noise generators for organic effects
-        self.simplex_noise = SimplexNoise(seed=int(time.time()))
+        self.simplex_noise = SimplexNoise(seed=_weather.randint(1, 2 ** 31 - 1))
         self.domain_warp = DomainWarp(FractalNoise(), warp_strength=4.0)  # For warped cloud shapes
+        self._feed_clouds(seed=True)
         
-        # Advanced lightning bolts (branching fractals)
+        # Advanced lightning bolts (branching fractals), shapes pre-generated
         self.lightning_bolts: List[LightningBolt] = []
+        self._configure_bolts()
         self.flash_intensity = 0
         
         # Physics-based particles (separate from simple particle system)
         self.physics_particles: List[PhysicsParticle] = []
+        self.trails = TrailBuffer(self.quality.trail_length)  # Row i: physics_particles[i]
         
-        # Ground accumulation (rain puddles / snow drifts)
-        self.ground_accumulation = [0] * self.animation_width
+        # Ground accumulation (rain puddles / snow drifts) as a height field
+        self.ground = GroundField(self.animation_width, rng=stream('ground').generator)
+        self.ripples = RippleSurface(self.animation_width)
         
         # Easter egg creatures - rare supernatural visitors!
         self.easter_eggs = EasterEggManager(
@@ -710,6 +880,11 @@ class WeatherDashboard:
             self.height
         )
         
+        # Cells precipitation bounces off or settles on (sprites, location label)
+        self.occupancy = OccupancyMask(self.width, self.height)
+        # (xs, ys, vxs, vys) per particle list, built once per frame
+        self._batches = (self._particle_batch([]), self._particle_batch([]))
+        
         # ═══════════════════════════════════════════════════════════════════
         # ENHANCED FEATURES INITIALIZATION
         # ═══════════════════════════════════════════════════════════════════
@@ -741,7 +916,8 @@ class WeatherDashboard:
         if SPECIAL_EFFECTS_AVAILABLE:
             self.special_effects = SpecialEffectsManager(
                 self.animation_width,
-                self.height - 6
+                self.height - 6,
+                budget_ms=self.EFFECTS_BUDGET_SHARE * _frame_budget.frame_budget_ms,
             )
             # Determine which special effects to enable based on conditions
             self._setup_special_effects()
@@ -778,6 +954,120 @@ class WeatherDashboard:
             self.alert_banner = None
         
         self._setup_animation()
+        # Open on a pane already full of weather, not rain starting at the top
+        self.warm_frames = 0
+        self.warm_start()
+    
+    def _compute_layout(self):
+        """Sidebar width and animation pane bounds for the current screen size."""
+        self.sidebar_width = min(50, max(42, self.width // 3))
+        self.animation_start_x = self.sidebar_width + 1
+        self.animation_width = self.width - self.sidebar_width - 2
+    
+    def _setup_output(self):
+        """Create the pane canvas (and ANSI writer) for the current layout."""
+        self.canvas = self.screen
+        self.ansi_writer: Optional[AnsiWriter] = None
+        self._last_clear_bg = None
+        if OUTPUT_BACKEND == "ansi" or MAX_BANDWIDTH:
+            self.canvas = CellBuffer(self.width, self.height)
+            self.ansi_writer = AnsiWriter(
+                self.width, self.height,
+                region=(self.animation_start_x, 0, self.animation_width, self.height - 1),
+                fd=_terminal_fd(),
+            )
+        self._pane_priority = self._build_pane_priority() if self.bandwidth else None
+    
+    def relayout(self, screen: Screen):
+        """
+        Adopt a resized screen without rebuilding the dashboard.
+        
+        Weather, particles, achievements, the history database and active
+        effects all survive; only layout-dependent pieces are recomputed.
+        Particles and the ground are stretched into the new pane so the
+        storm carries on where it was.
+        "The window changed shape. The weather did not notice." - Stormy
+        """
+        old_ax, old_aw = self.animation_start_x, self.animation_width
+        self.screen = screen
+        self.width, self.height = screen.width, screen.height
+        self._compute_layout()
+        self._setup_output()
+        
+        ax, aw = self.animation_start_x, self.animation_width
+        scale = aw / max(1, old_aw)
+        
+        def remap(x: float) -> float:
+            return ax + (x - old_ax) * scale
+        
+        for p in self.physics_particles:
+            p.x = remap(p.x)
+        self.trails.remap_x(remap)
+        for p in self.particles.particles:
+            p.x = remap(p.x)
+            if hasattr(p, '_dx'):
+                p._dx *= scale  # Per-frame step used to extrapolate between LOD updates
+        self.engine_particle_system.bounds = (ax, 0, self.width, self.height)
+        
+        # Ground: resample the accumulation profile to the new pane width
+        self.ground.resize(aw)
+        self.ripples.resize(aw)
+        
+        self.easter_eggs.resize(ax, aw, self.height)
+        for bolt in self.lightning_bolts:
+            bolt.resize(aw, self.height - 4)  # Strikes end above the ground rows
+        self.occupancy.resize(self.width, self.height)
+        self.wind_field.resize(aw, self.height)
+        self._cloud_target = None
+        
+        if self.special_effects:
+            self.special_effects.resize(aw, self.height - 6)
+        
+        # Pooled bolt shapes were sized for the old pane
+        self._configure_bolts()
+        
+        if PANELS_AVAILABLE:
+            for panel in (self.forecast_panel, self.alert_banner, self.astro_panel,
+                          self.env_panel, self.achievement_display):
+                panel.screen = screen
+    
+    def _configure_bolts(self):
+        """
+        Point the bolt pool at generators for this pane (fractal is the quick fallback).
+        
+        The worker thread and inline fallback each draw from their own
+        stream, never the main thread's lightning stream: how many shapes
+        the worker makes depends on thread timing, and strike timing must
+        replay under --seed regardless.
+        """
+        _bolt_pool.configure(lambda: self._bolt_shape(_bolts),
+                             fallback=lambda: self._fractal_shape(_bolt_fallback))
+    
+    def _strike_shape(self) -> Raster:
+        """
+        Shape for a new bolt, ready-made from the pool. Which pooled shape
+        comes next depends on the worker's timing, so under --seed the shape
+        is made here instead, from a seed drawn off the lightning stream.
+        """
+        if STREAMS.seed is None:
+            return _bolt_pool.take()
+        return self._bolt_shape(RandomStream(_lightning.randint(0, 2 ** 31 - 1)))
+    
+    def _bolt_shape(self, rng: RandomStream) -> Raster:
+        """A bolt shape from the configured lightning model."""
+        if LIGHTNING_MODEL == "dbm":
+            return self._dbm_shape(rng)
+        return self._fractal_shape(rng)
+    
+    def _bolt_depth(self, rng: RandomStream) -> int:
+        """Rows from the cloud base (row 3) down into the lower half of the pane."""
+        return rng.randint(self.height // 2, self.height - 5) - 3
+    
+    def _fractal_shape(self, rng: RandomStream) -> Raster:
+        return fractal_bolt(self._bolt_depth(rng), rng=rng)
+    
+    def _dbm_shape(self, rng: RandomStream) -> Raster:
+        return dbm_bolt(self.animation_width, self._bolt_depth(rng), rng=rng.generator)
     
     def _fetch_extended_data(self):
         """Fetch extended weather data (forecast, alerts, astronomical, environmental)."""
@@ -916,6 +1206,11 @@ class WeatherDashboard:
         # B to show bestiary
         if key in (ord('b'), ord('B')):
             return 'bestiary'
+        
+        # P to toggle the performance HUD
+        if key in (ord('p'), ord('P')):
+            self.show_perf_hud = not self.show_perf_hud
+            return None
 
         # Space to toggle quips
         if key == ord(" "):
@@ -941,6 +1236,7 @@ class WeatherDashboard:
             "  B       - Creature bestiary",
             "  F       - Toggle forecast panel",
             "  U       - Toggle metric/imperial",
+            "  P       - Toggle performance HUD",
             "  ?       - Show/hide this help",
             "  Space   - Toggle Stormy quips",
             "",
@@ -955,15 +1251,22 @@ class WeatherDashboard:
         start_x = (screen.width - box_width) // 2
         start_y = (screen.height - box_height) // 2
         
-        # Draw background box
-        for dy in range(box_height):
-            screen.print_at(" " * box_width, start_x, start_y + dy, 
-                          colour=7, bg=0)
-        
-        # Draw help text
-        for i, line in enumerate(help_lines):
-            screen.print_at(line.center(max_width), start_x + 2, start_y + 1 + i,
-                          colour=7, bg=0)
+        for target in self._overlay_targets():
+            # Draw background box
+            for dy in range(box_height):
+                target.print_at(" " * box_width, start_x, start_y + dy, 
+                                colour=7, bg=0)
+            
+            # Draw help text
+            for i, line in enumerate(help_lines):
+                target.print_at(line.center(max_width), start_x + 2, start_y + 1 + i,
+                                colour=7, bg=0)
+    
+    def _overlay_targets(self) -> list:
+        """Surfaces an overlay must be drawn on to cover both sidebar and pane."""
+        if self.canvas is self.screen:
+            return [self.screen]
+        return [self.screen, self.canvas]
 
 
     def _setup_animation(self):
@@ -1009,13 +1312,13 @@ class WeatherDashboard:
             self.particle_colour = Theme.FROST
             self.spawn_rate = 18
         
-        # Fog - thick drifting mist layers
+        # Fog - a density field in the wind (see _feed_fog), not particles
         elif c == WeatherCondition.FOG:
             self.particles.gravity = 0
             self.particles.wind = 0.015  # Slow, creeping mist
             self.particle_chars = ["░", "▒", "≋", "~", "▓"]  # Dense mist chars
             self.particle_colour = Theme.MUTED
-            self.spawn_rate = 8  # Dense fog
+            self.spawn_rate = 0
         
         # CLOUDY - drifting cloud wisps
         elif c == WeatherCondition.CLOUDY:
@@ -1048,14 +1351,41 @@ class WeatherDashboard:
             self.particle_chars = [".", "'"]
             self.particle_colour = Theme.MUTED
             self.spawn_rate = 1
+        
+        self._setup_sheets()
+    
+    def _setup_sheets(self):
+        """
+        Background rain sheets for rainy weather: quality.sheet_layers
+        scrolling textures, denser the heavier the rain. They stand in for
+        the distant part of the rain, so fewer drops need simulating.
+        """
+        self.sheets: List[Tuple[RainSheet, int]] = []
+        self.sheet_density = 0.0
+        if self.weather.condition not in SHEET_CONDITIONS:
+            return
+        for share, glyphs, colour in SHEET_LAYERS[:self.quality.sheet_layers]:
+            self.sheets.append((RainSheet(glyphs, SHEET_SPEED * share, rng=_weather.generator), colour))
+        self.sheet_density = self.quality.sheet_density * min(1.0, self.spawn_rate / SHEET_FULL_RATE)
+
+    def _base_wind(self) -> Tuple[float, float]:
+        """Mean wind from the weather's speed and direction, in cells per frame."""
+        wind_rad = math.radians(self.weather.wind_direction)
+        return (math.sin(wind_rad) * self.weather.wind_speed_mph * 0.01,
+                math.cos(wind_rad) * self.weather.wind_speed_mph * 0.005)
 
     def transition_to(self, new_weather: WeatherData):
-        """Crossfade to new weather: decay old particles, ramp in new ones."""
+        """
+        Crossfade to new weather: the old particles drain out while the new
+        weather's, pre-simulated by warm_start(), are already in place.
+        """
+        self.scheduler.wake()
         self._transition_frames = 0
         self._transition_total = 60  # ~2 seconds at 30fps
         self._old_spawn_rate = self.spawn_rate
         self._old_particle_chars = self.particle_chars
         self._old_particle_colour = self.particle_colour
+        self._old_sheets, self._old_sheet_density = self.sheets, self.sheet_density
 
         # Update core weather state
         self.weather = new_weather
@@ -1065,10 +1395,25 @@ class WeatherDashboard:
         if self.new_achievements:
             self.achievement_display_timer = 120
 
-        # Configure new particle settings (saved for ramp-in)
+        # New mean wind for the gusts and the wind field
+        base_wind_x, base_wind_y = self._base_wind()
+        self.wind_gusts.base_wind_x, self.wind_gusts.base_wind_y = base_wind_x, base_wind_y
+        self.wind_field.set_wind(base_wind_x, 0.0)
+
+        # Configure new particle settings and pre-simulate the new population
+        # on its own, then merge the old one back to drain out
         self._setup_animation()
-        self._new_spawn_rate = self.spawn_rate
-        self.spawn_rate = 0  # Start at zero, ramp up
+        old_physics, old_trails = self.physics_particles, self.trails
+        old_particles = self.particles.particles
+        self.physics_particles, self.particles.particles = [], []
+        self.trails = TrailBuffer(old_trails.length)
+        held = self._hold_scene()
+        self.warm_start()
+        self._restore_scene(held)
+        old_trails.extend(self.trails)
+        self.physics_particles = old_physics + self.physics_particles
+        self.trails = old_trails
+        self.particles.particles = old_particles + self.particles.particles
 
         # Log to history db
         if self.weather_db:
@@ -1080,23 +1425,49 @@ class WeatherDashboard:
         # Re-fetch extended data
         self._extended_data_fetched = False
 
+    # Dashboard attributes the simulation advances besides the particles
+    SCENE_ATTRS = ('frame', 'cloud_time', '_cloud_target', '_cloud_cursor', '_fog_visible',
+                   '_sheet_skew')
+    
+    def _hold_scene(self) -> List[Tuple[Any, Dict[str, Any]]]:
+        """
+        Snapshot everything _simulate_weather() advances except the
+        particles and their trails: frame count, LOD schedule, gusts and
+        turbulence, the wind field with its cloud and fog density, rain
+        sheets, ground and ripples. _restore_scene() puts it back, so a
+        transition's warm start only adds the new particles.
+        """
+        own = vars(self)
+        held = [(self, {name: _held_copy(own[name]) for name in self.SCENE_ATTRS if name in own})]
+        parts = [self.lod, *self.lod.tasks.values(), self.turbulence, self.wind_gusts,
+                 self.wind_field, self.ground, self.ripples,
+                 *(sheet for sheet, _ in self.sheets + self._old_sheets)]
+        held += [(part, {name: _held_copy(value) for name, value in vars(part).items()})
+                 for part in parts]
+        return held
+    
+    def _restore_scene(self, held: List[Tuple[Any, Dict[str, Any]]]):
+        """Put back a scene snapshot taken by _hold_scene()."""
+        for part, state in held:
+            vars(part).update(state)
+    
     def _update_transition(self):
-        """Handle crossfade interpolation during weather transitions."""
+        """Count down the crossfade; the scene stays awake while old particles drain."""
         if not hasattr(self, '_transition_frames'):
             return
         self._transition_frames += 1
-        t = self._transition_frames / self._transition_total
-        if t >= 1.0:
-            self.spawn_rate = self._new_spawn_rate
+        if self._transition_frames >= self._transition_total:
             del self._transition_frames
-            return
-        # Ease-in: new particles ramp up using smoothstep
-        smooth = t * t * (3 - 2 * t)
-        self.spawn_rate = int(self._new_spawn_rate * smooth)
+            self._old_sheets = []
 
     def update(self):
         """Update animation state with advanced physics."""
-        self.frame += 1
+        # An idle tick covers several frames of simulation, so the scene
+        # keeps its speed at the lower tick rate
+        frames = self.scheduler.sim_frames()
+        self.frame += frames
+        self.frame_budget.begin_frame()
+        self._frame_open = True
         self._update_transition()
         
         # Lazy fetch extended data on first update
@@ -1104,42 +1475,27 @@ class WeatherDashboard:
             self._extended_data_fetched = True
             import threading
             threading.Thread(target=self._fetch_extended_data, daemon=True).start()
-        # ═══════════════════════════════════════════════════════════════════
-        # UPDATE ADVANCED PHYSICS SYSTEMS
-        # ═══════════════════════════════════════════════════════════════════
-        self.turbulence.update()
-        self.wind_gusts.update()
-        self.cloud_time += 0.02
         
-        # Get current wind (base + gusts)
-        wind_x, wind_y = self.wind_gusts.get_wind()
+        wind_x = self._simulate_weather(frames)
         
         # ═══════════════════════════════════════════════════════════════════
-        # UPDATE ENGINE PARTICLE SYSTEM (engine.physics.particles)
+        # STORMY'S PERSONALITY UPDATES
         # ═══════════════════════════════════════════════════════════════════
-        self.frame_budget.begin_frame()
-        self.engine_particle_system.update(1.0)  # Uses Vector2, forces, integrators
-        frame_ms = self.frame_budget.end_frame()
-        self.render_stats.record_frame(frame_ms / 1000.0, self.engine_particle_system.active_particle_count)
+        self.lod.run('chatter')
         
-        # Update legacy physics particles (kept for compatibility)
-        for p in self.physics_particles:
-            turb_x, turb_y = self.turbulence.get_turbulence(p.x, p.y)
-            p.update(wind_x, wind_y, turb_x, turb_y)
-            
-            # Ground accumulation for rain/snow
-            if p.y >= self.height - 3 and not p.collided:
-                idx = int(p.x - self.animation_start_x) % self.animation_width
-                if 0 <= idx < len(self.ground_accumulation):
-                    self.ground_accumulation[idx] = min(5, self.ground_accumulation[idx] + 0.5)
-                    p.collided = True
+        # Easter egg creatures - spawn rolls at a low rate, movement every frame
+        self.lod.run('creatures')
         
-        # Remove expired physics particles
-        self.physics_particles = [
-            p for p in self.physics_particles 
-            if not p.is_expired(self.width, self.height)
-        ]
+        # Bolts, flashes, creatures and effects step once per frame, so an
+        # idle tick runs them once for each frame it covers
+        for _ in range(frames):
+            self._animate_frame(wind_x)
         
+        self.lod.run('notifications')
+        self.scheduler.observe(self._estimate_activity())
+    
+    def _animate_frame(self, wind_x):
+        """Advance the per-frame animation (bolts, flash, creatures, effects) by one frame"""
         # Update lightning bolts (branching fractals)
         for bolt in self.lightning_bolts:
             bolt.update()
@@ -1149,26 +1505,177 @@ class WeatherDashboard:
         if self.flash_intensity > 0:
             self.flash_intensity *= 0.7
         
-        # Ground accumulation evaporation
-        for i in range(len(self.ground_accumulation)):
-            if random.random() < 0.005:
-                self.ground_accumulation[i] = max(0, self.ground_accumulation[i] - 0.1)
+        if self.achievement_display_timer > 0:
+            self.achievement_display_timer -= 1
         
         # ═══════════════════════════════════════════════════════════════════
-        # STORMY'S PERSONALITY UPDATES
+        # ADVANCED LIGHTNING SYSTEM (Branching fractals)
+        # ═══════════════════════════════════════════════════════════════════
+        if self.weather.condition == WeatherCondition.THUNDERSTORM:
+            if self.lightning_timer > 0:
+                self.lightning_timer -= 1
+            elif _lightning.random() < 0.02:
+                # Spawn a new branching lightning bolt!
+                # The shape comes ready-made from the pool (made here under --seed)
+                bolt_x = _lightning.randint(self.animation_start_x + 10, self.width - 10)
+                bolt = LightningBolt(
+                    bolt_x - self.animation_start_x, 
+                    3, 
+                    _lightning.randint(self.height // 2, self.height - 5),
+                    self.animation_width,
+                    shape=self._strike_shape(),
+                )
+                self.lightning_bolts.append(bolt)
+                self.lightning_active = True
+                self.lightning_timer = _lightning.randint(3, 6)
+                self.flash_intensity = 1.0  # Screen flash
+            else:
+                self.lightning_active = len(self.lightning_bolts) > 0
+        
+        self.easter_eggs.update()
+        
+        # ═══════════════════════════════════════════════════════════════════
+        # UPDATE ENHANCED FEATURES
         # ═══════════════════════════════════════════════════════════════════
-        self.comment_timer += 1
+        
+        # Update special effects (each takes only the inputs it declares)
+        if self.special_effects:
+            self.special_effects.update(
+                wind_x=wind_x,
+                wind_speed=max(1.0, self.weather.wind_speed_mph / 10),
+            )
+    
+    def _update_chatter(self, frames: int):
+        """Every ~10 s, maybe swap between a quip and a weather comment."""
+        self.comment_timer += frames
         if self.comment_timer > 300:
             self.comment_timer = 0
-            if random.random() > 0.6:
+            if _personality.random() > 0.6:
                 self.quip_mode = not self.quip_mode
                 if self.quip_mode:
                     self.current_comment = self.stormy.get_random_quip()
                 else:
                     self.current_comment = self.stormy.get_weather_comment(self.weather)
+    
+    def _roll_creatures(self, frames: int):
+        """Roll for a creature visit, frames' worth of per-frame chances in one draw."""
+        spawned = self.easter_eggs.try_spawn(self.weather.condition, datetime.now().hour,
+                                             rolls=frames)
+        if spawned and self.easter_eggs.current_creature_name:
+            self.stormy.log_creature_sighting(self.easter_eggs.current_creature_name)
+    
+    def _update_notifications(self, frames: int):
+        """Drop expired notifications (they expire by wall-clock time)."""
+        if self.notifications:
+            self.notifications.update()
+    
+    def warm_start(self, frames: int = WARM_START_FRAMES,
+                   budget_ms: Optional[float] = WARM_START_MS) -> int:
+        """
+        Fast-forward the weather simulation so the pane opens already full.
+        
+        Runs up to frames virtual frames of _simulate_weather (no drawing,
+        no UI) and stops early once budget_ms of wall-clock time is spent,
+        so a slow machine gets a thinner head start rather than a slow
+        start. A seeded run (--seed) ignores the clock so it replays
+        exactly. Returns the number of frames simulated.
+        """
+        unbounded = budget_ms is None or STREAMS.seed is not None
+        deadline = math.inf if unbounded else time.perf_counter() + budget_ms / 1000
+        ran = 0
+        while ran < frames and time.perf_counter() < deadline:
+            self.frame += 1
+            self._simulate_weather()
+            ran += 1
+        self.warm_frames = ran
+        return ran
+    
+    def _simulate_weather(self, frames: int = 1) -> float:
+        """
+        Advance the weather simulation: wind, cloud and fog density,
+        precipitation and drifting particles, ground. Draws nothing, so
+        warm_start() can run it ahead. frames > 1 (an idle tick) covers
+        that many frames in one step: the LOD tasks catch up, the wind
+        field takes one longer step, spawns scale up. Returns the gusting
+        horizontal wind.
+        """
+        # ═══════════════════════════════════════════════════════════════════
+        # UPDATE ADVANCED PHYSICS SYSTEMS
+        # ═══════════════════════════════════════════════════════════════════
+        self.lod.tick(frames)
+        gusts = self.wind_gusts
+        gust_started = False
+        for _ in range(frames):
+            self.turbulence.update()
+            gusts.update()
+            gust_started |= gusts.gust_started
+        self.cloud_time += 0.02 * frames
         
-        if self.achievement_display_timer > 0:
-            self.achievement_display_timer -= 1
+        # Get current wind (base + gusts)
+        wind_x, wind_y = gusts.get_wind()
+        
+        # Gusts push a blob of air into the wind field, which turns into eddies
+        if gust_started:
+            self.wind_field.gust(
+                _weather.uniform(0, self.animation_width), _weather.uniform(2, self.height - 3),
+                math.cos(gusts.gust_angle) * gusts.gust_strength,
+                math.sin(gusts.gust_angle) * gusts.gust_strength,
+                radius=self.animation_width / 4,
+            )
+        if self.weather.condition in CLOUD_CONDITIONS:
+            self.lod.run('clouds')
+        self.lod.run('fog')
+        self.wind_field.step(frames)
+        for sheet, _ in self.sheets + self._old_sheets:
+            sheet.scroll(frames)
+        self._sheet_skew = wind_x / SHEET_SPEED  # Lean of the sheets: columns per row fallen
+        
+        # ═══════════════════════════════════════════════════════════════════
+        # UPDATE ENGINE PARTICLE SYSTEM (engine.physics.particles)
+        # ═══════════════════════════════════════════════════════════════════
+        self.frame_budget.begin_phase('particles')
+        self.engine_particle_system.update(float(frames))  # Uses Vector2, forces, integrators
+        self.frame_budget.end_phase('particles')
+        
+        self._build_occupancy()
+        
+        # Update legacy physics particles (kept for compatibility)
+        # Local wind from the field, one bilinear lookup for the whole batch
+        ax = self.animation_start_x
+        base_wind_y = self.wind_gusts.base_wind_y
+        n = len(self.physics_particles)
+        xs = np.fromiter((p.x for p in self.physics_particles), float, n)
+        ys = np.fromiter((p.y for p in self.physics_particles), float, n)
+        self.trails.record(xs, ys)  # Where each particle was before this step
+        us, vs = self.wind_field.sample(xs - ax, ys)
+        landed = []
+        for p, u, v in zip(self.physics_particles, us.tolist(), vs.tolist()):
+            for _ in range(frames):
+                p.update(u, v + base_wind_y, 0.0, 0.0)
+            
+            # Ground accumulation for rain/snow
+            if p.y >= self.height - 3 and not p.collided:
+                landed.append(int(p.x - self.animation_start_x) % self.animation_width)
+                p.collided = True
+        self.ground.deposit(landed)
+        snowing = self.weather.condition in (WeatherCondition.SNOW, WeatherCondition.HEAVY_SNOW)
+        if not snowing:
+            self.ripples.splash(landed)
+        
+        # Remove expired physics particles
+        keep = [not p.is_expired(self.width, self.height) for p in self.physics_particles]
+        self.physics_particles = list(compress(self.physics_particles, keep))
+        self.trails.cull(np.array(keep, dtype=bool))
+        
+        # Ground accumulation: evaporation, and snow drifts slumping downwind
+        self.lod.run('evaporation')
+        if snowing:
+            self.ground.slump(wind=wind_x * DRIFT_WIND_BIAS, passes=frames)
+        else:
+            # Puddle ripples only move where there's a visible puddle
+            wet = self.ground.heights >= 1.0
+            for _ in range(frames):
+                self.ripples.step(wet=wet)
         
         # ═══════════════════════════════════════════════════════════════════
         # SPAWN PARTICLES (Using physics-based system for precipitation)
@@ -1181,109 +1688,233 @@ class WeatherDashboard:
             WeatherCondition.SNOW, WeatherCondition.HEAVY_SNOW, WeatherCondition.THUNDERSTORM
         )
         
-        # Spawn physics-based particles for precipitation
-        if is_precipitation and self.frame % 2 == 0:
-            for _ in range(self.spawn_rate // 2):
-                x = random.uniform(self.animation_start_x + 2, self.width - 3)
-                char = random.choice(self.particle_chars) if self.particle_chars else "."
-                
-                if self.weather.condition in (WeatherCondition.SNOW, WeatherCondition.HEAVY_SNOW):
-                    # Light, floaty snow
-                    p = PhysicsParticle(x, 3, char, Theme.SNOW,
-                                       vx=random.uniform(-0.2, 0.2),
-                                       vy=random.uniform(0.1, 0.4),
-                                       mass=0.2, buoyancy=0.3)
-                else:
-                    # Heavier rain
-                    p = PhysicsParticle(x, 3, char, Theme.FROST,
-                                       vx=random.uniform(-0.3, 0.3),
-                                       vy=random.uniform(1.0, 2.5),
-                                       mass=0.6)
-                self.physics_particles.append(p)
-        
-        # Regular particles for drifting effects
-        for _ in range(self.spawn_rate):
-            if self.particle_chars:
-                if is_drifter:
-                    p = Particle(
-                        x=self.animation_start_x + 2,
-                        y=random.uniform(4, self.height - 6),
-                        vx=random.uniform(0.3, 0.8),
-                        vy=random.uniform(-0.05, 0.05),
-                        char=random.choice(self.particle_chars),
-                        colour=self.particle_colour
-                    )
+        # Spawn physics-based particles for precipitation, each batch drawn in bulk
+        is_snow = self.weather.condition in (WeatherCondition.SNOW, WeatherCondition.HEAVY_SNOW)
+        chars = self.particle_chars or ["."]
+        g = _spawner.generator
+        # Precipitation spawns on even frames: count those this step covered
+        n = (self.spawn_rate // 2) * (self.frame // 2 - (self.frame - frames) // 2)
+        if is_precipitation and n > 0:
+            xs = g.uniform(self.animation_start_x + 2, self.width - 3, n).tolist()
+            picks = g.integers(len(chars), size=n).tolist()
+            if is_snow:
+                # Light, floaty snow
+                vxs, vys = g.uniform(-0.2, 0.2, n).tolist(), g.uniform(0.1, 0.4, n).tolist()
+                colour, mass, buoyancy = Theme.SNOW, 0.2, 0.3
+            else:
+                # Heavier rain
+                vxs, vys = g.uniform(-0.3, 0.3, n).tolist(), g.uniform(1.0, 2.5, n).tolist()
+                colour, mass, buoyancy = Theme.FROST, 0.6, 0.0
+            self.physics_particles.extend(
+                PhysicsParticle(x, 3, chars[k], colour, vx=vx, vy=vy, mass=mass, buoyancy=buoyancy)
+                for x, k, vx, vy in zip(xs, picks, vxs, vys)
+            )
+            self.trails.spawn(n)
+        
+        # Regular particles for drifting effects; behind rain sheets only the
+        # foreground share of the falling ones is simulated
+        n = self.spawn_rate if self.particle_chars else 0
+        if self.sheets and not is_drifter:
+            n = round(n * FOREGROUND_SHARE)
+        n *= frames
+        if n > 0:
+            picks = g.integers(len(chars), size=n).tolist()
+            # A multi-frame step spreads its spawns along the way they would
+            # have travelled, so they don't enter as one clump
+            lead = g.uniform(0, frames - 1, n) if frames > 1 else np.zeros(n)
+            if is_drifter:
+                ys = g.uniform(4, self.height - 6, n).tolist()
+                vxs, vys = g.uniform(0.3, 0.8, n), g.uniform(-0.05, 0.05, n)
+                starts = (self.animation_start_x + 2 + vxs * lead).tolist()
+                for x, y, k, vx, vy in zip(starts, ys, picks, vxs.tolist(), vys.tolist()):
+                    p = Particle(x=x, y=y, vx=vx, vy=vy,
+                                 char=chars[k], colour=self.particle_colour)
                     p._horiz = True
-                else:
-                    p = Particle(
-                        x=random.uniform(self.animation_start_x + 2, self.width - 3),
-                        y=random.uniform(2, 5),
-                        vx=self.particles.wind * 3 + random.uniform(-0.15, 0.15),
-                        vy=random.uniform(0.4, 1.4),
-                        char=random.choice(self.particle_chars),
-                        colour=self.particle_colour
-                    )
+                    self.particles.spawn(p)
+            else:
+                xs = g.uniform(self.animation_start_x + 2, self.width - 3, n).tolist()
+                ys = g.uniform(2, 5, n)
+                vxs = (self.particles.wind * 3 + g.uniform(-0.15, 0.15, n)).tolist()
+                vys = g.uniform(0.4, 1.4, n)
+                ys = (ys + vys * lead).tolist()
+                vys = vys.tolist()
+                drifts = g.uniform(0, 6.28, n).tolist() if is_snow else None
+                for i, (x, y, k, vx, vy) in enumerate(zip(xs, ys, picks, vxs, vys)):
+                    p = Particle(x=x, y=y, vx=vx, vy=vy, char=chars[k], colour=self.particle_colour)
                     p._horiz = False
-                    if self.weather.condition in (WeatherCondition.SNOW, WeatherCondition.HEAVY_SNOW):
-                        p._drift = random.uniform(0, 6.28)
-                self.particles.spawn(p)
+                    if drifts is not None:
+                        p._drift = drifts[i]
+                    self.particles.spawn(p)
         
-        for p in self.particles.particles:
-            if hasattr(p, '_drift'):
-                p.x += 0.3 * math.sin(p.age * 0.07 + p._drift)
-            if getattr(p, '_horiz', False):
-                p.x += p.vx
-                p.y += p.vy
-                p.age += 1
-            else:
-                p.update(self.particles.gravity, self.particles.wind, 0)
+        # Simple particles: a background layer, updated at a lower rate
+        self.lod.run('drifters')
         
+        self._batches = (self._particle_batch(self.physics_particles),
+                         self._particle_batch(self.particles.particles))
+        self._collide_precipitation()
         self.particles.particles = [
             p for p in self.particles.particles
             if 3 <= p.y < self.height - 2 and self.animation_start_x < p.x < self.width - 1
+            and not (getattr(p, '_hit', False) and p.age >= p.max_age)
         ]
-        
-        # ═══════════════════════════════════════════════════════════════════
-        # ADVANCED LIGHTNING SYSTEM (Branching fractals)
-        # ═══════════════════════════════════════════════════════════════════
-        if self.weather.condition == WeatherCondition.THUNDERSTORM:
-            if self.lightning_timer > 0:
-                self.lightning_timer -= 1
-            elif random.random() < 0.02:
-                # Spawn a new branching lightning bolt!
-                bolt_x = random.randint(self.animation_start_x + 10, self.width - 10)
-                bolt = LightningBolt(
-                    bolt_x - self.animation_start_x, 
-                    3, 
-                    random.randint(self.height // 2, self.height - 5),
-                    self.animation_width
-                )
-                self.lightning_bolts.append(bolt)
-                self.lightning_active = True
-                self.lightning_timer = random.randint(3, 6)
-                self.flash_intensity = 1.0  # Screen flash
+        return wind_x
+    
+    def _evaporate(self, frames: int):
+        self.ground.evaporate(frames=frames)
+    
+    def _update_drifters(self, frames: int):
+        """
+        Advance the simple particles by frames frames at once.
+        
+        They keep their own drift and are swirled by the field's eddies
+        (its deviation from the mean wind). Gravity and wind are applied
+        in closed form for the whole step; each particle keeps its
+        per-frame motion (_dx, _dy) so the frames in between can be drawn
+        extrapolated (see _drifter_positions).
+        """
+        ax = self.animation_start_x
+        particles = self.particles.particles
+        n = len(particles)
+        us, vs = self.wind_field.sample(
+            np.fromiter((p.x - ax for p in particles), float, n),
+            np.fromiter((p.y for p in particles), float, n),
+        )
+        us -= self.wind_field.target[0]
+        gravity, wind = self.particles.gravity, self.particles.wind
+        ramp = frames * (frames + 1) / 2  # Sum of 1..frames: velocity gained step by step
+        for p, du, dv in zip(particles, us.tolist(), vs.tolist()):
+            x, y = p.x, p.y
+            if getattr(p, '_rest', 0) > 0:
+                p._rest -= frames
+                p.age += frames
+                p._dx = p._dy = 0.0
+                continue
+            if hasattr(p, '_drift'):
+                p.x += 0.3 * frames * math.sin(p.age * 0.07 + p._drift)
+            p.x += du * frames
+            p.y += dv * frames
+            if getattr(p, '_horiz', False):
+                p.x += p.vx * frames
+                p.y += p.vy * frames
             else:
-                self.lightning_active = len(self.lightning_bolts) > 0
-        
-        # Easter egg creatures - try to spawn, track sightings, update
-        hour = datetime.now().hour
-        was_active = self.easter_eggs.is_active
-        spawned = self.easter_eggs.try_spawn(self.weather.condition, hour)
-        if spawned and self.easter_eggs.current_creature_name:
-            self.stormy.log_creature_sighting(self.easter_eggs.current_creature_name)
-        self.easter_eggs.update()
-        
-        # ═══════════════════════════════════════════════════════════════════
-        # UPDATE ENHANCED FEATURES
-        # ═══════════════════════════════════════════════════════════════════
-        
-        # Update special effects
-        if self.special_effects:
-            self.special_effects.update()
-        
-        # Update notifications
-        if self.notifications:
-            self.notifications.update()
+                p.x += p.vx * frames + wind * ramp
+                p.y += p.vy * frames + gravity * ramp
+                p.vx += wind * frames
+                p.vy += gravity * frames
+            p.age += frames
+            p._dx, p._dy = (p.x - x) / frames, (p.y - y) / frames
+    
+    def _drifter_positions(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Simple particle positions for drawing, extrapolated between their updates."""
+        particles = self.particles.particles
+        n = len(particles)
+        xs = np.fromiter((p.x for p in particles), float, n)
+        ys = np.fromiter((p.y for p in particles), float, n)
+        lag = self.lod.since('drifters')
+        if lag:
+            xs += lag * np.fromiter((getattr(p, '_dx', 0.0) for p in particles), float, n)
+            ys += lag * np.fromiter((getattr(p, '_dy', 0.0) for p in particles), float, n)
+        return xs, ys
+    
+    def _build_occupancy(self):
+        """Stamp this frame's solid cells: creature sprites and the location label."""
+        occ = self.occupancy
+        occ.clear()
+        self.easter_eggs.stamp(occ)
+        label = len(f"{self.weather.location}"[:self.animation_width - 4])
+        occ.add_rect(self.animation_start_x + 3, self.height - 4, label, 1)
+    
+    @staticmethod
+    def _particle_batch(particles) -> Tuple[np.ndarray, ...]:
+        """(xs, ys, vxs, vys) of a particle list as arrays."""
+        n = len(particles)
+        return (np.fromiter((p.x for p in particles), float, n),
+                np.fromiter((p.y for p in particles), float, n),
+                np.fromiter((p.vx for p in particles), float, n),
+                np.fromiter((p.vy for p in particles), float, n))
+    
+    def _collide_precipitation(self):
+        """
+        Rain splashes off, and snow settles on, anything in the occupancy mask.
+        
+        Each particle list is tested with one vectorized mask lookup (at the
+        particle and halfway back along its last step, so fast rain can't
+        skip a one-row label); only the few hits get per-particle work.
+        """
+        occ = self.occupancy
+        if not occ.mask.any():
+            return
+        snow = self.weather.condition in (WeatherCondition.SNOW, WeatherCondition.HEAVY_SNOW)
+        for particles, (xs, ys, vxs, vys) in zip((self.physics_particles, self.particles.particles),
+                                                 self._batches):
+            n = len(particles)
+            if not n:
+                continue
+            free = np.fromiter((not getattr(p, '_hit', False) for p in particles), bool, n)
+            hit = free & (vys > 0) & (occ.hits(xs, ys) | occ.hits(xs - vxs / 2, ys - vys / 2))
+            for i in np.flatnonzero(hit).tolist():
+                self._settle(particles[i]) if snow else self._splash(particles[i])
+    
+    @staticmethod
+    def _splash(p):
+        """Bounce a raindrop up and sideways off a solid cell, briefly."""
+        p._hit = True
+        p.y = int(p.y) - 1
+        p.vx = _spawner.choice((-1, 1)) * _spawner.uniform(0.3, 0.8)
+        p.vy = -abs(p.vy) * 0.3
+        p.char = _spawner.choice(SPLASH_CHARS)
+        p._dx = p._dy = 0.0
+        if isinstance(p, PhysicsParticle):
+            p.lifetime = p.age + SPLASH_FRAMES
+        else:
+            p.max_age = p.age + SPLASH_FRAMES
+    
+    @staticmethod
+    def _settle(p):
+        """Rest a snowflake on top of a solid cell until it melts."""
+        p._hit = True
+        p.y = int(p.y) - 1
+        p.vx = p.vy = 0.0
+        p._dx = p._dy = 0.0
+        if isinstance(p, PhysicsParticle):
+            p.rest = SETTLE_FRAMES
+            p.lifetime = p.age + SETTLE_FRAMES
+        else:
+            p._rest = SETTLE_FRAMES
+            p.max_age = p.age + SETTLE_FRAMES
+    
+    def _estimate_activity(self) -> float:
+        """
+        Rough fraction of animation-pane cells that change per frame.
+        
+        Particles count by how far they move (a mote drifting a third of a
+        cell per frame only changes a cell every third frame), creatures by
+        sprite area. Lightning, special effects and transitions return 1.0
+        outright: they must never be shown at the idle rate. The sidebar
+        clock changes once a minute, well within any idle tick rate.
+        """
+        if (self.lightning_bolts or self.lightning_active or self.flash_intensity > 0.05
+                or hasattr(self, '_transition_frames')
+                or (self.special_effects and self.special_effects.active_effects)):
+            return 1.0
+        
+        # From this frame's particle arrays (taken before the end-of-frame cull)
+        (_, _, pvx, pvy), (_, _, vxs, vys) = self._batches
+        moving = float(np.minimum(np.abs(vxs) + np.abs(vys), 1.0).sum())
+        # Physics particles: head plus trail cells
+        moving += float(np.minimum(np.abs(pvx) + np.abs(pvy), 1.0).sum()) * (1 + self.trails.length)
+        moving += len(self.engine_particle_system.particles)
+        moving += self.easter_eggs.moving_cells()
+        if self._fog_visible:
+            # Fog cells change as the field drifts through the dither pattern
+            moving += self._fog_cells() * min(1.0, abs(self.wind_field.target[0]))
+        width, height = self._sheet_area()
+        for sheet, _, density in self._sheet_layers():
+            moving += width * height * density * min(1.0, sheet.speed)
+        
+        pane_cells = max(1, (self.animation_width - 2) * (self.height - 4))
+        # Each move touches two cells: the one vacated and the one entered
+        return 2 * moving / pane_cells
 
     def draw(self):
         """Draw the dashboard with layer-timed rendering."""
@@ -1292,8 +1923,11 @@ class WeatherDashboard:
         # Clear render queue for this frame
         self.render_queue.clear()
         
-        # Background flash based on lightning intensity
-        if self.flash_intensity > 0.7:
+        # Background flash based on lightning intensity (repaints every
+        # cell, so bandwidth mode flashes the pane border instead)
+        if not self.flash_fill:
+            bg = Screen.COLOUR_BLACK
+        elif self.flash_intensity > 0.7:
             bg = Screen.COLOUR_WHITE
         elif self.flash_intensity > 0.3:
             bg = Theme.SUN
@@ -1302,6 +1936,12 @@ class WeatherDashboard:
         else:
             bg = Screen.COLOUR_BLACK
         self.screen.clear_buffer(bg, Screen.A_NORMAL, bg)
+        if self.ansi_writer:
+            self.canvas.clear_buffer(bg, Screen.A_NORMAL, bg)
+            if bg != self._last_clear_bg:
+                # asciimatics repaints the whole screen (pane included) on a bg change
+                self.ansi_writer.invalidate()
+        self._last_clear_bg = bg
         
         # Layer 1: UI Background (sidebar)
         _t0 = _time.perf_counter()
@@ -1318,22 +1958,136 @@ class WeatherDashboard:
         self._draw_footer()
         self.render_stats.record_layer("footer", _time.perf_counter() - _t0)
         
+        if self.show_perf_hud:
+            self._draw_perf_hud()
+        
         # Achievement popup
         if self.achievement_display_timer > 0 and self.new_achievements:
             self._draw_achievement_popup()
+        
+        # Close the frame opened in update() (redraws after overlays don't count)
+        if self._frame_open:
+            self._frame_open = False
+            frame_ms = self.frame_budget.end_frame()
+            particle_count = len(self.physics_particles) + len(self.particles.particles)
+            self.render_stats.record_frame(frame_ms / 1000.0, particle_count)
+    
+    def present(self):
+        """
+        Finish a frame after screen.refresh(): flush the pane through the
+        direct ANSI backend (if enabled) and record bytes per output path.
+        """
+        ui_bytes = 0
+        if self.output_meter is not None:
+            ui_bytes = self.output_meter.take()
+            self.render_stats.record_output("asciimatics", ui_bytes)
+        if self.ansi_writer is None:
+            return
+        
+        if self.bandwidth:
+            # asciimatics (sidebar, footer) has already gone out in full;
+            # the pane gets whatever is left of this frame's byte cap
+            nbytes = self.ansi_writer.flush(
+                self.canvas,
+                max_bytes=max(0, self.bandwidth.frame_cap() - ui_bytes),
+                priority=self._pane_priority,
+            )
+            self.bandwidth.record(ui_bytes + nbytes)
+            self.bandwidth.end_frame(self.ansi_writer.last_deferred)
+        else:
+            nbytes = self.ansi_writer.flush(self.canvas)
+        self.render_stats.record_output("ansi", nbytes)
+        
+        # We moved the cursor and changed colours behind asciimatics' back;
+        # make it re-send both on its next refresh
+        resync = getattr(self.screen, "_reset", None)
+        if resync:
+            resync()
+    
+    def invalidate_output(self):
+        """Repaint the whole pane next frame (another screen drew over it)."""
+        if self.ansi_writer:
+            self.ansi_writer.invalidate()
+    
+    def frame_delay(self) -> float:
+        """Seconds to wait for input between frames (longer when idle or saturated)."""
+        delay = self.scheduler.tick_interval()
+        if self.bandwidth:
+            return max(delay, self.bandwidth.frame_interval())
+        return delay
+    
+    def _build_pane_priority(self):
+        """Mask of pane cells holding UI text: border, title, HUD rows, location label."""
+        ax, aw = self.animation_start_x, self.animation_width
+        mask = np.zeros((self.height, self.width), dtype=bool)
+        mask[0, ax:ax + aw] = True
+        mask[1:1 + self.PERF_HUD_ROWS, ax:ax + aw] = True
+        mask[0:self.height - 1, ax] = True
+        mask[0:self.height - 1, ax + aw - 1] = True
+        mask[self.height - 4, ax + 3:ax + aw - 1] = True
+        return mask
+    
+    def _perf_hud_lines(self) -> List[str]:
+        """Text lines for the performance HUD."""
+        report = self.render_stats.get_report()
+        lines = [
+            f"{report['fps']:5.1f} fps  {report['avg_ms']:5.1f} ms  p95 {report['p95_ms']:5.1f} ms"
+            f"  q{self.frame_budget.quality_level:.1f}",
+        ]
+        sched = self.scheduler.get_report()
+        lines.append(
+            f"tick {sched['tick_rate']:.0f} fps {'idle' if sched['idle'] else 'active'}"
+            f"  activity {sched['activity']:.2f}  cpu {sched['cpu_s_per_min']:.1f} s/min"
+            f"  wind {self.wind_field.get_report()['grid']} {self.wind_field.step_ms:.2f}ms"
+        )
+        if PARTICLE_RASTER != "glyph":
+            count = len(self.physics_particles) + len(self.particles.particles)
+            lines[-1] += f"  {PARTICLE_RASTER} {count}p/{self._particle_dots}d"
+        if self.bandwidth:
+            bw = self.bandwidth
+            lines.append(
+                f"out {bw.bytes_per_sec() / 1024:5.1f}/{bw.max_bytes_per_sec / 1024:.1f} KiB/s"
+                f"  {bw.fps:4.1f} fps{'  SATURATED' if bw.saturated else ''}"
+            )
+            lines.append(
+                f"frame {bw.frame_bytes}/{bw.frame_cap()} B  deferred {bw.deferred_cells} cells"
+            )
+        elif report['bytes_per_frame']:
+            lines.append("  ".join(
+                f"{source} {nbytes:.0f} B/f" for source, nbytes in report['bytes_per_frame'].items()
+            ))
+        if self.special_effects and self.special_effects.slots:
+            lines.append("fx " + "  ".join(
+                f"{fx['name']} {fx['frame_ms']:.2f}ms" + (f" 1/{fx['render_every']}" if fx['render_every'] > 1 else "")
+                for fx in self.special_effects.get_report()
+            ))
+        # LOD update rates actually achieved (Hz), per subsystem
+        lines.append("lod " + "  ".join(
+            f"{name} {task['rate_hz']:.0f}Hz" for name, task in self.lod.get_report().items()
+        ))
+        return lines
+    
+    def _draw_perf_hud(self):
+        """Draw frame, output and bandwidth stats in the top of the animation pane."""
+        ax, aw = self.animation_start_x, self.animation_width
+        for i, line in enumerate(self._perf_hud_lines()):
+            self.canvas.print_at(line[:aw - 4].ljust(aw - 4), ax + 2, 1 + i,
+                                 colour=Theme.MUTED, bg=Screen.COLOUR_BLACK)
     
-    def _draw_box(self, x: int, y: int, w: int, h: int, title: str = "", colour=Theme.FROST):
+    def _draw_box(self, x: int, y: int, w: int, h: int, title: str = "", colour=Theme.FROST,
+                  target=None):
         """Draw a box with optional title."""
-        self.screen.print_at("+" + "-" * (w - 2) + "+", x, y, colour=colour)
+        target = target or self.screen
+        target.print_at("+" + "-" * (w - 2) + "+", x, y, colour=colour)
         for row in range(1, h - 1):
-            self.screen.print_at("|", x, y + row, colour=colour)
-            self.screen.print_at("|", x + w - 1, y + row, colour=colour)
-        self.screen.print_at("+" + "-" * (w - 2) + "+", x, y + h - 1, colour=colour)
+            target.print_at("|", x, y + row, colour=colour)
+            target.print_at("|", x + w - 1, y + row, colour=colour)
+        target.print_at("+" + "-" * (w - 2) + "+", x, y + h - 1, colour=colour)
         
         if title:
             t = f" {title} "
             tx = x + (w - len(t)) // 2
-            self.screen.print_at(t, tx, y, colour=Theme.SUN)
+            target.print_at(t, tx, y, colour=Theme.SUN)
     
     def _draw_sidebar(self):
         """Draw the info sidebar."""
@@ -1507,86 +2261,43 @@ class WeatherDashboard:
         
         title = "󱐋 LIVE" if self.weather.condition == WeatherCondition.THUNDERSTORM else "◉ LIVE"
         
-        self._draw_box(ax, 0, aw, self.height - 1, title)
+        # Bandwidth mode: the lightning flash lights the border only
+        border_colour = Theme.FROST
+        if not self.flash_fill:
+            if self.flash_intensity > 0.7:
+                border_colour = Screen.COLOUR_WHITE
+            elif self.flash_intensity > 0.3 or self.lightning_active:
+                border_colour = Theme.SUN
+        
+        self._draw_box(ax, 0, aw, self.height - 1, title, colour=border_colour, target=self.canvas)
         
         # ═══════════════════════════════════════════════════════════════════
-        # PERLIN NOISE CLOUD LAYER
+        # PERLIN NOISE CLOUD LAYER (guarded: full → reduced → skip)
         # ═══════════════════════════════════════════════════════════════════
-        if self.weather.condition in (
-            WeatherCondition.RAIN, WeatherCondition.HEAVY_RAIN,
-            WeatherCondition.THUNDERSTORM, WeatherCondition.SNOW,
-            WeatherCondition.HEAVY_SNOW, WeatherCondition.CLOUDY,
-            WeatherCondition.FOG
-        ):
-            cloud_chars = ["█", "▓", "▒", "░"]
-            for y in range(2, 6):
-                for x in range(ax + 2, ax + aw - 2):
-                    # Use domain warping for more organic cloud shapes
-                    # Domain warp samples create swirling, flowing cloud patterns
-                    base_x = (x - ax) * 0.15 + self.cloud_time
-                    base_y = y * 0.3
-                    
-                    # Add warped displacement for organic feel
-                    warp_offset = self.domain_warp.sample(base_x * 0.5, base_y * 0.5) * 0.5
-                    
-                    noise_val = self.cloud_noise.octave_noise(
-                        base_x + warp_offset,
-                        base_y + warp_offset * 0.3,
-                        octaves=3
-                    )
-                    
-                    # Threshold based on weather intensity
-                    threshold = -0.3 if self.weather.condition in (
-                        WeatherCondition.THUNDERSTORM, WeatherCondition.HEAVY_RAIN
-                    ) else 0.0
-                    
-                    if noise_val > threshold:
-                        char_idx = min(3, max(0, int((noise_val + 0.5) * 3)))
-                        char = cloud_chars[char_idx]
-                        
-                        # Flash colour during lightning
-                        if self.flash_intensity > 0.5:
-                            colour = Screen.COLOUR_WHITE
-                        elif self.lightning_active:
-                            colour = Theme.SUN
-                        else:
-                            colour = Theme.MUTED if self.weather.condition == WeatherCondition.THUNDERSTORM else Screen.COLOUR_WHITE
-                        
-                        self.screen.print_at(char, x, y, colour=colour)
+        if self.sheets or self._old_sheets:
+            self.perf_guard.run('sheets')
+        if self.weather.condition in CLOUD_CONDITIONS:
+            self.perf_guard.run('clouds')
+        if self._fog_visible:
+            self.perf_guard.run('fog')
+        
+        # Special effects (aurora, sandstorm, ...) are guarded per effect
+        if self.special_effects:
+            self.special_effects.render(self.canvas, ax + 1, 2, guard=self.perf_guard)
         
         # ═══════════════════════════════════════════════════════════════════
         # PHYSICS-BASED PARTICLES (with trails)
         # ═══════════════════════════════════════════════════════════════════
-        for p in self.physics_particles:
-            try:
-                px, py = int(p.x), int(p.y)
-                if ax + 1 <= px < ax + aw - 1 and 2 <= py < self.height - 2:
-                    colour = Theme.SUN if self.lightning_active and random.random() > 0.3 else p.colour
-                    self.screen.print_at(p.char, px, py, colour=colour)
-                    
-                    # Draw faint trail for motion blur effect
-                    for i, (tx, ty) in enumerate(p.trail):
-                        if ax + 1 <= tx < ax + aw - 1 and 2 <= ty < self.height - 2:
-                            trail_colour = Screen.COLOUR_BLUE if i == 0 else Screen.COLOUR_BLACK
-                            self.screen.print_at("·", tx, ty, colour=trail_colour)
-            except Exception:
-                pass
-        
-        # Regular particles (for drifting effects)
-        for p in self.particles.particles:
-            try:
-                px, py = int(p.x), int(p.y)
-                if ax + 1 <= px < ax + aw - 1 and 2 <= py < self.height - 2:
-                    colour = Theme.SUN if self.lightning_active and random.random() > 0.3 else p.colour
-                    self.screen.print_at(p.char, px, py, colour=colour)
-            except Exception:
-                pass
+        if PARTICLE_RASTER == "glyph":
+            self._draw_particle_glyphs()
+        else:
+            self._draw_particle_dots(PARTICLE_RASTER)
         
         # ═══════════════════════════════════════════════════════════════════
         # BRANCHING LIGHTNING (Fractal pathfinding)
         # ═══════════════════════════════════════════════════════════════════
         for bolt in self.lightning_bolts:
-            bolt.draw(self.screen, ax)
+            bolt.draw(self.canvas, ax)
         
         # Old lightning fallback
         if self.lightning_active and not self.lightning_bolts:
@@ -1594,46 +2305,308 @@ class WeatherDashboard:
         
         # Easter egg creatures (rare visitors!)
         colour_map = {"FROST": Theme.FROST, "SNOW": Theme.SNOW, "SUN": Theme.SUN, "DANGER": Theme.DANGER, "NATURE": Theme.NATURE, "MAGIC": Theme.MAGIC, "MUTED": Theme.MUTED}
-        self.easter_eggs.draw(self.screen, colour_map, self.lightning_active)
+        self.easter_eggs.draw(self.canvas, colour_map, self.lightning_active)
         
         # ═══════════════════════════════════════════════════════════════════
         # 🌊 GROUND ACCUMULATION (Puddles / Snow drifts)
         # ═══════════════════════════════════════════════════════════════════
-        ground_char = "▓" if self.lightning_active else "▒"
+        ground_char = "▓" if self.lightning_active and self.flash_fill else "▒"
+        snowing = self.weather.condition in (WeatherCondition.SNOW, WeatherCondition.HEAVY_SNOW)
+        levels = self.ground.levels()
+        if not snowing:
+            levels = self.ripples.shade(levels, 4)
+        levels = levels.tolist()
         for i, x in enumerate(range(ax + 1, ax + aw - 1)):
-            self.screen.print_at(ground_char, x, self.height - 2, colour=Theme.MUTED)
+            self.canvas.print_at(ground_char, x, self.height - 2, colour=Theme.MUTED)
             
             # Show accumulation
-            if i < len(self.ground_accumulation):
-                level = int(self.ground_accumulation[i])
+            if i < len(levels):
+                level = levels[i]
                 if level > 0:
-                    if self.weather.condition in (WeatherCondition.SNOW, WeatherCondition.HEAVY_SNOW):
+                    if snowing:
                         # Snow drifts
                         acc_chars = ["·", "░", "▒", "▓", "█"]
                         acc_char = acc_chars[min(level, 4)]
-                        self.screen.print_at(acc_char, x, self.height - 3, colour=Theme.SNOW)
+                        self.canvas.print_at(acc_char, x, self.height - 3, colour=Theme.SNOW)
                     else:
-                        # Rain puddles
+                        # Rain puddles, glyph picked by the rippling surface
                         acc_chars = ["·", "~", "≈", "∿", "≋"]
                         acc_char = acc_chars[min(level, 4)]
-                        self.screen.print_at(acc_char, x, self.height - 3, colour=Theme.FROST)
+                        self.canvas.print_at(acc_char, x, self.height - 3, colour=Theme.FROST)
         
         # Location label in animation area
         loc = f"{self.weather.location}"
-        self.screen.print_at(loc[:aw-4], ax + 3, self.height - 4, colour=Theme.SNOW)
+        self.canvas.print_at(loc[:aw-4], ax + 3, self.height - 4, colour=Theme.SNOW)
+    
+    def _draw_particle_glyphs(self):
+        """
+        Particles as one character each, physics particles with trails.
+        
+        Heads and trail points go through rasterize_cells in one batch:
+        floored to cells, culled to the pane, and where several share a
+        cell the winner is a head over any trail, the faster (nearer) head
+        over the slower, the newer trail point over the older. Cells with
+        CROWD_COUNT or more heads switch to a heavier glyph.
+        """
+        ax = self.animation_start_x
+        aw = self.animation_width
+        heads = self.physics_particles + self.particles.particles
+        if not heads:
+            return
+        n = len(heads)
+        tx, ty, rank = self.trails.points()
+        dx, dy = self._drifter_positions()
+        speed = np.hypot([p.vx for p in heads], [p.vy for p in heads])
+        winners, xs, ys, density = rasterize_cells(
+            np.concatenate(([p.x for p in self.physics_particles], dx, tx)),
+            np.concatenate(([p.y for p in self.physics_particles], dy, ty)),
+            np.concatenate((1.0 + speed, rank / max(1, self.trails.length))),
+            ax + 1, 2, aw - 2, self.height - 4,
+            weights=np.arange(n + rank.size) < n)
+        is_head = winners < n
+        head = winners[is_head]
+        glyphs = np.full(winners.size, TRAIL_CODE, dtype=np.int32)
+        colours = np.empty(winners.size, dtype=np.int32)
+        glyphs[is_head] = [ord(heads[i].char) for i in head.tolist()]
+        colours[is_head] = [heads[i].colour for i in head.tolist()]
+        # The oldest trail point is the visible one; the rest fade to black
+        colours[~is_head] = np.where(rank[winners[~is_head] - n] == 0,
+                                     Screen.COLOUR_BLUE, Screen.COLOUR_BLACK)
+        crowded = density >= CROWD_COUNT
+        if crowded.any():
+            glyphs[crowded] = heavier_glyphs(glyphs[crowded])
+        if self.lightning_active and self.flash_fill:
+            colours[is_head & (_render.generator.random(winners.size) > 0.3)] = Theme.SUN
+        blit_cells(self.canvas, xs, ys, glyphs, colours)
+    
+    def _draw_particle_dots(self, mode: str):
+        """
+        Particles packed into sub-cell dots (braille or half-blocks).
+        
+        Every particle is one dot, so particles sharing a cell still show
+        separately; the whole set is rasterized in one batch and each cell
+        takes the colour of the last particle in it (drifting particles
+        over precipitation). Trails are left out: at dot resolution the
+        motion reads without them.
+        """
+        ax = self.animation_start_x
+        aw = self.animation_width
+        particles = self.physics_particles + self.particles.particles
+        if not particles:
+            self._particle_dots = 0
+            return
+        left, top = ax + 1, 2
+        dx, dy = self._drifter_positions()
+        xs = np.concatenate(([p.x for p in self.physics_particles], dx)) - left
+        ys = np.concatenate(([p.y for p in self.physics_particles], dy)) - top
+        colours = np.array([p.colour for p in particles], dtype=np.int32)
+        if self.lightning_active and self.flash_fill:
+            colours[_render.generator.random(colours.size) > 0.3] = Theme.SUN
+        cx, cy, codes, colours, self._particle_dots = rasterize_points(
+            xs, ys, aw - 2, self.height - 4, mode, colours)
+        blit_cells(self.canvas, cx + left, cy + top, codes, colours)
+    
+    def _cloud_colour(self) -> int:
+        """Cloud colour for the current lightning state."""
+        if self.flash_fill and self.flash_intensity > 0.5:
+            return Screen.COLOUR_WHITE
+        elif self.flash_fill and self.lightning_active:
+            return Theme.SUN
+        return Theme.MUTED if self.weather.condition == WeatherCondition.THUNDERSTORM else Screen.COLOUR_WHITE
+    
+    def _cloud_threshold(self) -> float:
+        """Density above which a cell draws as cloud (lower in heavy weather)."""
+        return -0.3 if self.weather.condition in (
+            WeatherCondition.THUNDERSTORM, WeatherCondition.HEAVY_RAIN
+        ) else 0.0
+    
+    def _feed_clouds(self, frames: int = 1, seed: bool = False):
+        """
+        Relax the wind field's cloud density towards the noise pattern.
+        
+        The target is domain-warped noise sampled once per wind-field cell
+        over the cloud band (rows 2-5; clear below), slowly evolving. Scalar
+        warped noise is slow, so after the first full fill the target is
+        refreshed a few cells per frame, round-robin over about
+        CLOUD_TARGET_FRAMES frames. The field carries the clouds; the weak
+        pull just keeps cover steady. frames is the number of frames this
+        feed covers (the LOD scheduler runs it every other frame). seed=True
+        starts the density at the target so clouds are there from the first
+        frame.
+        """
+        field = self.wind_field
+        if self._cloud_target is None or self._cloud_target.shape != field.shape:
+            xs, ys = field.centres()
+            band = ys[:, 0] < 6 + field.cy  # Cells reaching into rows 2-5
+            self._cloud_cells = [
+                (row, col, x, ys[row, 0])
+                for row in np.flatnonzero(band).tolist()
+                for col, x in enumerate(xs[row].tolist())
+            ]
+            self._cloud_cursor = 0
+            self._cloud_target = np.full(field.shape, -1.0)
+            chunk = self._cloud_cells
+        else:
+            per_frame = -(-len(self._cloud_cells) // CLOUD_TARGET_FRAMES) * frames
+            start = self._cloud_cursor
+            chunk = self._cloud_cells[start:start + per_frame]
+            self._cloud_cursor = (start + per_frame) % len(self._cloud_cells)
+        for row, col, x, y in chunk:
+            base_x, base_y = x * 0.15, y * 0.3 + self.cloud_time
+            warp_offset = self.domain_warp.sample(base_x * 0.5, base_y * 0.5) * 0.5
+            self._cloud_target[row, col] = self.cloud_noise.octave_noise(
+                base_x + warp_offset, base_y + warp_offset * 0.3, octaves=3
+            )
+        density = field.density('cloud', -1.0)
+        if seed:
+            density[:] = self._cloud_target
+        else:
+            density += (1.0 - (1.0 - CLOUD_FEED) ** frames) * (self._cloud_target - density)
+    
+    def _feed_fog(self, frames: int = 1):
+        """
+        Relax the wind field's fog density towards a ground-hugging pattern.
+        
+        In fog the target thickens towards the ground and is broken up by a
+        few slow travelling waves (one vectorized pass over the grid); in any
+        other weather it is zero, so fog left over from a transition thins
+        out and lifts rather than vanishing. frames is the number of frames
+        this feed covers.
+        """
+        field = self.wind_field
+        fog = field.density('fog')
+        feed = 1.0 - (1.0 - FOG_FEED) ** frames
+        if self.weather.condition != WeatherCondition.FOG:
+            if not self._fog_visible:
+                return
+            fog -= feed * fog
+            self._fog_visible = bool(fog.max() > 0.05)
+            return
+        xs, ys = field.centres()
+        kx, ky, phase, speed = self._fog_waves.T
+        waves = np.sin(xs[..., None] * kx + ys[..., None] * ky + phase + self.frame * speed).mean(axis=-1)
+        depth = np.clip((ys - FOG_TOP) / max(1.0, self.height * 0.6), 0.0, 1.0)
+        target = np.clip(depth * (0.55 + 0.45 * waves), 0.0, 1.0)
+        fog += feed * (target - fog)
+        self._fog_visible = True
+    
+    def _widen(self, xs: np.ndarray, ys: np.ndarray, glyphs: np.ndarray,
+               step: int, right: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Repeat each sampled cell over step columns, stopping short of right."""
+        if step == 1:
+            return xs, ys, glyphs
+        xs = (xs[:, None] + np.arange(step)).ravel()
+        ys, glyphs = np.repeat(ys, step), np.repeat(glyphs, step)
+        inside = xs < right
+        return xs[inside], ys[inside], glyphs[inside]
+    
+    def _sheet_layers(self) -> List[Tuple[RainSheet, int, float]]:
+        """(sheet, colour, density) to draw, far to near; old sheets thin out over a transition."""
+        layers = [(sheet, colour, self.sheet_density) for sheet, colour in self.sheets]
+        if self._old_sheets and hasattr(self, '_transition_frames'):
+            fade = 1.0 - self._transition_frames / self._transition_total
+            layers = [(sheet, colour, self._old_sheet_density * fade)
+                      for sheet, colour in self._old_sheets] + layers
+        return layers
+    
+    def _sheet_area(self) -> Tuple[int, int]:
+        """Width and height of the rain-sheet area (cloud base down to the ground)."""
+        return max(0, self.animation_width - 2), max(0, self.height - 3 - SHEET_TOP)
+    
+    def _draw_sheet_layers(self, layers: List[Tuple[RainSheet, int, float]]):
+        """Scroll-sampled sheet drops, leaning with the wind, one blit per layer."""
+        width, height = self._sheet_area()
+        left = self.animation_start_x + 1
+        for sheet, colour, density in layers:
+            xs, ys, codes = sheet.cells(width, height, density, self._sheet_skew)
+            blit_cells(self.canvas, xs + left, ys + SHEET_TOP, codes, colour)
+    
+    def _draw_sheets(self):
+        """Full-quality rain sheets: every layer."""
+        self._draw_sheet_layers(self._sheet_layers())
+    
+    def _draw_sheets_reduced(self):
+        """Reduced rain sheets: the nearest layer only."""
+        self._draw_sheet_layers(self._sheet_layers()[-1:])
+    
+    def _draw_fog_cells(self, step: int):
+        """Fog from the advected density, ordered-dithered to ░▒▓."""
+        ax = self.animation_start_x
+        aw = self.animation_width
+        cols = np.arange(ax + 1, ax + aw - 1, step)
+        rows = np.arange(FOG_TOP, self.height - 3)
+        xs = np.tile(cols, rows.size)
+        ys = np.repeat(rows, cols.size)
+        density = self.wind_field.sample_density('fog', xs - ax + step / 2, ys + 0.5)
+        levels = FOG_RAMP.quantise(density, xs, ys)
+        keep = levels > 0
+        xs, ys, glyphs = self._widen(xs[keep], ys[keep], FOG_RAMP.glyphs(levels[keep]),
+                                     step, ax + aw - 1)
+        blit_cells(self.canvas, xs, ys, glyphs, Theme.MUTED)
+    
+    def _fog_cells(self) -> int:
+        """Size of the fog area, in cells."""
+        return max(0, self.animation_width - 2) * max(0, self.height - 3 - FOG_TOP)
+    
+    def _draw_fog(self):
+        """Full-quality fog: every cell sampled and dithered."""
+        self._draw_fog_cells(1)
+    
+    def _draw_fog_reduced(self):
+        """Reduced fog: half horizontal resolution."""
+        self._draw_fog_cells(2)
+    
+    def _draw_cloud_cells(self, step: int, halves: bool = False):
+        """
+        Cloud band from the advected density, sampled every step columns.
+        
+        With halves the density is sampled at the top and bottom of each
+        cell: cells covered in both halves take the shaded ramp, cells
+        covered in one take ▀ or ▄, doubling the vertical resolution of
+        the cloud edges.
+        """
+        ax = self.animation_start_x
+        aw = self.animation_width
+        cols = np.arange(ax + 2, ax + aw - 2, step)
+        xs = np.tile(cols, 4)
+        ys = np.repeat(np.arange(2, 6), cols.size)
+        field, fx = self.wind_field, xs - ax + step / 2
+        threshold = self._cloud_threshold()
+        if halves:
+            upper = field.sample_density('cloud', fx, ys + 0.25)
+            lower = field.sample_density('cloud', fx, ys + 0.75)
+            density = (upper + lower) * 0.5
+            top, bottom = upper > threshold, lower > threshold
+            keep = top | bottom
+            glyphs = np.where(top & bottom, CLOUD_CODES[np.clip(((density + 0.5) * 3).astype(np.int32), 0, 3)],
+                              half_block_codes(top, bottom))[keep]
+        else:
+            density = field.sample_density('cloud', fx, ys + 0.5)
+            keep = density > threshold
+            glyphs = CLOUD_CODES[np.clip(((density[keep] + 0.5) * 3).astype(np.int32), 0, 3)]
+        xs, ys, glyphs = self._widen(xs[keep], ys[keep], glyphs, step, ax + aw - 2)
+        blit_cells(self.canvas, xs, ys, glyphs, self._cloud_colour())
+    
+    def _draw_clouds(self):
+        """Full-quality cloud layer: advected density, bilinear per half cell."""
+        self._draw_cloud_cells(1, halves=True)
+    
+    def _draw_clouds_reduced(self):
+        """Reduced cloud layer: half horizontal resolution."""
+        self._draw_cloud_cells(2)
     
     def _draw_lightning(self):
         """Draw lightning bolt."""
         ax = self.animation_start_x
         aw = self.animation_width
         
-        x = random.randint(ax + aw // 4, ax + 3 * aw // 4)
+        x = _render.randint(ax + aw // 4, ax + 3 * aw // 4)
         y = 5
         
         while y < self.height - 5:
-            self.screen.print_at(random.choice(["#", "|", "/"]), x, y, colour=Theme.SUN)
+            self.canvas.print_at(_render.choice(["#", "|", "/"]), x, y, colour=Theme.SUN)
             y += 1
-            x += random.choice([-1, 0, 0, 1])
+            x += _render.choice([-1, 0, 0, 1])
             x = max(ax + 3, min(ax + aw - 4, x))
     
     def _draw_achievement_popup(self):
@@ -1648,17 +2621,20 @@ class WeatherDashboard:
         px = (self.width - popup_w) // 2
         py = (self.height - popup_h) // 2
         
-        # Background
-        for row in range(popup_h):
-            self.screen.print_at(" " * popup_w, px, py + row, bg=Theme.MAGIC)
-        
-        # Border
-        self._draw_box(px, py, popup_w, popup_h, "ACHIEVEMENT UNLOCKED!", colour=Theme.SUN)
-        
-        # Content
         text = f"{icon}  {name}"
         tx = px + (popup_w - len(text)) // 2
-        self.screen.print_at(text, tx, py + 2, colour=Theme.SNOW, bg=Theme.MAGIC)
+        
+        for target in self._overlay_targets():
+            # Background
+            for row in range(popup_h):
+                target.print_at(" " * popup_w, px, py + row, bg=Theme.MAGIC)
+            
+            # Border
+            self._draw_box(px, py, popup_w, popup_h, "ACHIEVEMENT UNLOCKED!", colour=Theme.SUN,
+                           target=target)
+            
+            # Content
+            target.print_at(text, tx, py + 2, colour=Theme.SNOW, bg=Theme.MAGIC)
     
     def _draw_footer(self):
         """Draw footer bar."""
@@ -1681,8 +2657,18 @@ class WeatherDashboard:
 # MAIN
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def dashboard_main(screen: Screen):
-    """Main dashboard loop."""
+def dashboard_main(screen: Screen, resumed: Optional['WeatherDashboard'] = None):
+    """
+    Main dashboard loop.
+    
+    After a terminal resize main() reopens the screen and passes the
+    running dashboard back in as `resumed`: it is laid out again for the
+    new size and the loop carries on, with no loading screen or refetch.
+    """
+    if resumed is not None:
+        resumed.relayout(screen)
+        _run_metered(screen, resumed.weather, resumed)
+        return
     
     # Loading screen with personality
     screen.clear()
@@ -1720,11 +2706,36 @@ def dashboard_main(screen: Screen):
             return
         return dashboard_main(screen)
     
-    dashboard = WeatherDashboard(screen, weather)
-    last_fetch = time.time()
+    _run_metered(screen, weather)
+
+
+def _run_metered(screen: Screen, weather: WeatherData,
+                 dashboard: Optional['WeatherDashboard'] = None):
+    """Run the dashboard loop with stdout metered for bytes/frame stats."""
+    # Count what asciimatics writes so both output paths report bytes/frame
+    meter = ByteCounter(sys.stdout)
+    sys.stdout = meter
+    try:
+        _dashboard_loop(screen, weather, meter, dashboard)
+    finally:
+        sys.stdout = meter._stream
+
+
+def _dashboard_loop(screen: Screen, weather: WeatherData, meter: ByteCounter,
+                    dashboard: Optional['WeatherDashboard'] = None):
+    """Run the dashboard until the user quits."""
+    if dashboard is None:
+        dashboard = WeatherDashboard(screen, weather)
+    dashboard.output_meter = meter
     
     while True:
+        if screen.has_resized():
+            # Hand the live dashboard back to main() for a relayout
+            raise ResizeScreenError("Terminal resized", dashboard)
+        
         ev = screen.get_key()
+        if ev is not None:
+            dashboard.scheduler.wake()
         
         # Use enhanced input handler if available
         result = dashboard.handle_input(ev)
@@ -1736,7 +2747,7 @@ def dashboard_main(screen: Screen):
             if new_weather:
                 weather = new_weather
                 dashboard.transition_to(weather)
-                last_fetch = time.time()
+                dashboard.last_fetch = time.time()
                 if dashboard.notifications:
                     dashboard.notifications.add_success("Weather refreshed!")
         elif result == 'search':
@@ -1744,12 +2755,14 @@ def dashboard_main(screen: Screen):
             if new_weather:
                 weather = new_weather
                 dashboard = WeatherDashboard(screen, weather)
-                last_fetch = time.time()
+                dashboard.output_meter = meter
         elif result == 'achievements':
             draw_achievements_screen(screen, dashboard.stormy, Theme)
+            dashboard.invalidate_output()
             dashboard.draw()
         elif result == 'bestiary':
             draw_bestiary_screen(screen, dashboard.stormy, Theme)
+            dashboard.invalidate_output()
             dashboard.draw()
         
         # F key now handled in handle_input for forecast toggle
@@ -1760,15 +2773,18 @@ def dashboard_main(screen: Screen):
                 weather_live(screen)
             except Exception:
                 pass
+            last_fetch = dashboard.last_fetch
             dashboard = WeatherDashboard(screen, weather)
+            dashboard.output_meter = meter
+            dashboard.last_fetch = last_fetch
         
         # Auto-refresh every 5 minutes
-        if time.time() - last_fetch > 300:
+        if time.time() - dashboard.last_fetch > 300:
             new_weather = get_weather(use_cache=False)
             if new_weather:
                 weather = new_weather
                 dashboard.transition_to(weather)
-                last_fetch = time.time()
+                dashboard.last_fetch = time.time()
         
         dashboard.update()
         dashboard.draw()
@@ -1778,12 +2794,33 @@ def dashboard_main(screen: Screen):
             dashboard._draw_help_overlay()
         
         screen.refresh()
+        dashboard.present()
         
-        time.sleep(0.033)
+        # Block until a key arrives or the next tick is due (no busy polling)
+        screen.wait_for_input(dashboard.frame_delay())
+
+
+def _parse_bandwidth(value: str) -> int:
+    """Parse a bytes/second figure with an optional k/m suffix."""
+    import argparse
+    text = value.strip().lower().rstrip("b")
+    scale = 1
+    if text.endswith("k"):
+        scale, text = 1024, text[:-1]
+    elif text.endswith("m"):
+        scale, text = 1024 * 1024, text[:-1]
+    try:
+        rate = int(float(text) * scale)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a byte rate: {value!r}")
+    if rate <= 0:
+        raise argparse.ArgumentTypeError("bandwidth must be positive")
+    return rate
 
 
 def main():
-    global DEMO_MODE, DEMO_SCENARIO
+    global DEMO_MODE, DEMO_SCENARIO, OUTPUT_BACKEND, MAX_BANDWIDTH, LIGHTNING_MODEL, QUALITY
+    global PARTICLE_RASTER
     
     import argparse
     parser = argparse.ArgumentParser(
@@ -1801,10 +2838,57 @@ def main():
         choices=["clear", "rain", "thunderstorm", "snow", "fog", "cloudy", "drizzle"],
         help="Demo scenario to display (requires --demo)"
     )
+    parser.add_argument(
+        "--output",
+        choices=["asciimatics", "ansi"],
+        default="asciimatics",
+        help="Animation pane output: asciimatics print_at (default) or direct ANSI writes"
+    )
+    parser.add_argument(
+        "--max-bandwidth",
+        type=_parse_bandwidth,
+        metavar="BYTES",
+        help="Cap terminal output in bytes/second for slow SSH or serial links "
+             "(e.g. 9600, 32k); uses the ANSI pane writer"
+    )
+    parser.add_argument(
+        "--lightning",
+        choices=["fractal", "dbm"],
+        default="fractal",
+        help="Lightning generator: fractal random walk (default) or dielectric "
+             "breakdown model (grown through an electric field, pre-generated in the background)"
+    )
+    parser.add_argument(
+        "--quality",
+        choices=["low", "medium", "high"],
+        default="medium",
+        help="Simulation detail: wind-field grid resolution, solver iterations and trail length"
+    )
+    parser.add_argument(
+        "--raster",
+        choices=["glyph", "braille", "halfblock"],
+        default="glyph",
+        help="Particle drawing: one glyph per particle (default), or sub-cell dots "
+             "packed into braille (2x4 per cell) or half-blocks (1x2 per cell)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        metavar="N",
+        help="Seed every random stream, so a run (e.g. a benchmark) can be replayed exactly"
+    )
     args = parser.parse_args()
     
     DEMO_MODE = args.demo
     DEMO_SCENARIO = args.scenario
+    OUTPUT_BACKEND = args.output
+    MAX_BANDWIDTH = args.max_bandwidth
+    LIGHTNING_MODEL = args.lightning
+    QUALITY = args.quality
+    PARTICLE_RASTER = args.raster
+    if args.seed is not None:
+        reseed(args.seed)
+        random.seed(args.seed)  # Demo weather still draws from the global RNG
     
     print("[2J[H")
     if DEMO_MODE:
@@ -1814,12 +2898,13 @@ def main():
         print("STORMY - Weather Oracle of the Terminal")
         print("   The sky has wisdom to share...")
     
+    resumed = None
     while True:
         try:
-            Screen.wrapper(dashboard_main)
+            Screen.wrapper(dashboard_main, arguments=[resumed])
             break
-        except ResizeScreenError:
-            pass
+        except ResizeScreenError as e:
+            resumed = e.scene
     
     print("\nStormy speaks: \"The path continues. The weather changes. You remain. Until next time.\"\n")
 if __name__ == "__main__":